@@ -0,0 +1,18 @@
+import pytest
+
+from trading_bot.trainer.backtest import Backtest
+
+
+# ---------------------------------------------------------------------------
+# Le replay synchrone donne le même journal que le backtest asynchrone
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_replay_matches_backtest(regime_csv, rsi_cross_params):
+    params = rsi_cross_params(regime_csv, atr_filter=True)
+
+    backtest_stats, backtest_trades = await Backtest("rsi_cross_bot").execute(params)
+    replay_stats, replay_trades = await Backtest("rsi_cross_bot").execute(params, replay=True)
+
+    assert len(backtest_trades) > 5
+    assert replay_trades.equals(backtest_trades)
+    assert replay_stats == backtest_stats
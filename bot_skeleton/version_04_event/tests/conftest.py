@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.core.candle_columns import CandleColumns
+
+
+def _random_walk(count: int = 500, seed: int = 0, start: float = 100.0, sigma: float = 0.5,
+                 spread: float = 0.5, interval: int = 300, start_ts: int = 0,
+                 decimals: int | None = None) -> CandleColumns:
+    """
+    Marche aléatoire reproductible : close = start + Σ N(0, sigma), open = close précédent,
+    high / low = corps de la bougie ± U(0, spread), volume U(1, 10).
+    decimals : prix arrondis (beaucoup d'égalités entre bougies).
+    interval en secondes, start_ts en epoch ms.
+    """
+    rng = np.random.default_rng(seed)
+    close = start + np.cumsum(rng.normal(0, sigma, count))
+    open_ = np.r_[close[:1], close[:-1]]
+    high = np.maximum(open_, close) + rng.uniform(0, spread, count)
+    low = np.minimum(open_, close) - rng.uniform(0, spread, count)
+    if decimals is not None:
+        open_, high, low, close = (np.round(a, decimals) for a in (open_, high, low, close))
+    return CandleColumns(
+        start_ts=start_ts + np.arange(count, dtype=np.int64) * interval * 1000,
+        open=open_, high=high, low=low, close=close,
+        volume=rng.uniform(1, 10, count),
+    )
+
+
+@pytest.fixture
+def random_walk():
+    """Fabrique de bougies aléatoires en colonnes : random_walk(count, seed=..., ...).to_candles(...)."""
+    return _random_walk
+
+
+def _write_regime_csv(path, count: int = 3000, seed: int = 42):
+    """Marche aléatoire avec alternance de régimes de volatilité (phases ATR variées), CSV 5m."""
+    rng = np.random.default_rng(seed)
+    volatility = np.repeat(rng.choice([0.5, 1.0, 3.0], size=count // 100 + 1), 100)[:count]
+    close = 2000 + np.cumsum(rng.normal(0, volatility))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, volatility))
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-09-14", periods=count, freq="5min", tz="UTC"),
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": np.ones(count),
+    })
+    df.to_csv(path, index=False)
+
+
+@pytest.fixture
+def regime_csv(tmp_path):
+    """Historique CSV ethusdc 5m à régimes de volatilité (3000 bougies), écrit dans tmp_path."""
+    path = tmp_path / "ethusdc_5m.csv"
+    _write_regime_csv(path)
+    return path
+
+
+def _rsi_cross_params(path, atr_filter: bool) -> dict:
+    return {
+        "path": str(path),
+        "symbol": "ethusdc",
+        "interval": "5m",
+        "initial_capital": 1000,
+        "trading_system": {
+            "atr_filter": atr_filter,
+            "rsi_fast_period": 5,
+            "rsi_slow_period": 21,
+            "atr_period": 14,
+            "tp_pct": 0.2,
+            "sl_pct": 0.1
+        }
+    }
+
+
+@pytest.fixture
+def rsi_cross_params():
+    """Fabrique de paramètres rsi_cross_bot : rsi_cross_params(csv_path, atr_filter)."""
+    return _rsi_cross_params
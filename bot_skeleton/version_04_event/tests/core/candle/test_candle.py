@@ -0,0 +1,41 @@
+import pytest
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+
+from trading_bot.core.events import Candle
+
+
+def _candle(i):
+    return Candle(
+        index=i,
+        symbol="ETHUSDC",
+        interval=300,
+        open=100.0 + i,
+        high=101.0 + i,
+        low=99.0 + i,
+        close=100.5 + i,
+        volume=1.0,
+        start_ts=1_757_808_000_000 + i * 300_000
+    )
+
+
+# ---------------------------------------------------------------------------
+# Candle : slotted, figée, datetime à la demande
+# ---------------------------------------------------------------------------
+def test_candle_is_slotted_and_frozen():
+    c = _candle(0)
+
+    assert "__slots__" in Candle.__dict__
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        c.close = 1.0
+
+
+def test_candle_lazy_datetimes():
+    c = _candle(0)
+
+    assert c.start_time == datetime(2025, 9, 14, tzinfo=timezone.utc)
+    assert (c.end_time - c.start_time).total_seconds() == 300
+    assert c.end_ts == c.start_ts + 300_000
+    assert _candle(1).is_next_of(c)
+    assert c.is_previous_of(_candle(1))
@@ -0,0 +1,91 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.events import CandleHistoryReady
+
+
+def _columns(count=10):
+    return CandleColumns(
+        start_ts=np.arange(count, dtype=np.int64) * 300_000,
+        open=np.full(count, 100.0),
+        high=np.arange(count) + 101.0,
+        low=np.arange(count) + 99.0,
+        close=np.arange(count) + 100.0,
+        volume=np.ones(count),
+    )
+
+
+def _event(**kwargs):
+    return CandleHistoryReady(symbol="ETHUSDC", timestamp=datetime.now(), period="5m", **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# 1) Historique colonnaire : colonnes sans copie, bougies matérialisées à la demande
+# ---------------------------------------------------------------------------
+def test_columns_are_views_and_candles_lazy():
+    columns = _columns()
+    event = _event(columns=columns)
+
+    assert len(event) == 10
+    assert event._candles is None
+
+    close = event.column("close", last=3)
+    assert np.shares_memory(close, columns.close)
+    np.testing.assert_array_equal(close, [107.0, 108.0, 109.0])
+    assert event._candles is None
+
+    candles = event.candles
+    assert [c.index for c in candles] == list(range(10))
+    assert candles[4].close == 104.0 and candles[4].end_ts == 5 * 300_000
+    assert event.candles is candles
+
+
+# ---------------------------------------------------------------------------
+# 2) tail() / last_candle : indices identiques à l'historique complet
+# ---------------------------------------------------------------------------
+def test_tail_keeps_history_indices():
+    event = _event(columns=_columns())
+
+    tail = event.tail(3)
+    assert [c.index for c in tail] == [7, 8, 9]
+    assert [c.close for c in tail] == [107.0, 108.0, 109.0]
+    assert event.last_candle.index == 9
+    assert event._candles is None
+
+    assert len(event.tail(50)) == 10
+    assert _event(columns=_columns(0)).last_candle is None
+
+
+# ---------------------------------------------------------------------------
+# 3) Historique en bougies : mêmes lectures, colonnes construites à la demande
+# ---------------------------------------------------------------------------
+def test_candles_history_same_reads():
+    candles = _columns().to_candles("ETHUSDC", 300)
+    event = _event(candles=candles)
+
+    np.testing.assert_array_equal(event.column("high", last=2), [109.0, 110.0])
+    assert event.column("start_ts").dtype == np.int64
+    assert event.tail(2) == candles[-2:]
+    assert event.last_candle is candles[-1]
+    np.testing.assert_array_equal(event.columns.close, _columns().close)
+
+
+def test_requires_candles_or_columns():
+    with pytest.raises(ValueError):
+        _event()
+
+
+# ---------------------------------------------------------------------------
+# 4) last au-delà de l'historique : toutes les bougies, jamais une fin tronquée
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("columnar", [True, False])
+def test_column_last_beyond_history(columnar):
+    columns = _columns(5)
+    event = _event(columns=columns) if columnar else _event(candles=columns.to_candles("ETHUSDC", 300))
+
+    np.testing.assert_array_equal(event.column("close", last=7), columns.close)
+    np.testing.assert_array_equal(event.column("close", last=12), columns.close)
+    np.testing.assert_array_equal(event.column("close", last=5), columns.close)
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+
+from trading_bot.core.events import Candle
+from trading_bot.core.candle_window import CandleWindow
+
+
+def _candle(i):
+    return Candle(
+        index=i,
+        symbol="ETHUSDC",
+        interval=300,
+        open=100.0 + i,
+        high=101.0 + i,
+        low=99.0 + i,
+        close=100.5 + i,
+        volume=1.0,
+        start_ts=1_757_808_000_000 + i * 300_000
+    )
+
+
+# ---------------------------------------------------------------------------
+# 1) CandleWindow : ordre chronologique avant et après remplissage
+# ---------------------------------------------------------------------------
+def test_window_partial_then_rolling():
+    window = CandleWindow(maxlen=5)
+
+    window.extend(_candle(i) for i in range(3))
+    assert len(window) == 3 and not window.is_full()
+    np.testing.assert_array_equal(window.index, [0, 1, 2])
+
+    window.extend(_candle(i) for i in range(3, 12))
+    assert len(window) == 5 and window.is_full()
+    np.testing.assert_array_equal(window.index, [7, 8, 9, 10, 11])
+    np.testing.assert_array_equal(window.close, [107.5, 108.5, 109.5, 110.5, 111.5])
+    assert window.high.flags["C_CONTIGUOUS"]
+
+
+def test_window_candle_roundtrip():
+    window = CandleWindow(maxlen=4)
+    candles = [_candle(i) for i in range(6)]
+    window.extend(candles)
+
+    assert window[0] == candles[2]
+    assert window[-1] == candles[-1]
+    with pytest.raises(IndexError):
+        window[4]
+
+    window.clear()
+    assert len(window) == 0
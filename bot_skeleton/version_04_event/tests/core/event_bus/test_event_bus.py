@@ -0,0 +1,142 @@
+import pytest
+from dataclasses import dataclass
+
+from trading_bot.core.event_bus import Event, EventBus, Priority
+from trading_bot.core.events import IndicatorUpdated
+
+
+@dataclass
+class Ping(Event):
+    name: str
+    topic: tuple = None
+
+
+def _recorder(calls, label):
+    async def cb(event):
+        calls.append(label)
+    return cb
+
+
+# ---------------------------------------------------------------------------
+# 1) Abonnement par topic (préfixe)
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sequential", [False, True])
+async def test_topic_prefix_dispatch(sequential):
+    bus = EventBus(sequential=sequential)
+    calls = []
+    bus.subscribe(IndicatorUpdated, _recorder(calls, "all"))
+    bus.subscribe(IndicatorUpdated, _recorder(calls, "rsi"), topic="RSI")
+    bus.subscribe(IndicatorUpdated, _recorder(calls, "rsi14"), topic=("RSI", 14))
+
+    await bus.publish(IndicatorUpdated(symbol="ETHUSDC", candle=None, values={"type": "RSI"}, topic=("RSI", 14)))
+    await bus.publish(IndicatorUpdated(symbol="ETHUSDC", candle=None, values={"type": "RSI"}, topic=("RSI", 21)))
+    # topic par défaut : (values["type"],)
+    await bus.publish(IndicatorUpdated(symbol="ETHUSDC", candle=None, values={"type": "Atr"}))
+
+    assert calls == ["all", "rsi", "rsi14", "all", "rsi", "all"]
+
+
+# ---------------------------------------------------------------------------
+# 2) Priorité puis ordre d'abonnement, désabonnement
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_priority_order_and_unsubscribe():
+    bus = EventBus(sequential=True)
+    calls = []
+    first, late = _recorder(calls, "first"), _recorder(calls, "late")
+    bus.subscribe(Ping, first)
+    bus.subscribe(Ping, _recorder(calls, "second"))
+    bus.subscribe(Ping, _recorder(calls, "trader"), priority=Priority.TRADER)
+    bus.subscribe(Ping, _recorder(calls, "filter"), priority=Priority.FILTER)
+
+    await bus.publish(Ping("a"))
+    assert calls == ["trader", "filter", "first", "second"]
+
+    calls.clear()
+    bus.unsubscribe(Ping, first)
+    bus.subscribe(Ping, late)
+    await bus.publish(Ping("b"))
+    assert calls == ["trader", "filter", "second", "late"]
+
+    calls.clear()
+    bus.unsubscribe_all()
+    await bus.publish(Ping("c"))
+    assert calls == []
+
+
+# ---------------------------------------------------------------------------
+# 3) Mode séquentiel : un handler et ses publications se terminent avant le suivant
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_sequential_is_depth_first():
+    bus = EventBus(sequential=True)
+    calls = []
+
+    async def parent(event: Ping):
+        calls.append("parent")
+        if event.name == "root":
+            await bus.publish(Ping("child", topic=("child",)))
+
+    bus.subscribe(Ping, parent)
+    bus.subscribe(Ping, _recorder(calls, "child"), topic=("child",))
+    bus.subscribe(Ping, _recorder(calls, "sibling"), topic=None)
+
+    await bus.publish(Ping("root"))
+
+    assert calls == ["parent", "parent", "child", "sibling", "sibling"]
+
+
+# ---------------------------------------------------------------------------
+# 4) publish_sync : handlers sync et async sans boucle, refus des suspensions
+# ---------------------------------------------------------------------------
+def test_publish_sync_runs_sync_and_async_handlers():
+    bus = EventBus(sequential=True)
+    calls = []
+
+    async def parent(event: Ping):
+        calls.append(f"async:{event.name}")
+        if event.name == "root":
+            await bus.publish(Ping("child"))
+
+    bus.subscribe(Ping, parent)
+    bus.subscribe(Ping, lambda event: calls.append(f"sync:{event.name}"))
+
+    bus.publish_sync(Ping("root"))
+
+    assert calls == ["async:root", "async:child", "sync:child", "sync:root"]
+
+
+def test_publish_sync_rejects_suspending_handler():
+    import asyncio
+
+    async def sleeper(event):
+        await asyncio.sleep(0)
+
+    bus = EventBus(sequential=True)
+    bus.subscribe(Ping, sleeper)
+    with pytest.raises(RuntimeError, match="sleeper s'est suspendu"):
+        bus.publish_sync(Ping("a"))
+
+    with pytest.raises(RuntimeError):
+        EventBus().publish_sync(Ping("a"))
+
+
+def test_publish_sync_prefers_sync_entry():
+    class Handler:
+        def __init__(self):
+            self.calls = []
+
+        async def on_ping(self, event: Ping):
+            self.calls.append("async")
+
+        def on_ping_sync(self, event: Ping):
+            self.calls.append("sync")
+
+    handler = Handler()
+    bus = EventBus(sequential=True)
+    bus.subscribe(Ping, handler.on_ping)
+
+    bus.publish_sync(Ping("a"))
+
+    assert handler.calls == ["sync"]
@@ -0,0 +1,169 @@
+import asyncio
+import time
+
+import pytest
+from dataclasses import dataclass
+
+from trading_bot.core.event_bus import Event, EventBus
+from trading_bot.core.events import Candle, CandleClose, TradeApproved
+from trading_bot.core.metrics import LatencyHistogram
+from trading_bot.trader.trader_only_one_position import TraderOnlyOnePosition
+
+
+@dataclass
+class Ping(Event):
+    name: str
+
+
+def _candle(index, close=100.0, high=101.0, low=99.0):
+    return Candle(
+        index=index, symbol="ETHUSDC", start_ts=1_700_000_000_000 + index * 60_000,
+        open=close, high=high, low=low, close=close, volume=1.0, interval=60
+    )
+
+
+# ---------------------------------------------------------------------------
+# 1) Histogramme : percentiles approchés par bucket
+# ---------------------------------------------------------------------------
+def test_histogram_percentiles():
+    h = LatencyHistogram()
+    for _ in range(99):
+        h.record(0.001)
+    h.record(0.5)
+
+    snap = h.snapshot()
+    assert snap["count"] == 100
+    assert snap["max_ms"] == pytest.approx(500.0)
+    # précision d'un bucket (2 ** 0.25)
+    assert 1.0 <= snap["p50_ms"] <= 1.0 * 2 ** 0.25
+    assert 1.0 <= snap["p99_ms"] <= 1.0 * 2 ** 0.25
+    assert h.percentile(1.0) == pytest.approx(0.5)
+    assert LatencyHistogram().snapshot()["p99_ms"] == 0.0
+
+
+# ---------------------------------------------------------------------------
+# 2) Désactivé par défaut, compteurs par événement et par handler sinon
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sequential", [False, True])
+async def test_publish_metrics(sequential):
+    bus = EventBus(sequential=sequential)
+    calls = []
+
+    async def slow(event):
+        await asyncio.sleep(0.01)
+        calls.append("slow")
+
+    def fast(event):
+        calls.append("fast")
+
+    bus.subscribe(Ping, slow)
+    bus.subscribe(Ping, fast)
+
+    await bus.publish(Ping("a"))
+    assert bus.metrics is None
+
+    metrics = bus.enable_metrics()
+    assert bus.enable_metrics() is metrics
+    await bus.publish(Ping("b"))
+    await bus.publish(Ping("c"))
+
+    snap = metrics.snapshot()
+    assert snap["events"]["Ping"]["count"] == 2
+    assert snap["events"]["Ping"]["max_ms"] >= 10
+    slow_name = next(k for k in snap["callbacks"] if "slow" in k)
+    fast_name = next(k for k in snap["callbacks"] if "fast" in k)
+    assert snap["callbacks"][slow_name]["count"] == 2
+    assert snap["callbacks"][slow_name]["max_ms"] >= 10
+    assert snap["callbacks"][fast_name]["count"] == 2
+    assert len(calls) == 6
+
+    bus.disable_metrics()
+    assert bus.metrics is None
+
+
+# ---------------------------------------------------------------------------
+# 2 bis) Mode gather : durée de chaque handler depuis son propre lancement,
+#        une série par instance pour une même méthode
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_gather_callback_duration_excludes_previous_handlers():
+    bus = EventBus(sequential=False)
+
+    async def blocking(event):
+        time.sleep(0.02)   # partie synchrone, exécutée avant le handler suivant
+
+    async def quick(event):
+        pass
+
+    bus.subscribe(Ping, blocking)
+    bus.subscribe(Ping, quick)
+    metrics = bus.enable_metrics()
+    await bus.publish(Ping("a"))
+
+    snap = metrics.snapshot()["callbacks"]
+    quick_name = next(k for k in snap if "quick" in k)
+    blocking_name = next(k for k in snap if "blocking" in k)
+    assert snap[blocking_name]["max_ms"] >= 20
+    assert snap[quick_name]["max_ms"] < 10
+
+
+class _Handler:
+    def __init__(self, bus):
+        bus.subscribe(Ping, self.on_ping)
+
+    async def on_ping(self, event):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_callback_series_per_instance():
+    bus = EventBus(sequential=True)
+    _Handler(bus), _Handler(bus)
+    metrics = bus.enable_metrics()
+    await bus.publish(Ping("a"))
+    await bus.publish(Ping("b"))
+
+    snap = metrics.snapshot()["callbacks"]
+    assert sorted(snap) == ["Ping:_Handler.on_ping#1", "Ping:_Handler.on_ping#2"]
+    assert all(v["count"] == 2 for v in snap.values())
+
+
+# ---------------------------------------------------------------------------
+# 3) Latence réception bougie -> action du trader
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_candle_to_trader_latency():
+    bus = EventBus()
+    metrics = bus.enable_metrics()
+    TraderOnlyOnePosition(bus)
+
+    signal_candle = _candle(0)
+    metrics.candle_received(signal_candle)
+    await bus.publish(TradeApproved(side="BUY", size=1.0, tp=110.0, sl=90.0, candle=signal_candle))
+
+    # Bougie N+1 : entrée en position
+    next_candle = _candle(1)
+    metrics.candle_received(next_candle)
+    await bus.publish(CandleClose(symbol="ETHUSDC", candle=next_candle))
+    metrics.candle_done(next_candle)
+
+    latency = metrics.snapshot()["latency"]
+    assert latency["candle_to_trader"]["count"] == 2
+    assert latency["candle_to_done"]["count"] == 1
+
+    # Bougie sans action du trader : aucune mesure
+    idle_candle = _candle(2)
+    metrics.candle_received(idle_candle)
+    await bus.publish(CandleClose(symbol="ETHUSDC", candle=idle_candle))
+    assert metrics.snapshot()["latency"]["candle_to_trader"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_monitor():
+    metrics = EventBus().enable_metrics()
+    task = asyncio.create_task(metrics.monitor_event_loop(interval=0.005))
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    assert metrics.snapshot()["latency"]["event_loop_lag"]["count"] >= 1
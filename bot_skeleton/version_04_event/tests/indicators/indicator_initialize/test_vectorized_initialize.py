@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleHistoryReady
+from trading_bot.indicators.atr.atr import Atr
+from trading_bot.indicators.atr.atr_calculator import ATRCalculator
+from trading_bot.indicators.moving_average.moving_average_calculator import IndicatorMovingAverageCalculator
+from trading_bot.indicators.rsi.rsi_calculator import IndicatorRSICalculator
+
+
+def _reference_atr(candles, period, multiplier):
+    """Initialisation d'origine : True Range et lissage bougie par bougie."""
+    candles = candles[-period * multiplier:]
+    tr, previous_close = [], None
+    for c in candles:
+        tr.append(c.high - c.low if previous_close is None
+                  else max(c.high - c.low, abs(c.high - previous_close), abs(c.low - previous_close)))
+        previous_close = c.close
+    atr = float(np.mean(tr[:period]))
+    for value in tr[period:]:
+        atr = (atr * (period - 1) + value) / period
+    return atr, tr[-period:]
+
+
+# ---------------------------------------------------------------------------
+# Listes et tableaux NumPy donnent exactement le même état
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("period", [2, 14, 50])
+def test_rsi_initialize_array(random_walk, period):
+    closes = random_walk().close.tolist()
+
+    from_list = IndicatorRSICalculator(period)
+    from_array = IndicatorRSICalculator(period)
+
+    assert from_list.initialize(closes) == from_array.initialize(np.array(closes))
+    deltas = [closes[i] - closes[i - 1] for i in range(-period, 0)]
+    assert from_array.avg_gain == float(np.mean([max(d, 0.0) for d in deltas]))
+    assert from_array.avg_loss == float(np.mean([max(-d, 0.0) for d in deltas]))
+    assert from_array.update(closes[-1] + 1) == from_list.update(closes[-1] + 1)
+
+
+@pytest.mark.parametrize("mode", ["SMA", "EMA"])
+def test_moving_average_initialize_array(random_walk, mode):
+    closes = random_walk().close.tolist()
+
+    from_list = IndicatorMovingAverageCalculator(20, mode)
+    from_array = IndicatorMovingAverageCalculator(20, mode)
+
+    assert from_list.initialize(closes) == from_array.initialize(np.array(closes))
+    assert list(from_array.values) == closes[-20:]
+    assert from_array.update(101.0) == from_list.update(101.0)
+
+
+@pytest.mark.parametrize("period, multiplier", [(14, 3), (5, 1), (30, 3)])
+def test_atr_initialize_matches_reference(random_walk, period, multiplier):
+    columns = random_walk()
+    candles = columns.to_candles("ETHUSDC", 300)
+
+    calculator = ATRCalculator(period=period, history_multiplier=multiplier)
+    from_arrays = ATRCalculator(period=period, history_multiplier=multiplier)
+
+    atr, tr = _reference_atr(candles, period, multiplier)
+    assert calculator.initialize(candles) == atr
+    assert from_arrays.initialize_arrays(columns.high, columns.low, columns.close) == atr
+    assert list(from_arrays.tr_values) == tr
+    assert list(from_arrays.atr_values) == list(calculator.atr_values)
+    assert from_arrays.update(candles[-1]) == calculator.update(candles[-1])
+
+
+def test_not_enough_history():
+    assert IndicatorRSICalculator(14).initialize(np.arange(14.0)) is None
+    assert IndicatorMovingAverageCalculator(20).initialize(np.arange(19.0)) is None
+    assert ATRCalculator(14).initialize_arrays(np.ones(13), np.ones(13), np.ones(13)) is None
+
+
+# ---------------------------------------------------------------------------
+# Wrapper ATR : historique plus court que history_multiplier × period
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [14, 25, 41])
+@pytest.mark.parametrize("columnar", [True, False])
+async def test_atr_wrapper_short_history(random_walk, count, columnar):
+    columns = random_walk(count)
+    candles = columns.to_candles("ETHUSDC", 300)
+    history = {"columns": columns} if columnar else {"candles": candles}
+
+    atr = Atr(EventBus(sequential=True), period=14)
+    await atr.on_history_ready(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", **history))
+
+    reference = ATRCalculator(period=14, history_multiplier=3)
+    assert atr.calculator.current_atr == reference.initialize(candles)
+    assert list(atr.calculator.atr_values) == list(reference.atr_values)
+    assert atr.calculator.market_phase() == reference.market_phase()
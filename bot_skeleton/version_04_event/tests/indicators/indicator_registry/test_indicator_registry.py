@@ -0,0 +1,177 @@
+from datetime import datetime
+
+import pytest
+
+from trading_bot.bots.bot import Bot
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.indicators.atr.atr import Atr
+from trading_bot.indicators.indicator_registry import IndicatorRegistry
+from trading_bot.indicators.moving_average.moving_average import MovingAverage
+from trading_bot.indicators.rsi.rsi import RSI
+
+
+async def _feed(event_bus, candles, warmup):
+    await event_bus.publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", candles=candles[:warmup]))
+    for candle in candles[warmup:]:
+        await event_bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+
+# ---------------------------------------------------------------------------
+# 1) Même classe / paramètres (défauts compris) / symbole / intervalle -> une seule instance
+# ---------------------------------------------------------------------------
+def test_acquire_deduplicates():
+    event_bus = EventBus()
+    registry = IndicatorRegistry()
+
+    rsi = registry.acquire(event_bus, "ethusdc", "5m", RSI, period=14)
+    assert registry.acquire(event_bus, "ETHUSDC", "5m", RSI, period=14, oversold=30.0) is rsi
+    assert registry.acquire(event_bus, "ethusdc", "5m", RSI, period=21) is not rsi
+    assert registry.acquire(event_bus, "ethusdc", "1m", RSI, period=14) is not rsi
+    assert registry.acquire(event_bus, "btcusdc", "5m", RSI, period=14) is not rsi
+    assert registry.acquire(event_bus, "ethusdc", "5m", MovingAverage, period=14) is not rsi
+
+    assert len(registry) == 5
+    assert registry.refcount(rsi) == 2
+
+
+# ---------------------------------------------------------------------------
+# 2) Sortie partagée : un seul IndicatorUpdated par bougie pour tous les consommateurs du bus
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_shared_output_published_once(random_walk):
+    event_bus = EventBus(sequential=True)
+    registry = IndicatorRegistry()
+    for _ in range(3):  # trois stratégies demandent le même RSI et le même ATR
+        registry.acquire(event_bus, "ethusdc", "5m", RSI, period=5)
+        registry.acquire(event_bus, "ethusdc", "5m", Atr, period=5)
+
+    updates = []
+    event_bus.subscribe(IndicatorUpdated, updates.append)
+
+    await _feed(event_bus, random_walk(30).to_candles("ETHUSDC", 300), warmup=20)
+
+    assert len(updates) == 2 * 11
+    assert sorted({u.topic for u in updates}) == [("Atr", 5), ("RSI", 5)]
+
+
+# ---------------------------------------------------------------------------
+# 3) Deux bus sur le même flux : une bougie calculée une fois, publiée sur chaque bus
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_shared_across_buses_computes_once(random_walk):
+    registry = IndicatorRegistry()
+    buses = [EventBus(sequential=True), EventBus(sequential=True)]
+    rsi = registry.acquire(buses[0], "ethusdc", "5m", RSI, period=5)
+    assert registry.acquire(buses[1], "ethusdc", "5m", RSI, period=5) is rsi
+    assert registry.refcount(rsi) == 2
+
+    updates = [[], []]
+    for event_bus, received in zip(buses, updates):
+        event_bus.subscribe(IndicatorUpdated, received.append, topic=("RSI", 5))
+
+    calls = []
+    update = rsi.calculator.update
+    rsi.calculator.update = lambda close: calls.append(close) or update(close)
+
+    # Temps réel : chaque bot reçoit la même bougie sur son bus
+    candles = random_walk(30).to_candles("ETHUSDC", 300)
+    await buses[0].publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", candles=candles[:20]))
+    await buses[1].publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", candles=candles[:20]))
+    for candle in candles[20:]:
+        for event_bus in buses:
+            await event_bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+    assert len(calls) == 10
+    assert len(updates[0]) == len(updates[1]) == 11
+    assert [u.values for u in updates[0]] == [u.values for u in updates[1]]
+
+
+@pytest.mark.asyncio
+async def test_bus_joining_live_feed_reuses_state(random_walk):
+    registry = IndicatorRegistry()
+    running, joining = EventBus(sequential=True), EventBus(sequential=True)
+    rsi = registry.acquire(running, "ethusdc", "5m", RSI, period=5)
+    candles = random_walk(30).to_candles("ETHUSDC", 300)
+    await _feed(running, candles, warmup=20)
+
+    # Le bot qui démarre reçoit un historique terminé à la dernière bougie close
+    registry.acquire(joining, "ethusdc", "5m", RSI, period=5)
+    initialize = rsi.calculator.initialize
+    rsi.calculator.initialize = lambda closes: pytest.fail("RSI réinitialisé")
+    updates = []
+    joining.subscribe(IndicatorUpdated, updates.append)
+    await joining.publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", candles=candles[:30]))
+    rsi.calculator.initialize = initialize
+
+    assert len(updates) == 1
+    assert updates[0].candle is candles[29]
+
+
+# ---------------------------------------------------------------------------
+# 4) Comptage de références : désabonnement au dernier release
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_release_unsubscribes_last_consumer(random_walk):
+    event_bus = EventBus(sequential=True)
+    registry = IndicatorRegistry()
+    ema = registry.acquire(event_bus, "ethusdc", "5m", MovingAverage, period=3, mode="EMA")
+    registry.acquire(event_bus, "ethusdc", "5m", MovingAverage, period=3, mode="EMA")
+
+    updates = []
+    event_bus.subscribe(IndicatorUpdated, updates.append)
+    candles = random_walk(10).to_candles("ETHUSDC", 300)
+    await event_bus.publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", candles=candles[:5]))
+
+    registry.release(event_bus, ema)
+    await event_bus.publish(CandleClose(symbol="ethusdc", candle=candles[5]))
+    assert len(updates) == 2
+
+    registry.release(event_bus, ema)
+    await event_bus.publish(CandleClose(symbol="ethusdc", candle=candles[6]))
+    assert len(updates) == 2
+    assert len(registry) == 0
+    with pytest.raises(KeyError):
+        registry.release(event_bus, ema)
+
+
+def test_unsubscribe_all_releases_bus_indicators():
+    registry = IndicatorRegistry()
+    event_bus, other_bus = EventBus(), EventBus()
+    rsi = registry.acquire(event_bus, "ethusdc", "5m", RSI, period=14)
+    registry.acquire(event_bus, "ethusdc", "5m", RSI, period=14)
+    registry.acquire(other_bus, "ethusdc", "5m", RSI, period=14)
+
+    event_bus.unsubscribe_all()
+    assert registry.refcount(rsi) == 1
+
+    other_bus.unsubscribe_all()
+    assert len(registry) == 0
+    assert registry.acquire(event_bus, "ethusdc", "5m", RSI, period=14) is not rsi
+
+
+# ---------------------------------------------------------------------------
+# 5) Deux bots du même process : une seule instance, deux références
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_two_bots_share_indicators(regime_csv, rsi_cross_params):
+    bots = [Bot("rsi_cross_bot", f"bot_{i}") for i in range(2)]
+    for bot in bots:
+        bot.set_backtest_mode()
+        bot.sync(rsi_cross_params(regime_csv, atr_filter=True))
+        await bot.start()
+
+    registry = IndicatorRegistry.shared()
+    systems = [bot._system_trading for bot in bots]
+    assert systems[0].rsi_fast is systems[1].rsi_fast
+    assert systems[0].atr is systems[1].atr
+    assert registry.refcount(systems[0].rsi_fast) == 2
+
+    # Le second bot réinitialise l'indicateur sur son historique : mêmes trades
+    assert len(systems[0].get_trades_journal()) > 5
+    assert [t["pnl"] for t in systems[0].get_trades_journal()] == [t["pnl"] for t in systems[1].get_trades_journal()]
+
+    rsi = systems[0].rsi_fast
+    for bot in bots:
+        bot.stop()
+    assert registry.refcount(rsi) == 0
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.indicators.bollinger_bands.bollinger_bands_calculator import BollingerBandsCalculator
+from trading_bot.indicators.macd.macd_calculator import MACDCalculator
+from trading_bot.indicators.moving_average.moving_average_calculator import IndicatorMovingAverageCalculator
+from trading_bot.indicators.obv.obv_calculator import OBVCalculator
+from trading_bot.indicators.stochastic.stochastic_calculator import StochasticCalculator
+from trading_bot.indicators.vwap.vwap_calculator import VWAPCalculator
+
+COUNT = 2000
+WARMUP = 300
+
+
+@pytest.fixture
+def df(random_walk):
+    columns = random_walk(COUNT, start=2000.0, sigma=2.0, spread=3.0)
+    return pd.DataFrame({name: getattr(columns, name) for name in CandleColumns.NAMES})
+
+
+def _assert_close(actual, expected):
+    np.testing.assert_allclose(np.asarray(actual, dtype=np.float64), np.asarray(expected, dtype=np.float64),
+                               rtol=1e-9, atol=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# 1) Bollinger : Welford glissant == rolling pandas (écart-type population)
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("period, num_std", [(20, 2.0), (5, 1.5)])
+def test_bollinger_parity(df, period, num_std):
+    middle = df.close.rolling(period).mean()
+    std = df.close.rolling(period).std(ddof=0)
+
+    calculator = BollingerBandsCalculator(period, num_std)
+    calculator.initialize(df.close.to_numpy()[:WARMUP])
+    uppers, lowers, middles = [calculator.upper], [calculator.lower], [calculator.middle]
+    for close in df.close.to_numpy()[WARMUP:]:
+        middles.append(calculator.update(close))
+        uppers.append(calculator.upper)
+        lowers.append(calculator.lower)
+
+    _assert_close(middles, middle[WARMUP - 1:])
+    _assert_close(uppers, (middle + num_std * std)[WARMUP - 1:])
+    _assert_close(lowers, (middle - num_std * std)[WARMUP - 1:])
+
+
+def test_bollinger_update_only_parity(df):
+    df = df.head(200)
+    calculator = BollingerBandsCalculator(20)
+    values = [calculator.update(c) for c in df.close]
+
+    assert values[:19] == [None] * 19
+    _assert_close(values[19:], df.close.rolling(20).mean()[19:])
+    _assert_close(calculator.std, df.close[-20:].std(ddof=0))
+
+
+# ---------------------------------------------------------------------------
+# 2) MACD : ewm(adjust=False) pandas, initialisation puis mises à jour
+# ---------------------------------------------------------------------------
+def test_macd_parity(df):
+    fast = df.close.ewm(span=12, adjust=False).mean()
+    slow = df.close.ewm(span=26, adjust=False).mean()
+    macd = fast - slow
+    signal = macd.ewm(span=9, adjust=False).mean()
+
+    calculator = MACDCalculator()
+    results = [calculator.initialize(df.close.to_numpy()[:WARMUP])]
+    results += [calculator.update(close) for close in df.close.to_numpy()[WARMUP:]]
+
+    _assert_close([r[0] for r in results], macd[WARMUP - 1:])
+    _assert_close([r[1] for r in results], signal[WARMUP - 1:])
+    _assert_close([r[2] for r in results], (macd - signal)[WARMUP - 1:])
+
+
+def test_macd_min_history():
+    calculator = MACDCalculator(3, 6, 4)
+    assert calculator.initialize([1.0] * 8) is None
+    values = [calculator.update(float(i)) for i in range(9)]
+    assert values[:8] == [None] * 8
+    assert values[8] is not None
+
+
+# ---------------------------------------------------------------------------
+# 3) Stochastique : rolling max / min pandas
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("k_period, d_period", [(14, 3), (5, 1)])
+def test_stochastic_parity(df, k_period, d_period):
+    highest = df.high.rolling(k_period).max()
+    lowest = df.low.rolling(k_period).min()
+    k = 100 * (df.close - lowest) / (highest - lowest)
+    d = k.rolling(d_period).mean()
+
+    calculator = StochasticCalculator(k_period, d_period)
+    results = [calculator.initialize(df.high.to_numpy()[:WARMUP], df.low.to_numpy()[:WARMUP],
+                                     df.close.to_numpy()[:WARMUP])]
+    results += [calculator.update(h, l, c) for h, l, c in df[["high", "low", "close"]].to_numpy()[WARMUP:]]
+
+    _assert_close([r[0] for r in results], k[WARMUP - 1:])
+    _assert_close([r[1] for r in results], d[WARMUP - 1:])
+
+
+def test_stochastic_flat_range():
+    calculator = StochasticCalculator(3, 2)
+    assert calculator.initialize(np.full(4, 10.0), np.full(4, 10.0), np.full(4, 10.0)) == (50.0, 50.0)
+    assert calculator.update(10.0, 10.0, 10.0) == (50.0, 50.0)
+
+
+# ---------------------------------------------------------------------------
+# 4) VWAP de session : groupby(session).cumsum pandas
+# ---------------------------------------------------------------------------
+def test_vwap_parity(df):
+    session_ms = 6 * 3600 * 1000
+    session = df.start_ts // session_ms
+    pv = (df.high + df.low + df.close) / 3 * df.volume
+    vwap = pv.groupby(session).cumsum() / df.volume.groupby(session).cumsum()
+
+    calculator = VWAPCalculator(session_seconds=6 * 3600)
+    columns = [df[name].to_numpy()[:WARMUP] for name in ("start_ts", "high", "low", "close", "volume")]
+    values = [calculator.initialize(*columns)]
+    values += [calculator.update(int(ts), h, l, c, v)
+               for ts, h, l, c, v in zip(df.start_ts.tolist(), *(df[n].tolist() for n in ("high", "low", "close", "volume")))][WARMUP:]
+
+    _assert_close(values, vwap[WARMUP - 1:])
+    assert calculator.session_start == int(session.iloc[-1]) * session_ms
+
+
+# ---------------------------------------------------------------------------
+# 5) OBV et volume moyen
+# ---------------------------------------------------------------------------
+def test_obv_parity(df):
+    direction = np.sign(df.close.diff()).fillna(0)
+    obv = (direction * df.volume).cumsum()
+
+    calculator = OBVCalculator()
+    values = [calculator.initialize(df.close.to_numpy()[:WARMUP], df.volume.to_numpy()[:WARMUP])]
+    values += [calculator.update(c, v) for c, v in zip(df.close.to_numpy()[WARMUP:], df.volume.to_numpy()[WARMUP:])]
+
+    _assert_close(values, obv[WARMUP - 1:])
+
+
+def test_average_volume_parity(df):
+    calculator = IndicatorMovingAverageCalculator(14, "SMA")
+    values = [calculator.initialize(df.volume.to_numpy()[:WARMUP])]
+    values += [calculator.update(v) for v in df.volume.to_numpy()[WARMUP:]]
+
+    _assert_close(values, df.volume.rolling(14).mean()[WARMUP - 1:])
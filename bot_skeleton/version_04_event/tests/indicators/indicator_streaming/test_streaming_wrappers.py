@@ -0,0 +1,98 @@
+from datetime import datetime
+
+import pytest
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.indicators.atr.atr import Atr
+from trading_bot.indicators.average_volume.average_volume import AverageVolume
+from trading_bot.indicators.bollinger_bands.bollinger_bands import BollingerBands
+from trading_bot.indicators.indicator_registry import IndicatorRegistry
+from trading_bot.indicators.macd.macd import MACD
+from trading_bot.indicators.moving_average.moving_average import MovingAverage
+from trading_bot.indicators.obv.obv import OBV
+from trading_bot.indicators.rsi.rsi import RSI
+from trading_bot.indicators.stochastic.stochastic import Stochastic
+from trading_bot.indicators.vwap.vwap import VWAP
+
+
+# ---------------------------------------------------------------------------
+# Historique colonnaire puis flux : une publication par bougie et par indicateur,
+# indicateurs partagés via le registre
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_wrappers_publish_on_history_and_stream(random_walk):
+    event_bus = EventBus(sequential=True)
+    indicators = [
+        (BollingerBands, {"period": 20}, ("BollingerBands", 20, 2.0), "bb_middle"),
+        (MACD, {}, ("MACD", 12, 26, 9), "macd_value"),
+        (Stochastic, {"k_period": 14}, ("Stochastic", 14, 3), "stoch_k"),
+        (VWAP, {}, ("VWAP", 86400), "vwap_value"),
+        (OBV, {}, ("OBV",), "obv_value"),
+        (AverageVolume, {"period": 14}, ("AverageVolume", 14), "avg_volume"),
+    ]
+    registry = IndicatorRegistry()
+    for cls, params, _, _ in indicators:
+        instance = registry.acquire(event_bus, "ethusdc", "5m", cls, **params)
+        assert registry.acquire(event_bus, "ethusdc", "5m", cls, **params) is instance
+    assert len(registry) == len(indicators)
+
+    updates = []
+    event_bus.subscribe(IndicatorUpdated, updates.append)
+
+    columns = random_walk(110, start=2000.0, sigma=2.0, spread=3.0)
+    history = columns.slice(0, 100)
+    await event_bus.publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", columns=history))
+    for candle in columns.slice(100).to_candles("ETHUSDC", 300, start_index=100):
+        await event_bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+    assert len(updates) == len(indicators) * 11
+    for _, _, topic, key in indicators:
+        published = [u for u in updates if u.topic == topic]
+        assert len(published) == 11
+        assert [u.candle.index for u in published] == list(range(99, 110))
+        assert all(u.values[key] is not None for u in published)
+
+
+@pytest.mark.asyncio
+async def test_not_enough_history(random_walk):
+    event_bus = EventBus(sequential=True)
+    macd = MACD(event_bus)
+    updates = []
+    event_bus.subscribe(IndicatorUpdated, updates.append)
+
+    await event_bus.publish(CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m",
+                                               columns=random_walk(20)))
+    assert updates == []
+    assert not macd._initialized
+
+
+# ---------------------------------------------------------------------------
+# Entrées synchrones (publish_sync) : mêmes publications que les handlers async
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cls, params", [
+    (RSI, {"period": 14}), (Atr, {"period": 14}), (MovingAverage, {"period": 14, "mode": "EMA"}),
+    (BollingerBands, {"period": 20}), (MACD, {}), (Stochastic, {"k_period": 14}),
+    (VWAP, {}), (OBV, {}), (AverageVolume, {"period": 14}),
+])
+async def test_sync_entries_match_async(random_walk, cls, params):
+    columns = random_walk(110, start=2000.0, sigma=2.0, spread=3.0)
+    history = CandleHistoryReady(symbol="ethusdc", timestamp=datetime.now(), period="5m", columns=columns.slice(0, 100))
+    closes = [CandleClose(symbol="ethusdc", candle=c) for c in columns.slice(100).to_candles("ETHUSDC", 300, start_index=100)]
+
+    published = []
+    for sync in (False, True):
+        event_bus = EventBus(sequential=True)
+        cls(event_bus, **params)
+        updates = []
+        event_bus.subscribe(IndicatorUpdated, updates.append)
+        for event in [history, *closes]:
+            if sync:
+                event_bus.publish_sync(event)
+            else:
+                await event_bus.publish(event)
+        published.append([(u.topic, u.candle.index, u.values) for u in updates])
+
+    assert published[0]
+    assert published[1] == published[0]
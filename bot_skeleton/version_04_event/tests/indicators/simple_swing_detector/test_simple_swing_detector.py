@@ -0,0 +1,70 @@
+import pytest
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.indicators.simple_swing_detector.simple_swing_detector import SimpleSwingDetector
+from trading_bot.indicators.simple_swing_detector.swing_calculator import SwingCalculator
+
+
+def _reference_swings(window, n):
+    """Algorithme d'origine (parcours Python de la fenêtre)."""
+    swing_high = swing_low = None
+    for i in range(n, len(window) - n):
+        c = window[i]
+        around = window[i - n: i + n + 1]
+        if c.high == max(x.high for x in around):
+            if swing_high is None or c.high > swing_high.high:
+                swing_high = c
+        if c.low == min(x.low for x in around):
+            if swing_low is None or c.low < swing_low.low:
+                swing_low = c
+    return swing_high, swing_low
+
+
+# ---------------------------------------------------------------------------
+# Swings identiques à l'algorithme d'origine, en historique puis en temps réel
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("swing_side, swing_window", [(2, 21), (3, 50), (5, 200), (1, 3)])
+async def test_swings_match_reference(random_walk, swing_side, swing_window):
+    # prix arrondis : beaucoup d'égalités entre bougies
+    candles = random_walk(300, interval=60, decimals=0).to_candles("ETHUSDC", 60)
+    bus = EventBus()
+    detector = SimpleSwingDetector(bus, swing_side=swing_side, swing_window=swing_window)
+
+    published = []
+
+    async def on_update(event: IndicatorUpdated):
+        published.append(event)
+
+    bus.subscribe(IndicatorUpdated, on_update)
+
+    history = candles[:swing_window]
+    await bus.publish(CandleHistoryReady(symbol="ethusdc", timestamp=None, period="1m", candles=history))
+
+    for i, candle in enumerate(candles[swing_window:], start=swing_window):
+        await bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+        window = candles[i + 1 - swing_window: i + 1]
+        assert detector._find_swings() == _reference_swings(window, swing_side)
+
+    assert published
+    assert published[-1].values["window_high"] == max(c.high for c in candles[-swing_window:])
+
+
+# ---------------------------------------------------------------------------
+# SwingCalculator : extrêmes glissants identiques à un recalcul complet
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("side, window", [(2, 21), (4, 8), (3, 5)])
+def test_calculator_matches_full_scan(random_walk, side, window):
+    candles = random_walk(400, seed=1, interval=60, decimals=0).to_candles("ETHUSDC", 60)
+    calculator = SwingCalculator(side=side, window=window)
+
+    for i, candle in enumerate(candles):
+        calculator.update(candle)
+        current = candles[max(0, i + 1 - window): i + 1]
+
+        assert calculator.window_high == max(c.high for c in current)
+        assert calculator.window_low == min(c.low for c in current)
+        expected = _reference_swings(current, side) if len(current) >= 2 * side + 1 else (None, None)
+        assert (calculator.max_swing_high, calculator.min_swing_low) == expected
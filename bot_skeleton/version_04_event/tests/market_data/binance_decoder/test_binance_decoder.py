@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import pytest
+
+from trading_bot.market_data import binance_decoder
+from trading_bot.market_data.binance_decoder import DepthLevels, is_open_kline, kline_to_candle
+
+
+def _kline_message(closed):
+    return json.dumps({"stream": "ethusdc@kline_1m", "data": {"e": "kline", "s": "ETHUSDC", "k": {
+        "t": 1_700_000_000_000, "x": closed, "o": "100.1", "h": "101.2", "l": "99.3", "c": "100.4", "v": "12.5",
+    }}}, separators=(",", ":"))
+
+
+# ---------------------------------------------------------------------------
+# 1) Décodeurs interchangeables
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("name", binance_decoder.available_decoders())
+def test_decoders_are_equivalent(name):
+    previous = binance_decoder.decoder_name
+    binance_decoder.use_decoder(name)
+    try:
+        message = _kline_message(True)
+        assert binance_decoder.decode(message) == json.loads(message)
+        assert binance_decoder.decode(message.encode()) == json.loads(message)
+    finally:
+        binance_decoder.use_decoder(previous)
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError):
+        binance_decoder.use_decoder("yaml")
+
+
+# ---------------------------------------------------------------------------
+# 2) Klines : filtre sur le texte brut et Candle direct
+# ---------------------------------------------------------------------------
+def test_open_kline_filter():
+    assert is_open_kline(_kline_message(False))
+    assert is_open_kline(_kline_message(False).encode())
+    assert not is_open_kline(_kline_message(True))
+    assert not is_open_kline('{"stream":"ethusdc@depth5","data":{"bids":[],"asks":[]}}')
+
+
+def test_kline_to_candle():
+    k = json.loads(_kline_message(True))["data"]["k"]
+    candle = kline_to_candle(k, index=7, symbol="ethusdc", interval=60)
+
+    assert (candle.index, candle.start_ts, candle.interval) == (7, 1_700_000_000_000, 60)
+    assert (candle.open, candle.high, candle.low, candle.close, candle.volume) == (100.1, 101.2, 99.3, 100.4, 12.5)
+
+
+# ---------------------------------------------------------------------------
+# 3) Depth : niveaux réécrits en place dans les tableaux préalloués
+# ---------------------------------------------------------------------------
+def test_depth_levels_in_place():
+    depth = DepthLevels(capacity=3)
+    buffer = depth._bids
+
+    depth.update({"lastUpdateId": 1, "bids": [["10.5", "2"], ["10.4", "1"]], "asks": [["10.6", "3"]]})
+    np.testing.assert_array_equal(depth.bids, [[10.5, 2.0], [10.4, 1.0]])
+    np.testing.assert_array_equal(depth.asks, [[10.6, 3.0]])
+    assert depth.imbalance() == pytest.approx(0.5)
+    assert depth.imbalance(levels=1) == pytest.approx(0.4)
+
+    # Message différentiel, tronqué à la capacité, même buffer
+    depth.update({"u": 2, "b": [["9", "1"]] * 5, "a": []})
+    assert depth.bids.base is buffer
+    assert (depth.n_bids, depth.n_asks, depth.last_update_id) == (3, 0, 2)
+    assert depth.imbalance() == 1.0
@@ -0,0 +1,149 @@
+import time
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleHistoryReady
+from trading_bot.market_data.binance_rest_client import BinanceRestClient, BinanceRestError
+from trading_bot.market_data.candle_source_binance import CandleSourceBinance
+from trading_bot.market_data.candle_store import CandleStore
+
+INTERVAL_MS = 60_000
+
+
+def _kline(ts):
+    price = 100.0 + (ts // INTERVAL_MS) % 50
+    return [ts, str(price), str(price + 1), str(price - 1), str(price + 0.5), "1.0",
+            ts + INTERVAL_MS - 1, "0", 1, "0", "0", "0"]
+
+
+class FakeBinance:
+    """Serveur /api/v3/klines minimal : bougies 1m jusqu'à maintenant, pannes injectables."""
+
+    def __init__(self, failures=0, status=503):
+        self.failures = failures
+        self.status = status
+        self.requests = []
+
+    async def klines(self, request):
+        self.requests.append(dict(request.query))
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=self.status, headers={"Retry-After": "0"})
+
+        now_ms = int(time.time() * 1000)
+        start = int(request.query["startTime"])
+        end = min(int(request.query["endTime"]), now_ms)
+        limit = int(request.query["limit"])
+        first = -(-start // INTERVAL_MS) * INTERVAL_MS
+        return web.json_response([_kline(ts) for ts in range(first, end + 1, INTERVAL_MS)][:limit])
+
+
+@pytest_asyncio.fixture
+async def fake():
+    fake = FakeBinance()
+    app = web.Application()
+    app.router.add_get("/api/v3/klines", fake.klines)
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url(""))
+    yield fake
+    await server.close()
+
+
+def _params(warmup_count, store=None):
+    return {
+        "symbol": "ethusdc",
+        "interval": "1m",
+        "store": store,
+        "trading_system": {"warmup_count": warmup_count},
+    }
+
+
+# ---------------------------------------------------------------------------
+# 1) Pagination parallèle au-delà de la limite de 1000 bougies
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_fetch_klines_paginated(fake):
+    client = BinanceRestClient(base_url=fake.url, backoff=0)
+    end_ts = BinanceRestClient.last_closed_start_ts("1m")
+    start_ts = end_ts - 2499 * INTERVAL_MS
+
+    klines = await client.fetch_closed_klines("ethusdc", "1m", start_ts, end_ts)
+    await client.close()
+
+    assert len(fake.requests) == 3
+    assert len(klines) == 2500
+    assert klines[0][0] == start_ts and klines[-1][0] == end_ts
+    assert np.all(np.diff([k[0] for k in klines]) == INTERVAL_MS)
+
+
+# ---------------------------------------------------------------------------
+# 2) Retry / backoff sur les erreurs transitoires, échec franc sur les 4xx
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [429, 503])
+async def test_retry_transient_errors(fake, status):
+    fake.failures, fake.status = 2, status
+    client = BinanceRestClient(base_url=fake.url, backoff=0)
+
+    klines = await client.get_klines("ethusdc", "1m", 0, 10 * INTERVAL_MS)
+    await client.close()
+
+    assert len(fake.requests) == 3
+    assert len(klines) == 11
+
+
+@pytest.mark.asyncio
+async def test_client_error_not_retried(fake):
+    fake.failures, fake.status = 5, 400
+    client = BinanceRestClient(base_url=fake.url, backoff=0)
+
+    with pytest.raises(BinanceRestError):
+        await client.get_klines("ethusdc", "1m", 0, 10 * INTERVAL_MS)
+    await client.close()
+
+    assert len(fake.requests) == 1
+
+
+# ---------------------------------------------------------------------------
+# 3) Warmup : historique profond, seule la fin manquante au store est demandée
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_warmup_merges_store(fake, tmp_path):
+    end_ts = BinanceRestClient.last_closed_start_ts("1m")
+    store = CandleStore(str(tmp_path / "store"))
+    stored_ts = np.arange(end_ts - 3000 * INTERVAL_MS, end_ts - 100 * INTERVAL_MS, INTERVAL_MS, dtype=np.int64)
+    klines = [_kline(int(ts)) for ts in stored_ts]
+    store.write("ethusdc", "1m", CandleColumns.from_klines(klines))
+
+    bus = EventBus()
+    received = []
+
+    async def on_history(event):
+        received.append(event)
+
+    bus.subscribe(CandleHistoryReady, on_history)
+    source = CandleSourceBinance(bus, _params(1500, store=str(tmp_path / "store")))
+    source._rest = BinanceRestClient(base_url=fake.url, backoff=0)
+
+    await source._warmup()
+
+    candles = received[0].candles
+    assert len(candles) >= 1499
+    assert candles[-1].start_ts >= end_ts
+    assert [c.index for c in candles] == list(range(len(candles)))
+    assert np.all(np.diff([c.start_ts for c in candles]) == INTERVAL_MS)
+    # une seule page : la fin manquante après le store
+    assert len(fake.requests) == 1
+    assert int(fake.requests[0]["startTime"]) == int(stored_ts[-1]) + INTERVAL_MS
+    # le store est complété
+    assert store.meta("ethusdc", "1m")["last_ts"] == candles[-1].start_ts
+    tail = [c for c in candles if c.start_ts > stored_ts[-1]]
+    assert len(store.load("ethusdc", "1m")) == len(stored_ts) + len(tail)
+    await source._rest.close()
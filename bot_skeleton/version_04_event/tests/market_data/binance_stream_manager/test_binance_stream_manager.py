@@ -0,0 +1,218 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose
+from trading_bot.market_data.binance_stream_manager import BinanceStreamManager
+from trading_bot.market_data.candle_source_binance import CandleSourceBinance
+
+
+class FakeCombinedStream:
+    """Serveur combined stream minimal : enregistre les connexions et les requêtes reçues."""
+
+    def __init__(self):
+        self.paths = []
+        self.requests = []
+        self.connections = []
+
+    async def handler(self, ws):
+        self.paths.append(ws.request.path)
+        self.connections.append(ws)
+        try:
+            async for message in ws:
+                request = json.loads(message)
+                self.requests.append((request["method"], request["params"]))
+                await ws.send(json.dumps({"result": None, "id": request["id"]}))
+        except websockets.ConnectionClosed:
+            pass
+
+    async def push(self, stream, data):
+        for ws in self.connections:
+            # JSON compact, comme Binance
+            await ws.send(json.dumps({"stream": stream, "data": data}, separators=(",", ":")))
+
+
+@pytest_asyncio.fixture
+async def fake():
+    fake = FakeCombinedStream()
+    async with websockets.serve(fake.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        fake.url = f"ws://127.0.0.1:{port}/stream"
+        yield fake
+
+
+async def _until(predicate, timeout=2.0):
+    async def wait():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(wait(), timeout)
+
+
+def _kline(ts, closed, close=100.0):
+    return {"e": "kline", "s": "ETHUSDC", "k": {
+        "t": ts, "T": ts + 59_999, "i": "1m", "x": closed,
+        "o": "100", "h": "101", "l": "99", "c": str(close), "v": "1",
+    }}
+
+
+# ---------------------------------------------------------------------------
+# 1) Une seule connexion, fan-out vers tous les abonnés d'un stream
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_single_connection_fan_out(fake):
+    manager = BinanceStreamManager(url=fake.url, reconnect_delay=0.01)
+    kline, trade = manager.kline_stream("ETHUSDC", "1m"), manager.trade_stream("btcusdc")
+    received = {"a": [], "b": [], "c": []}
+
+    manager.subscribe(kline, received["a"].append)
+    manager.subscribe(kline, received["b"].append)
+    manager.subscribe(trade, received["c"].append)
+    await _until(lambda: fake.connections)
+
+    await fake.push(kline, {"k": 1})
+    await fake.push(trade, {"p": "2"})
+    await _until(lambda: received["c"])
+
+    assert len(fake.paths) == 1
+    assert "ethusdc@kline_1m" in fake.paths[0]
+    assert received["a"] == [{"k": 1}]
+    assert received["a"][0] is received["b"][0]  # un seul décodage JSON
+    assert received["c"] == [{"p": "2"}]
+    assert manager.messages == 2
+
+    manager.unsubscribe(kline, received["a"].append)
+    manager.unsubscribe(kline, received["b"].append)
+    manager.unsubscribe(trade, received["c"].append)
+
+
+# ---------------------------------------------------------------------------
+# 2) Comptage de références : SUBSCRIBE / UNSUBSCRIBE au premier / dernier abonné
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_reference_counting(fake):
+    manager = BinanceStreamManager(url=fake.url, reconnect_delay=0.01)
+    kline = manager.kline_stream("ethusdc", "1m")
+    depth = manager.depth_stream("ethusdc", 5, 100)
+    cb1, cb2, cb3 = (lambda d: None), (lambda d: None), (lambda d: None)
+
+    manager.subscribe(kline, cb1)
+    await _until(lambda: fake.connections)
+
+    manager.subscribe(kline, cb2)
+    manager.subscribe(depth, cb3)
+    await _until(lambda: fake.requests)
+    assert fake.requests == [("SUBSCRIBE", ["ethusdc@depth5@100ms"])]
+    assert manager.subscriber_count(kline) == 2
+
+    manager.unsubscribe(kline, cb1)
+    manager.unsubscribe(depth, cb3)
+    await _until(lambda: len(fake.requests) == 2)
+    assert fake.requests[1] == ("UNSUBSCRIBE", ["ethusdc@depth5@100ms"])
+    assert manager.streams == [kline]
+
+    # Dernier abonné : la connexion est fermée
+    manager.unsubscribe(kline, cb2)
+    await _until(lambda: fake.connections[0].state is websockets.State.CLOSED)
+    assert manager.streams == []
+    assert manager.connections == 1
+
+
+# ---------------------------------------------------------------------------
+# 3) CandleSourceBinance : CandleClose uniquement pour les bougies clôturées
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_candle_source_uses_shared_stream(fake):
+    manager = BinanceStreamManager(url=fake.url, reconnect_delay=0.01)
+    bus = EventBus()
+    closes = []
+
+    async def on_close(event):
+        closes.append(event.candle)
+
+    bus.subscribe(CandleClose, on_close)
+    sources = []
+    for _ in range(2):
+        source = CandleSourceBinance(bus, {"symbol": "ethusdc", "interval": "1m", "trading_system": {"warmup_count": 0}})
+        source._streams = manager
+        source._stream_task = asyncio.create_task(source._stream())
+        sources.append(source)
+
+    await _until(lambda: fake.connections and manager.subscriber_count("ethusdc@kline_1m") == 2)
+    await fake.push("ethusdc@kline_1m", _kline(0, closed=False))
+    await fake.push("ethusdc@kline_1m", _kline(0, closed=True, close=100.5))
+    await _until(lambda: len(closes) == 2)
+
+    assert len(fake.paths) == 1
+    assert [c.close for c in closes] == [100.5, 100.5]
+    assert manager.skipped == 1  # kline non clôturée écartée sans décodage
+    assert closes[0].start_ts == 0 and closes[0].interval == 60
+
+    for source in sources:
+        source._stream_task.cancel()
+    await _until(lambda: manager.streams == [])
+
+
+# ---------------------------------------------------------------------------
+# 4) Frame illisible et enregistreur en erreur : la connexion continue
+# ---------------------------------------------------------------------------
+class _FailingRecorder:
+    def write(self, message):
+        raise IOError("disque plein")
+
+
+@pytest.mark.asyncio
+async def test_malformed_frame_and_recorder_error_keep_stream(fake):
+    manager = BinanceStreamManager(url=fake.url, reconnect_delay=0.01)
+    manager.add_recorder(_FailingRecorder())
+    trade = manager.trade_stream("ethusdc")
+    received = []
+
+    manager.subscribe(trade, received.append)
+    await _until(lambda: fake.connections)
+
+    for ws in fake.connections:
+        await ws.send("{not json")
+    await fake.push(trade, {"p": "1"})
+    await _until(lambda: received)
+
+    assert received == [{"p": "1"}]
+    assert manager.malformed == 1
+    assert len(fake.paths) == 1
+
+    manager.unsubscribe(trade, received.append)
+
+
+# ---------------------------------------------------------------------------
+# 5) Handshake refusé : nouvelle tentative au lieu d'arrêter la tâche
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_rejected_handshake_reconnects():
+    fake = FakeCombinedStream()
+    rejected = []
+
+    def process_request(connection, request):
+        if not rejected:
+            rejected.append(request.path)
+            return connection.respond(503, "indisponible\n")
+        return None
+
+    async with websockets.serve(fake.handler, "127.0.0.1", 0, process_request=process_request) as server:
+        port = server.sockets[0].getsockname()[1]
+        manager = BinanceStreamManager(url=f"ws://127.0.0.1:{port}/stream", reconnect_delay=0.01)
+        trade = manager.trade_stream("ethusdc")
+        received = []
+
+        manager.subscribe(trade, received.append)
+        await _until(lambda: fake.connections)
+        await fake.push(trade, {"p": "1"})
+        await _until(lambda: received)
+
+        assert len(rejected) == 1
+        assert manager.errors == 1
+        assert manager.connections == 1
+
+        manager.unsubscribe(trade, received.append)
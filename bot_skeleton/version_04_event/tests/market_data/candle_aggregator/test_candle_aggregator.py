@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady
+from trading_bot.market_data.candle_aggregator import CandleAggregator, resample
+
+MINUTE_MS = 60_000
+# Début en milieu de bucket 15m (tête partielle)
+START_TS = 1_760_000_000_000 - 1_760_000_000_000 % (15 * MINUTE_MS) + 7 * MINUTE_MS
+
+
+def _pandas_resample(columns, rule):
+    df = pd.DataFrame({name: getattr(columns, name) for name in CandleColumns.NAMES[1:]},
+                      index=pd.to_datetime(columns.start_ts, unit="ms", utc=True))
+    return df.resample(rule).agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}).dropna()
+
+
+def _as_frame(candles):
+    return pd.DataFrame(
+        {"open": [c.open for c in candles], "high": [c.high for c in candles], "low": [c.low for c in candles],
+         "close": [c.close for c in candles], "volume": [c.volume for c in candles]},
+        index=pd.to_datetime([c.start_ts for c in candles], unit="ms", utc=True))
+
+
+# ---------------------------------------------------------------------------
+# 1) Resample vectorisé == pandas
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("interval, rule", [("5m", "5min"), ("15m", "15min"), ("1h", "1h")])
+def test_resample_matches_pandas(random_walk, interval, rule):
+    columns = random_walk(1000, seed=3, sigma=0.3, interval=60, start_ts=START_TS)
+    aggregated, counts = resample(columns, interval)
+    expected = _pandas_resample(columns, rule)
+
+    assert counts.sum() == len(columns)
+    np.testing.assert_array_equal(aggregated.start_ts, expected.index.as_unit("ms").asi8)
+    for name in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_allclose(getattr(aggregated, name), expected[name].to_numpy())
+
+
+# ---------------------------------------------------------------------------
+# 2) Historique + flux incrémental == resample de la série complète
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("history", [0, 1, 300, 307])
+async def test_incremental_matches_batch(random_walk, history):
+    columns = random_walk(1000, seed=3, sigma=0.3, interval=60, start_ts=START_TS)
+    candles = columns.to_candles("ethusdc", 60)
+
+    base_bus, bus_5m, bus_15m = EventBus(), EventBus(), EventBus()
+    aggregator = CandleAggregator(base_bus, "1m")
+    aggregator.add_timeframe("5m", bus_5m)
+    aggregator.add_timeframe("15m", bus_15m)
+
+    received = {"5m": [], "15m": []}
+    for interval, bus in (("5m", bus_5m), ("15m", bus_15m)):
+        async def on_history(event, interval=interval):
+            assert event.period == interval
+            received[interval].extend(event.candles)
+
+        async def on_close(event, interval=interval):
+            received[interval].append(event.candle)
+
+        bus.subscribe(CandleHistoryReady, on_history)
+        bus.subscribe(CandleClose, on_close)
+
+    if history:
+        await base_bus.publish(CandleHistoryReady(symbol="ethusdc", timestamp=None, period="1m", candles=candles[:history]))
+    for candle in candles[history:]:
+        await base_bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+    for interval, rule, minutes in (("5m", "5min", 5), ("15m", "15min", 15)):
+        got = received[interval]
+        expected = _pandas_resample(columns, rule)
+        # Bucket de tête partiel écarté par l'historique s'il y est clôturé ; bucket de queue non clôturé
+        head_remaining = (minutes * MINUTE_MS - START_TS % (minutes * MINUTE_MS)) // MINUTE_MS
+        if START_TS % (minutes * MINUTE_MS) and history >= head_remaining:
+            expected = expected.iloc[1:]
+        if (len(columns) * MINUTE_MS + START_TS) % (minutes * MINUTE_MS):
+            expected = expected.iloc[:-1]
+
+        pd.testing.assert_frame_equal(_as_frame(got), expected, check_freq=False, check_index_type=False)
+        assert [c.index for c in got] == list(range(len(got)))
+        assert all(c.interval == minutes * 60 for c in got)
+
+
+# ---------------------------------------------------------------------------
+# 3) Trou dans le flux de base : bucket incomplet publié tel quel
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_gap_flushes_incomplete_bucket(random_walk):
+    candles = random_walk(40, seed=3, sigma=0.3, interval=60, start_ts=START_TS).to_candles("ethusdc", 60)
+    base_bus, bus_5m = EventBus(), EventBus()
+    aggregator = CandleAggregator(base_bus, "1m")
+    aggregator.add_timeframe("5m", bus_5m)
+    closes = []
+
+    async def on_close(event):
+        closes.append(event.candle)
+
+    bus_5m.subscribe(CandleClose, on_close)
+
+    # START_TS est à +2 min dans un bucket 5m : bougies 0-2 complètent le premier bucket
+    for candle in candles[:5] + candles[9:]:
+        await base_bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+    starts = [c.start_ts for c in closes]
+    assert starts[:3] == [candles[0].start_ts - 2 * MINUTE_MS, candles[3].start_ts, candles[8].start_ts]
+    # le bucket interrompu ne contient que les bougies 3 et 4
+    assert closes[1].close == candles[4].close
+
+
+def test_invalid_timeframe():
+    aggregator = CandleAggregator(EventBus(), "5m")
+    with pytest.raises(ValueError):
+        aggregator.add_timeframe("7m", EventBus())
+    assert aggregator.base_warmup_count("15m", 10) == 33
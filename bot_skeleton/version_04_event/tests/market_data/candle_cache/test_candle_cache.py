@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.market_data.candle_cache import CandleCache
+
+
+def _columns(count=5):
+    return CandleColumns(
+        start_ts=np.arange(count, dtype=np.int64) * 300_000,
+        open=np.full(count, 100.0),
+        high=np.full(count, 101.0),
+        low=np.full(count, 99.0),
+        close=np.arange(count) + 100.0,
+        volume=np.ones(count),
+    )
+
+
+def _loader(calls, count=5):
+    def load():
+        calls.append(1)
+        return _columns(count)
+    return load
+
+
+# ---------------------------------------------------------------------------
+# 1) Un fichier n'est chargé qu'une fois, les bougies sont partagées
+# ---------------------------------------------------------------------------
+def test_loaded_once(tmp_path):
+    path = tmp_path / "eth.csv"
+    path.write_text("x")
+    cache = CandleCache()
+    calls = []
+
+    first = cache.get(str(path), "ethusdc", 300, _loader(calls))
+    second = cache.get(str(path), "ethusdc", 300, _loader(calls))
+
+    assert len(calls) == 1
+    assert first.candles is second.candles
+    assert [c.index for c in first.candles] == [0, 1, 2, 3, 4]
+    assert first.candles[1].close == 101.0
+    assert cache.hits == 1
+
+
+# ---------------------------------------------------------------------------
+# 2) Un fichier modifié (mtime) est rechargé et remplace l'ancienne entrée
+# ---------------------------------------------------------------------------
+def test_reload_on_mtime_change(tmp_path):
+    path = tmp_path / "eth.csv"
+    path.write_text("x")
+    cache = CandleCache()
+    calls = []
+
+    cache.get(str(path), "ethusdc", 300, _loader(calls))
+    mtime = os.path.getmtime(path)
+    os.utime(path, (mtime + 10, mtime + 10))
+    cache.get(str(path), "ethusdc", 300, _loader(calls))
+
+    assert len(calls) == 2
+    assert len(cache) == 1
+
+
+# ---------------------------------------------------------------------------
+# 3) Eviction LRU au-delà du plafond mémoire
+# ---------------------------------------------------------------------------
+def test_lru_eviction(tmp_path):
+    paths = []
+    for name in ("a.csv", "b.csv", "c.csv"):
+        p = tmp_path / name
+        p.write_text("x")
+        paths.append(str(p))
+
+    probe = CandleCache()
+    entry_size = probe.get(paths[0], "ethusdc", 300, _loader([])).nbytes
+
+    cache = CandleCache(max_bytes=int(entry_size * 2.5))
+    calls = []
+    cache.get(paths[0], "ethusdc", 300, _loader(calls))
+    cache.get(paths[1], "ethusdc", 300, _loader(calls))
+    cache.get(paths[0], "ethusdc", 300, _loader(calls))  # a redevient le plus récent
+    cache.get(paths[2], "ethusdc", 300, _loader(calls))  # b est évincé
+
+    assert len(cache) == 2
+    assert len(calls) == 3
+    cache.get(paths[0], "ethusdc", 300, _loader(calls))
+    assert len(calls) == 3
+    cache.get(paths[1], "ethusdc", 300, _loader(calls))
+    assert len(calls) == 4
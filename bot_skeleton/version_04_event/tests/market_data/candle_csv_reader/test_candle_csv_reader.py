@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.time_frame import Timeframe
+from trading_bot.market_data.candle_csv_reader import CandleCsvReader
+
+
+def _write_csv(path, count=25, tz="UTC"):
+    timestamps = pd.date_range("2025-09-14", periods=count, freq="5min", tz=tz)
+    df = pd.DataFrame({
+        "timestamp": timestamps,
+        "open": np.arange(count) + 100.0,
+        "high": np.arange(count) + 101.0,
+        "low": np.arange(count) + 99.0,
+        "close": np.arange(count) + 100.5,
+        "volume": np.ones(count),
+        "trades": np.arange(count),
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# 1) Lecture complète : timestamps en epoch ms, identiques à pandas
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("tz", ["UTC", None])
+def test_read_matches_pandas(tmp_path, tz):
+    df = _write_csv(tmp_path / "eth.csv", tz=tz)
+
+    columns = CandleCsvReader(str(tmp_path / "eth.csv")).read()
+
+    expected = [pd.Timestamp(ts, tz="UTC" if tz is None else None).value // 1_000_000 for ts in df["timestamp"]]
+    np.testing.assert_array_equal(columns.start_ts, expected)
+    assert columns.start_ts.dtype == np.int64
+    np.testing.assert_array_equal(columns.close, df["close"].to_numpy())
+
+
+# ---------------------------------------------------------------------------
+# 2) Lecture par blocs : même série, index continus
+# ---------------------------------------------------------------------------
+def test_chunks_and_candles(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=25)
+    reader = CandleCsvReader(str(tmp_path / "eth.csv"), chunk_size=10)
+
+    chunks = list(reader.chunks())
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    full = reader.read()
+    for name in CandleColumns.NAMES:
+        np.testing.assert_array_equal(np.concatenate([getattr(c, name) for c in chunks]), getattr(full, name))
+
+    candles = list(reader.candles("ETHUSDC", 300, start_index=3))
+    assert [c.index for c in candles] == list(range(3, 28))
+    assert candles == full.to_candles("ETHUSDC", 300, start_index=3)
+    assert candles[0].end_ts - candles[0].start_ts == 300_000
+
+
+def test_missing_columns(tmp_path):
+    pd.DataFrame({"timestamp": ["2025-09-14 00:00:00"], "close": [1.0]}).to_csv(tmp_path / "bad.csv", index=False)
+    with pytest.raises(ValueError):
+        CandleCsvReader(str(tmp_path / "bad.csv"))
+
+
+# ---------------------------------------------------------------------------
+# 3) Plage de dates : début trouvé par dichotomie, identique au filtre pandas
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("start, end", [
+    (None, None),
+    ("2025-09-14 00:35:00", None),           # borne exacte
+    ("2025-09-14 00:37:00", "2025-09-14 01:20:00"),  # entre deux bougies
+    ("2025-09-13", "2025-09-14 00:00:00"),   # avant le début
+    ("2025-09-15", None),                    # après la fin
+    (None, "2025-09-14 00:10:00"),
+])
+def test_date_range(tmp_path, start, end):
+    _write_csv(tmp_path / "eth.csv", count=25)
+    reader = CandleCsvReader(str(tmp_path / "eth.csv"), chunk_size=4)
+    full = reader.read()
+    start_ts, end_ts = Timeframe.to_epoch_ms(start), Timeframe.to_epoch_ms(end)
+
+    columns = reader.read(start_ts, end_ts)
+
+    mask = np.ones(len(full), dtype=bool)
+    if start_ts is not None:
+        mask &= full.start_ts >= start_ts
+    if end_ts is not None:
+        mask &= full.start_ts <= end_ts
+    np.testing.assert_array_equal(columns.start_ts, full.start_ts[mask])
+    np.testing.assert_array_equal(columns.close, full.close[mask])
+
+
+def test_offset_skips_rows(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=25)
+    reader = CandleCsvReader(str(tmp_path / "eth.csv"))
+    full = reader.read()
+
+    offset = reader.offset_for(int(full.start_ts[10]))
+    with open(tmp_path / "eth.csv", "rb") as f:
+        lines = f.readlines()
+    assert offset == sum(len(line) for line in lines[:11])  # en-tête + 10 lignes
+    assert len(reader.read(limit=3)) == 3
+
+
+# ---------------------------------------------------------------------------
+# 4) Lecture anticipée dans un thread
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_read_ahead(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=25)
+    reader = CandleCsvReader(str(tmp_path / "eth.csv"), chunk_size=4)
+    full = reader.read()
+
+    chunks = [c async for c in reader.read_ahead(int(full.start_ts[5]), depth=1)]
+
+    assert [len(c) for c in chunks] == [4, 4, 4, 4, 4]
+    np.testing.assert_array_equal(np.concatenate([c.start_ts for c in chunks]), full.start_ts[5:])
+
+    # Arrêt anticipé du consommateur : le thread ne reste pas bloqué
+    agen = reader.read_ahead(depth=1)
+    assert len(await agen.__anext__()) == 4
+    await agen.aclose()
@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import Candle, CandleClose
+from trading_bot.market_data.binance_rest_client import BinanceRestClient
+from trading_bot.market_data.candle_heartbeat import CandleHeartbeatMonitor
+from trading_bot.market_data.candle_source_binance import CandleSourceBinance
+from tests.market_data.binance_rest_client.test_binance_rest_client import FakeBinance, INTERVAL_MS
+
+# Ancre passée de 100 intervalles, toutes les bougies testées sont clôturées
+ANCHOR = BinanceRestClient.last_closed_start_ts("1m") - 100 * INTERVAL_MS
+
+
+@pytest_asyncio.fixture
+async def fake():
+    fake = FakeBinance()
+    app = web.Application()
+    app.router.add_get("/api/v3/klines", fake.klines)
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url(""))
+    yield fake
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def sources():
+    """Sources créées par le test, sessions REST fermées en fin de test."""
+    sources = []
+    yield sources
+    for source in sources:
+        await source._rest.close()
+
+
+def _ws_kline(ts):
+    return {"t": ts, "x": True, "o": "100", "h": "101", "l": "99", "c": "100.5", "v": "1"}
+
+
+def _source(fake, closes, sources):
+    bus = EventBus()
+
+    async def on_close(event):
+        closes.append(event.candle)
+
+    bus.subscribe(CandleClose, on_close)
+    source = CandleSourceBinance(bus, {"symbol": "ethusdc", "interval": "1m", "trading_system": {"warmup_count": 0}})
+    source._rest = BinanceRestClient(base_url=fake.url, backoff=0)
+    sources.append(source)
+    return source
+
+
+# ---------------------------------------------------------------------------
+# 1) Trou dans le flux websocket : rattrapage REST publié dans l'ordre
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_gap_is_backfilled_in_order(fake, sources):
+    closes = []
+    source = _source(fake, closes, sources)
+
+    await source._on_closed_kline(_ws_kline(ANCHOR))
+    await source._on_closed_kline(_ws_kline(ANCHOR + INTERVAL_MS))
+    assert fake.requests == []
+
+    # Reconnexion : 3 bougies perdues
+    await source._on_closed_kline(_ws_kline(ANCHOR + 5 * INTERVAL_MS))
+
+    assert [c.start_ts for c in closes] == [ANCHOR + i * INTERVAL_MS for i in range(6)]
+    assert [c.index for c in closes] == list(range(6))
+    assert len(fake.requests) == 1
+    assert int(fake.requests[0]["startTime"]) == ANCHOR + 2 * INTERVAL_MS
+    assert int(fake.requests[0]["endTime"]) == ANCHOR + 4 * INTERVAL_MS
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_ignored(fake, sources):
+    closes = []
+    source = _source(fake, closes, sources)
+
+    await source._on_closed_kline(_ws_kline(ANCHOR))
+    await source._on_closed_kline(_ws_kline(ANCHOR))
+    await source._on_closed_kline(_ws_kline(ANCHOR - INTERVAL_MS))
+
+    assert [c.start_ts for c in closes] == [ANCHOR]
+    assert fake.requests == []
+
+
+# ---------------------------------------------------------------------------
+# 2) Heartbeat mort : rattrapage jusqu'à la dernière bougie clôturée
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_backfill_until_last_closed(fake, sources):
+    closes = []
+    source = _source(fake, closes, sources)
+    await source._on_closed_kline(_ws_kline(ANCHOR))
+
+    await source.backfill()
+
+    assert len(closes) == 101
+    assert closes[-1].start_ts == BinanceRestClient.last_closed_start_ts("1m")
+    await source.backfill()
+    assert len(closes) == 101
+
+
+# ---------------------------------------------------------------------------
+# 3) Une seule session REST pour la vie de la source, fermée à la fin du flux
+# ---------------------------------------------------------------------------
+class _NoStreams:
+    def subscribe(self, stream, callback):
+        pass
+
+    def unsubscribe(self, stream, callback):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_rest_session_closed_with_stream(fake, sources):
+    closes = []
+    source = _source(fake, closes, sources)
+    source._streams = _NoStreams()
+
+    await source._on_closed_kline(_ws_kline(ANCHOR))
+    await source._on_closed_kline(_ws_kline(ANCHOR + 3 * INTERVAL_MS))
+    session = source._rest._session
+    await source.backfill()
+    assert source._rest._session is session
+    assert not session.closed
+
+    stream = asyncio.create_task(source._stream())
+    await asyncio.sleep(0)
+    stream.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stream
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_dead_triggers_callback():
+    bus = EventBus()
+    dead = asyncio.Event()
+
+    async def on_dead():
+        dead.set()
+
+    heartbeat = CandleHeartbeatMonitor(bus, on_dead=on_dead)
+    heartbeat.tolerance_factor = 0.1
+    heartbeat.first_candle_poll = 0.05
+    await heartbeat.start()
+
+    candle = Candle(index=0, symbol="ethusdc", interval=1, open=1.0, high=1.0, low=1.0, close=1.0, volume=1.0, start_ts=0)
+    await bus.publish(CandleClose(symbol="ethusdc", candle=candle))
+
+    await asyncio.wait_for(dead.wait(), 3)
+    assert heartbeat.heartbeat == "dead"
+    heartbeat.stop()
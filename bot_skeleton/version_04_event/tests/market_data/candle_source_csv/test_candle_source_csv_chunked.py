@@ -0,0 +1,58 @@
+import pytest
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady
+from trading_bot.market_data.candle_cache import CandleCache
+from trading_bot.market_data.candle_source_csv import CandleSourceCsv
+from tests.market_data.candle_csv_reader.test_candle_csv_reader import _write_csv
+
+
+async def _run(path, **params):
+    event_bus = EventBus()
+    history, closes = [], []
+    async def on_history(event):
+        history.extend(event.candles)
+    async def on_close(event):
+        closes.append(event.candle)
+    event_bus.subscribe(CandleHistoryReady, on_history)
+    event_bus.subscribe(CandleClose, on_close)
+
+    source = CandleSourceCsv(event_bus, {
+        "path": str(path),
+        "symbol": "ethusdc",
+        "interval": "5m",
+        "trading_system": {"warmup_count": 6},
+        **params,
+    })
+    await source.start()
+    await source.join()
+    return history, closes
+
+
+# ---------------------------------------------------------------------------
+# 1) Flux par blocs identique au flux depuis le cache
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_chunked_stream_matches_cached(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=50)
+    CandleCache.shared().clear()
+
+    cached = await _run(tmp_path / "eth.csv")
+    chunked = await _run(tmp_path / "eth.csv", chunk_size=7, read_ahead=1)
+
+    assert chunked == cached
+    assert [c.index for c in chunked[1]] == list(range(6, 50))
+
+
+# ---------------------------------------------------------------------------
+# 2) Plage de dates : warmup puis flux limités à [start, end]
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_date_range(tmp_path):
+    df = _write_csv(tmp_path / "eth.csv", count=50)
+
+    history, closes = await _run(tmp_path / "eth.csv", start="2025-09-14 01:00:00", end="2025-09-14 02:00:00")
+
+    timestamps = df["timestamp"].iloc[12:25].tolist()
+    assert [c.start_time for c in history + closes] == [ts.to_pydatetime() for ts in timestamps]
+    assert [c.index for c in history + closes] == list(range(13))
@@ -0,0 +1,184 @@
+import os
+import pytest
+import numpy as np
+import pandas as pd
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady
+from trading_bot.market_data.candle_store import CandleStore
+from trading_bot.market_data.candle_source_store import CandleSourceStore
+
+
+def _write_csv(path, count=10):
+    timestamps = pd.date_range("2025-09-14", periods=count, freq="5min", tz="UTC")
+    df = pd.DataFrame({
+        "timestamp": timestamps,
+        "open": np.arange(count) + 100.0,
+        "high": np.arange(count) + 101.0,
+        "low": np.arange(count) + 99.0,
+        "close": np.arange(count) + 100.5,
+        "volume": np.ones(count),
+    })
+    df.to_csv(path, index=False)
+    return df
+
+
+# ---------------------------------------------------------------------------
+# 1) Conversion CSV -> store puis relecture en memory-map
+# ---------------------------------------------------------------------------
+def test_import_csv_roundtrip(tmp_path):
+    df = _write_csv(tmp_path / "eth.csv")
+    store = CandleStore(str(tmp_path / "store"))
+
+    store.import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+
+    assert store.exists("ETHUSDC", "5m")
+    columns = store.load("ethusdc", "5m")
+    assert len(columns) == len(df)
+    assert isinstance(columns.close, np.memmap)
+    assert columns.start_ts[1] - columns.start_ts[0] == 5 * 60 * 1000
+    np.testing.assert_array_equal(columns.close, df["close"].to_numpy())
+    assert store.meta("ethusdc", "5m")["count"] == len(df)
+
+
+def test_load_unknown_serie(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CandleStore(str(tmp_path)).load("btcusdc", "1h")
+
+
+# ---------------------------------------------------------------------------
+# 2) CandleSourceStore : warmup puis stream sans relire le fichier
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_candle_source_store_warmup_and_stream(tmp_path):
+    df = _write_csv(tmp_path / "eth.csv", count=10)
+    CandleStore(str(tmp_path / "store")).import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+
+    event_bus = EventBus()
+    history, closes = [], []
+    async def on_history(event):
+        history.append(event)
+    async def on_close(event):
+        closes.append(event.candle)
+    event_bus.subscribe(CandleHistoryReady, on_history)
+    event_bus.subscribe(CandleClose, on_close)
+
+    params = {
+        "path": str(tmp_path / "store"),
+        "symbol": "ethusdc",
+        "interval": "5m",
+        "trading_system": {"warmup_count": 4},
+    }
+    source = CandleSourceStore(event_bus, params)
+    await source.start()
+    await source.join()
+
+    assert len(history[0].candles) == 4
+    assert [c.index for c in closes] == list(range(4, 10))
+    assert closes[0].close == df["close"].iloc[4]
+    assert closes[0].start_time == df["timestamp"].iloc[4].to_pydatetime()
+    assert (closes[0].end_time - closes[0].start_time).total_seconds() == 300
+
+
+# ---------------------------------------------------------------------------
+# 3) Ajout incrémental dédoublonné
+# ---------------------------------------------------------------------------
+def test_append_deduplicates(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=10)
+    store = CandleStore(str(tmp_path / "store"))
+    columns = store.import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+
+    # 3 bougies déjà présentes (corrigées) + 2 nouvelles
+    tail = columns.slice(7)
+    step = int(columns.start_ts[1] - columns.start_ts[0])
+    new = type(columns)(
+        start_ts=np.concatenate([tail.start_ts, tail.start_ts[-1] + step * np.arange(1, 3)]),
+        open=np.full(5, 1.0), high=np.full(5, 2.0), low=np.full(5, 0.5), close=np.full(5, 1.5), volume=np.full(5, 3.0),
+    )
+    merged = store.append("ethusdc", "5m", new)
+
+    assert len(merged) == 12
+    reloaded = store.load("ethusdc", "5m")
+    np.testing.assert_array_equal(reloaded.start_ts, np.sort(np.unique(reloaded.start_ts)))
+    np.testing.assert_array_equal(reloaded.close[7:], np.full(5, 1.5))
+    np.testing.assert_array_equal(reloaded.close[:7], columns.close[:7])
+    assert store.meta("ethusdc", "5m")["last_ts"] == int(new.start_ts[-1])
+
+
+def _next(columns, count, close=1.5):
+    step = int(columns.start_ts[1] - columns.start_ts[0])
+    return type(columns)(
+        start_ts=columns.start_ts[-1] + step * np.arange(1, count + 1),
+        open=np.full(count, 1.0), high=np.full(count, 2.0), low=np.full(count, 0.5),
+        close=np.full(count, close), volume=np.full(count, 3.0),
+    )
+
+
+# ---------------------------------------------------------------------------
+# 4) Bougies postérieures : seules les nouvelles lignes sont écrites
+# ---------------------------------------------------------------------------
+def test_append_newer_rows_in_place(tmp_path, monkeypatch):
+    _write_csv(tmp_path / "eth.csv", count=10)
+    store = CandleStore(str(tmp_path / "store"))
+    columns = store.import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+
+    monkeypatch.setattr(store, "write", lambda *args, **kwargs: pytest.fail("réécriture complète"))
+    store.append("ethusdc", "5m", _next(columns, 3))
+    merged = store.append("ethusdc", "5m", _next(store.load("ethusdc", "5m"), 2, close=2.5))
+
+    assert len(merged) == 15
+    assert isinstance(merged.close, np.memmap)
+    np.testing.assert_array_equal(np.diff(merged.start_ts), merged.start_ts[1] - merged.start_ts[0])
+    np.testing.assert_array_equal(merged.close[10:], [1.5, 1.5, 1.5, 2.5, 2.5])
+    np.testing.assert_array_equal(np.load(tmp_path / "store" / "ETHUSDC" / "5m" / "volume.npy")[:10], np.ones(10))
+    assert store.meta("ethusdc", "5m")["count"] == 15
+    assert store.meta("ethusdc", "5m")["first_ts"] == int(columns.start_ts[0])
+
+
+# ---------------------------------------------------------------------------
+# 5) Interruptions : la série relue reste cohérente
+# ---------------------------------------------------------------------------
+def test_rows_beyond_meta_count_are_ignored(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=10)
+    store = CandleStore(str(tmp_path / "store"))
+    columns = store.import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+    meta = store.meta("ethusdc", "5m")
+    store.append("ethusdc", "5m", _next(columns, 4))
+
+    # Interruption avant meta.json : les colonnes ont 14 lignes, meta en valide 10
+    store._write_meta(store.path_for("ethusdc", "5m"), "ethusdc", "5m", 10, columns, meta["source"])
+    reloaded = store.load("ethusdc", "5m")
+    assert len(reloaded) == 10
+    np.testing.assert_array_equal(reloaded.close, columns.close)
+
+    # L'ajout suivant écrase les lignes non validées
+    merged = store.append("ethusdc", "5m", _next(columns, 2, close=9.0))
+    np.testing.assert_array_equal(merged.close[10:], [9.0, 9.0])
+    assert len(np.load(tmp_path / "store" / "ETHUSDC" / "5m" / "close.npy")) == 12
+
+
+def test_interrupted_write_keeps_previous_version(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=10)
+    store = CandleStore(str(tmp_path / "store"))
+    columns = store.import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+
+    # Interruption entre les deux renommages de write()
+    path = store.path_for("ethusdc", "5m")
+    os.rename(path, f"{path}.old")
+    os.makedirs(f"{path}.tmp")
+
+    assert store.exists("ethusdc", "5m")
+    np.testing.assert_array_equal(store.load("ethusdc", "5m").close, columns.close)
+    store.write("ethusdc", "5m", columns.slice(0, 5))
+    assert len(store.load("ethusdc", "5m")) == 5
+    assert not os.path.exists(f"{path}.tmp") and not os.path.exists(f"{path}.old")
+
+
+def test_short_column_is_reported(tmp_path):
+    _write_csv(tmp_path / "eth.csv", count=10)
+    store = CandleStore(str(tmp_path / "store"))
+    columns = store.import_csv(str(tmp_path / "eth.csv"), "ethusdc", "5m")
+    np.save(os.path.join(store.path_for("ethusdc", "5m"), "volume.npy"), columns.volume[:8])
+
+    with pytest.raises(ValueError):
+        store.load("ethusdc", "5m")
@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import aiohttp
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady
+from trading_bot.market_data.binance_rest_client import BinanceRestClient
+from trading_bot.market_data.binance_stream_manager import BinanceStreamManager
+from trading_bot.market_data.candle_source_binance import CandleSourceBinance
+from trading_bot.market_data.exchange_simulator import ExchangeSimulator
+
+INTERVAL_MS = 60_000
+
+
+def _columns(count=300):
+    close = 100.0 + np.arange(count, dtype=np.float64)
+    return CandleColumns(
+        start_ts=np.arange(count, dtype=np.int64) * INTERVAL_MS,
+        open=close - 0.5, high=close + 1.0, low=close - 1.0, close=close, volume=np.ones(count),
+    )
+
+
+@pytest_asyncio.fixture
+async def simulator(tmp_path):
+    capture = tmp_path / "capture.jsonl"
+    # Trades rejoués 0.5 s après le démarrage (x600), le temps de s'abonner
+    lines = [{"ts": 0, "stream": "btcusdc@aggTrade", "data": {}}]
+    lines += [{"ts": 300_000 + i * 6_000, "stream": "btcusdc@trade", "data": {"p": str(i)}} for i in range(3)]
+    capture.write_text("\n".join(json.dumps(line) for line in lines))
+    simulator = ExchangeSimulator(speedup=600, depth_period=0.02)
+    simulator.add_klines("ethusdc", "1m", _columns(), history=200)
+    simulator.add_capture(str(capture))
+    await simulator.start()
+    yield simulator
+    await simulator.stop()
+
+
+# ---------------------------------------------------------------------------
+# 1) REST : klines visibles, ticker, depth
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_rest_endpoints(simulator):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{simulator.rest_url}/api/v3/klines", params={"symbol": "ETHUSDC", "interval": "1m", "limit": 5}) as resp:
+            klines = await resp.json()
+        async with session.get(f"{simulator.rest_url}/api/v3/ticker/price", params={"symbol": "ETHUSDC"}) as resp:
+            ticker = await resp.json()
+        async with session.get(f"{simulator.rest_url}/api/v3/depth", params={"symbol": "ETHUSDC", "limit": 3}) as resp:
+            depth = await resp.json()
+        async with session.get(f"{simulator.rest_url}/api/v3/ticker/price", params={"symbol": "DOGEUSDC"}) as resp:
+            assert resp.status == 400
+
+    # Dernière bougie de l'historique = dernière bougie clôturée réelle
+    assert len(klines) == 5
+    assert klines[-1][0] == BinanceRestClient.last_closed_start_ts("1m")
+    assert float(klines[-1][4]) == pytest.approx(100.0 + 199)
+    assert float(ticker["price"]) >= 100.0 + 199
+    assert len(depth["bids"]) == len(depth["asks"]) == 3
+    assert float(depth["bids"][0][0]) < float(ticker["price"]) < float(depth["asks"][0][0])
+
+
+# ---------------------------------------------------------------------------
+# 2) Bout en bout : CandleSourceBinance branché par BINANCE_REST_URL / BINANCE_WS_URL
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_candle_source_end_to_end(simulator, monkeypatch):
+    monkeypatch.setenv("BINANCE_REST_URL", simulator.rest_url)
+    monkeypatch.setenv("BINANCE_WS_URL", simulator.ws_url)
+
+    bus = EventBus()
+    history, closes = [], []
+
+    async def on_history(event):
+        history.extend(event.candles)
+
+    async def on_close(event):
+        closes.append(event.candle)
+
+    bus.subscribe(CandleHistoryReady, on_history)
+    bus.subscribe(CandleClose, on_close)
+
+    source = CandleSourceBinance(bus, {"symbol": "ethusdc", "interval": "1m", "trading_system": {"warmup_count": 50}})
+    source._streams = BinanceStreamManager()
+    await source.start()
+    try:
+        await asyncio.wait_for(_until(lambda: len(closes) >= 3), 5)
+    finally:
+        source.stop()
+
+    assert len(history) == 50
+    assert history[-1].close == pytest.approx(100.0 + 199)
+    # Le flux reprend exactement après l'historique, sans trou
+    stream = [c.start_ts for c in closes[:3]]
+    assert stream == [history[-1].start_ts + (i + 1) * INTERVAL_MS for i in range(3)]
+    assert [c.index for c in closes[:3]] == [50, 51, 52]
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.01)
+
+
+# ---------------------------------------------------------------------------
+# 3) Websocket simple : depth synthétique, SUBSCRIBE et rejeu de capture
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_raw_stream_and_capture(simulator):
+    async with aiohttp.ClientSession() as session:
+        async with session.ws_connect(f"ws://{simulator.host}:{simulator.port}/ws/ethusdc@depth5@100ms") as ws:
+            depth = await asyncio.wait_for(ws.receive_json(), 2)
+            assert len(depth["bids"]) == 5 and "lastUpdateId" in depth
+
+        async with session.ws_connect(simulator.ws_url) as ws:
+            await ws.send_json({"method": "SUBSCRIBE", "params": ["btcusdc@trade"], "id": 1})
+            messages = []
+            while len(messages) < 2:
+                msg = await asyncio.wait_for(ws.receive_json(), 2)
+                if "stream" in msg:
+                    messages.append(msg)
+
+    assert all(m["stream"] == "btcusdc@trade" for m in messages)
+    assert simulator.messages_sent >= 3
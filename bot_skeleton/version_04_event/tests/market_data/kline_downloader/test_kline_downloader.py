@@ -0,0 +1,101 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.market_data.binance_rest_client import BinanceRestClient
+from trading_bot.market_data.candle_store import CandleStore
+from trading_bot.market_data.kline_downloader import KlineDownloader
+from tests.market_data.binance_rest_client.test_binance_rest_client import INTERVAL_MS, fake  # noqa: F401
+
+
+def _downloader(fake, tmp_path, **kwargs):
+    rest = BinanceRestClient(base_url=fake.url, backoff=0)
+    return KlineDownloader(CandleStore(str(tmp_path / "store")), rest, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# 1) Plusieurs couples en parallèle, par tranches, puis reprise incrémentale
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_download_all_then_resume(fake, tmp_path):
+    downloader = _downloader(fake, tmp_path, chunk_candles=1000)
+    end_ts = BinanceRestClient.last_closed_start_ts("1m")
+    start_ts = end_ts - 2499 * INTERVAL_MS
+
+    results = await downloader.download_all([("ethusdc", "1m"), ("btcusdc", "1m")], start_ts, end_ts - 500 * INTERVAL_MS)
+    assert results == {("ETHUSDC", "1m"): 2000, ("BTCUSDC", "1m"): 2000}
+
+    fake.requests.clear()
+    results = await downloader.download_all([("ethusdc", "1m")], start_ts, end_ts)
+    await downloader.close()
+
+    # Seule la fin manquante est demandée
+    assert results == {("ETHUSDC", "1m"): 500}
+    assert min(int(r["startTime"]) for r in fake.requests) == end_ts - 499 * INTERVAL_MS
+
+    columns = downloader.store.load("ethusdc", "1m")
+    assert len(columns) == 2500
+    np.testing.assert_array_equal(np.diff(columns.start_ts), INTERVAL_MS)
+    assert columns.start_ts[0] == start_ts and columns.start_ts[-1] == end_ts
+
+
+# ---------------------------------------------------------------------------
+# 2) Un couple en échec n'interrompt pas les autres
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_failed_pair_is_reported(fake, tmp_path):
+    downloader = _downloader(fake, tmp_path)
+    downloader.rest.max_retries = 0
+    end_ts = BinanceRestClient.last_closed_start_ts("1m")
+
+    results = await downloader.download_all([("ethusdc", "1m"), ("btcusdc", "bad")], end_ts - 99 * INTERVAL_MS, end_ts)
+    await downloader.close()
+
+    assert results[("ETHUSDC", "1m")] == 100
+    assert isinstance(results[("BTCUSDC", "bad")], Exception)
+
+
+# ---------------------------------------------------------------------------
+# 3) Budget de poids : au-delà, attente de la fenêtre suivante
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_weight_limit_waits_next_window(fake):
+    client = BinanceRestClient(base_url=fake.url, weight_limit=4)
+    client.WEIGHT_WINDOW = 0.5
+    end_ts = BinanceRestClient.last_closed_start_ts("1m")
+
+    started = time.monotonic()
+    for _ in range(3):
+        await client.get_klines("ethusdc", "1m", end_ts, end_ts)
+    elapsed = time.monotonic() - started
+    await client.close()
+
+    assert len(fake.requests) == 3
+    assert 0 < elapsed <= 1.0
+    assert client.used_weight in (2, 4)
+
+
+# ---------------------------------------------------------------------------
+# 4) Export CSV incrémental, relisible par les sources CSV
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_export_csv_incremental(fake, tmp_path):
+    downloader = _downloader(fake, tmp_path)
+    end_ts = BinanceRestClient.last_closed_start_ts("1m")
+    start_ts = end_ts - 199 * INTERVAL_MS
+
+    await downloader.download("ethusdc", "1m", start_ts, end_ts - 50 * INTERVAL_MS)
+    assert downloader.export_csv("ethusdc", "1m", str(tmp_path / "csv")) == 150
+    await downloader.download("ethusdc", "1m", start_ts, end_ts)
+    assert downloader.export_csv("ethusdc", "1m", str(tmp_path / "csv")) == 50
+    assert downloader.export_csv("ethusdc", "1m", str(tmp_path / "csv")) == 0
+    await downloader.close()
+
+    df = pd.read_csv(tmp_path / "csv" / "ETHUSDC_1m_historique.csv")
+    columns = CandleColumns.from_dataframe(df)
+    stored = downloader.store.load("ethusdc", "1m")
+    np.testing.assert_array_equal(columns.start_ts, stored.start_ts)
+    np.testing.assert_array_equal(columns.close, stored.close)
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import StreamMessage
+from trading_bot.market_data.binance_stream_manager import BinanceStreamManager
+from trading_bot.market_data.stream_recorder import StreamLogReader, StreamRecorder
+from tests.market_data.binance_stream_manager.test_binance_stream_manager import fake, _until  # noqa: F401
+
+
+def _frame(stream, i):
+    return json.dumps({"stream": stream, "data": {"i": i}}, separators=(",", ":"))
+
+
+# ---------------------------------------------------------------------------
+# 1) Segments compressés, rotation et relecture dans l'ordre
+# ---------------------------------------------------------------------------
+def test_record_rotate_and_read(tmp_path):
+    recorder = StreamRecorder(str(tmp_path), segment_bytes=200)
+    for i in range(20):
+        recorder.write(_frame("ethusdc@trade" if i % 2 else "ethusdc@depth5", i), ts=1_000 + i)
+    recorder.write('{"result":null,"id":1}', ts=5_000)
+    recorder.close()
+
+    segments = sorted(os.listdir(tmp_path))
+    assert recorder.segments == len(segments) > 1
+    assert all(name.endswith(".jsonl.gz") for name in segments)
+
+    frames = list(StreamLogReader(str(tmp_path)).frames())
+    assert [f["data"]["i"] for f in frames] == list(range(20))
+    assert [f["ts"] for f in frames] == [1_000 + i for i in range(20)]
+
+    trades = list(StreamLogReader(str(tmp_path)).frames(streams=["ethusdc@trade"]))
+    assert [f["data"]["i"] for f in trades] == list(range(1, 20, 2))
+
+
+def test_stream_filter_and_truncated_segment(tmp_path):
+    recorder = StreamRecorder(str(tmp_path), streams=["ethusdc@trade"])
+    for i in range(5):
+        recorder.write(_frame("ethusdc@trade", i).encode())
+        recorder.write(_frame("btcusdc@trade", i).encode())
+    recorder.close()
+
+    # Arrêt brutal : fin de segment tronquée
+    path = os.path.join(tmp_path, os.listdir(tmp_path)[0])
+    with open(path, "rb") as f:
+        content = f.read()
+    with open(path, "wb") as f:
+        f.write(content[:-12])
+
+    frames = list(StreamLogReader(str(tmp_path)).frames())
+    assert 0 < len(frames) <= 5
+    assert {f["stream"] for f in frames} == {"ethusdc@trade"}
+
+
+# ---------------------------------------------------------------------------
+# 2) Rejeu dans l'EventBus : topics et rythme accéléré
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_replay_into_event_bus(tmp_path):
+    recorder = StreamRecorder(str(tmp_path))
+    for i in range(4):
+        recorder.write(_frame("ethusdc@depth5@100ms", i), ts=i * 1_000)
+        recorder.write(_frame("ethusdc@trade", i), ts=i * 1_000 + 500)
+    recorder.close()
+
+    bus = EventBus()
+    depth = []
+
+    async def on_depth(event: StreamMessage):
+        depth.append(event)
+
+    bus.subscribe(StreamMessage, on_depth, topic=("ethusdc", "depth5"))
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    count = await StreamLogReader(str(tmp_path)).replay(bus, speed=100)
+    elapsed = loop.time() - start
+
+    assert count == 8
+    assert [e.data["i"] for e in depth] == [0, 1, 2, 3]
+    # 3.5 s enregistrées rejouées x100
+    assert 0.03 <= elapsed < 1.0
+    assert await StreamLogReader(str(tmp_path)).replay(bus, speed=None, streams=["ethusdc@trade"]) == 4
+
+
+# ---------------------------------------------------------------------------
+# 3) Branché sur le BinanceStreamManager : frames bruts, y compris klines non clôturées
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_recorder_attached_to_manager(fake, tmp_path):
+    recorder = StreamRecorder(str(tmp_path))
+    manager = BinanceStreamManager(url=fake.url, reconnect_delay=0.01)
+    manager.add_recorder(recorder)
+    received = []
+    manager.subscribe("ethusdc@kline_1m", received.append)
+    await _until(lambda: fake.connections)
+
+    await fake.push("ethusdc@kline_1m", {"e": "kline", "k": {"x": False}})
+    await fake.push("ethusdc@kline_1m", {"e": "kline", "k": {"x": True}})
+    await _until(lambda: received)
+    manager.unsubscribe("ethusdc@kline_1m", received.append)
+    recorder.close()
+
+    frames = list(StreamLogReader(str(tmp_path)).frames())
+    assert [f["data"]["k"]["x"] for f in frames] == [False, True]
+    assert len(received) == 1
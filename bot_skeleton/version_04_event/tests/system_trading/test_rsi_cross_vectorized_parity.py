@@ -0,0 +1,31 @@
+import pytest
+
+from trading_bot.trainer.backtest import Backtest
+
+
+# ---------------------------------------------------------------------------
+# Le fast-path vectorisé produit le même journal que le pipeline EventBus
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("atr_filter", [False, True])
+async def test_vectorized_matches_event_engine(regime_csv, rsi_cross_params, atr_filter):
+    params = rsi_cross_params(regime_csv, atr_filter)
+
+    event_stats, event_trades = await Backtest("rsi_cross_bot").execute(params)
+    vector_stats, vector_trades = await Backtest("rsi_cross_bot").execute(params, vectorized=True)
+
+    event_trades = event_trades.to_dict("records")
+    vector_trades = vector_trades.to_dict("records")
+
+    assert len(event_trades) > 5
+    assert len(vector_trades) == len(event_trades)
+
+    for expected, actual in zip(event_trades, vector_trades):
+        assert actual["side"] == expected["side"]
+        assert actual["target"] == expected["target"]
+        assert actual["open_timestamp"] == expected["open_timestamp"]
+        assert actual["close_timestamp"] == expected["close_timestamp"]
+        for key in ("entry_price", "exit_price", "tp", "sl", "size", "pnl"):
+            assert actual[key] == pytest.approx(expected[key])
+
+    assert vector_stats["s_total_profit"] == pytest.approx(event_stats["s_total_profit"])
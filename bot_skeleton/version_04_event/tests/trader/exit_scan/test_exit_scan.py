@@ -0,0 +1,131 @@
+import pytest
+import numpy as np
+from datetime import timedelta
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, TradeApproved, TradeClose
+from trading_bot.trader.trader_only_one_position import TraderOnlyOnePosition
+from trading_bot.trader import exit_scan
+from trading_bot.trader.exit_scan import (
+    scan_exits, OUTCOME_SKIPPED, OUTCOME_TP, OUTCOME_SL, OUTCOME_NOT_TRIGGERED, OUTCOME_OPEN
+)
+
+INTERVAL = 60
+
+
+def _signals(columns, seed=3, pct=0.5):
+    rng = np.random.default_rng(seed)
+    signal_idx = np.flatnonzero(rng.random(len(columns)) < 0.05)
+    sides = rng.choice(np.array([1, -1], dtype=np.int8), size=len(signal_idx))
+    entry = columns.close[signal_idx]
+    tp = np.where(sides > 0, entry * (1 + pct / 100), entry * (1 - pct / 100))
+    sl = np.where(sides > 0, entry * (1 - pct / 100), entry * (1 + pct / 100))
+    return signal_idx, sides, tp, sl
+
+
+def _scan(columns, signal_idx, sides, tp, sl):
+    end_ts = columns.start_ts + INTERVAL * 1000
+    return scan_exits(signal_idx, sides, tp, sl, columns.high, columns.low, columns.close, end_ts)
+
+
+# ---------------------------------------------------------------------------
+# 1) Mêmes sorties que TraderOnlyOnePosition sur le bus
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+async def test_scan_exits_matches_trader_only_one_position(random_walk):
+    columns = random_walk(2000, seed=7, sigma=0.3, interval=INTERVAL)
+    signal_idx, sides, tp, sl = _signals(columns)
+
+    bus = EventBus()
+    TraderOnlyOnePosition(bus)
+    closed = []
+
+    async def on_trade_close(event: TradeClose):
+        closed.append((event.candle_open.index, event.candle_close.index, event.target))
+
+    bus.subscribe(TradeClose, on_trade_close)
+
+    signals = {k: i for i, k in enumerate(signal_idx.tolist())}
+    for candle in columns.to_candles("ETHUSDC", INTERVAL):
+        await bus.publish(CandleClose(symbol="ETHUSDC", candle=candle))
+        i = signals.get(candle.index)
+        if i is not None:
+            await bus.publish(TradeApproved(
+                side="BUY" if sides[i] > 0 else "SELL",
+                size=1.0,
+                candle=candle,
+                tp=tp[i],
+                sl=sl[i]
+            ))
+
+    exit_idx, outcome = _scan(columns, signal_idx, sides, tp, sl)
+    resolved = np.flatnonzero((outcome == OUTCOME_TP) | (outcome == OUTCOME_SL))
+    expected = [
+        (int(signal_idx[i]), int(exit_idx[i]), "TP" if outcome[i] == OUTCOME_TP else "SL")
+        for i in resolved
+    ]
+
+    assert len(closed) > 10
+    assert expected == closed
+    assert np.count_nonzero(outcome == OUTCOME_SKIPPED) > 0
+
+
+# ---------------------------------------------------------------------------
+# 2) Cas particuliers : annulation N+1, cooldown, TP prioritaire, fin de données
+# ---------------------------------------------------------------------------
+def test_not_triggered_then_cooldown(random_walk):
+    columns = random_walk(10, interval=INTERVAL)
+    columns.high[:] = 101.0
+    columns.low[:] = 99.0
+    columns.close[:] = 100.0
+    columns.high[3] = 99.5  # bougie N+1 du signal 2 ne contient pas le prix d'entrée
+
+    # signal 2 annulé sur la bougie 3, signal 4 bloqué par le cooldown (2 min < 3 min)
+    signal_idx = np.array([2, 4, 6])
+    sides = np.array([1, 1, 1])
+    tp = np.array([100.5, 100.5, 100.5])
+    sl = np.array([90.0, 90.0, 90.0])
+
+    exit_idx, outcome = _scan(columns, signal_idx, sides, tp, sl)
+
+    assert outcome.tolist() == [OUTCOME_NOT_TRIGGERED, OUTCOME_SKIPPED, OUTCOME_TP]
+    assert exit_idx.tolist() == [3, -1, 7]
+
+
+def test_tp_has_priority_and_open_at_end(random_walk):
+    columns = random_walk(6, interval=INTERVAL)
+    columns.high[:] = 101.0
+    columns.low[:] = 99.0
+    columns.close[:] = 100.0
+
+    # TP et SL touchés sur la même bougie -> TP, puis un trade jamais résolu
+    signal_idx = np.array([0, 4])
+    sides = np.array([-1, 1])
+    tp = np.array([99.5, 200.0])
+    sl = np.array([100.5, 10.0])
+
+    exit_idx, outcome = _scan(columns, signal_idx, sides, tp, sl)
+
+    assert outcome.tolist() == [OUTCOME_TP, OUTCOME_OPEN]
+    assert exit_idx.tolist() == [1, -1]
+
+
+# ---------------------------------------------------------------------------
+# 3) Le noyau scalaire (compilé par numba) et le scan NumPy sont équivalents
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_loop_and_numpy_kernels_agree(random_walk, seed):
+    columns = random_walk(3000, seed=seed, sigma=0.3, interval=INTERVAL)
+    signal_idx, sides, tp, sl = _signals(columns, seed=seed, pct=2.0)
+    end_ts = columns.start_ts + INTERVAL * 1000
+    cooldown_ms = int(timedelta(minutes=3).total_seconds() * 1000)
+
+    results = []
+    for kernel in (exit_scan._scan_exits_loop, exit_scan._scan_exits_numpy):
+        exit_idx = np.full(len(signal_idx), -1, dtype=np.int64)
+        outcome = np.full(len(signal_idx), OUTCOME_SKIPPED, dtype=np.int8)
+        kernel(signal_idx, sides, tp, sl, columns.high, columns.low, columns.close, end_ts, cooldown_ms, exit_idx, outcome)
+        results.append((exit_idx, outcome))
+
+    np.testing.assert_array_equal(results[0][0], results[1][0])
+    np.testing.assert_array_equal(results[0][1], results[1][1])
@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from trading_bot.trainer.statistiques_engine import StatsEngine, StreamingStats
+
+
+# ---------------------------------------------------------------------------
+# 1) Les stats incrémentales sont identiques à une analyse complète StatsEngine
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_streaming_stats_match_stats_engine(seed):
+    rng = np.random.default_rng(seed)
+    pnls = rng.normal(0, 10, 200).tolist()
+
+    streaming = StreamingStats()
+    for i, pnl in enumerate(pnls, start=1):
+        streaming.update(pnl)
+
+        # Vérification ponctuelle (StatsEngine est en O(n) par appel)
+        if i in (1, 2, 10, 50, 200):
+            expected, _ = StatsEngine().analyze(df=pd.DataFrame({"pnl": pnls[:i]}))
+            actual = streaming.stats()
+            assert actual.keys() == expected.keys()
+            for key, value in expected.items():
+                assert actual[key] == pytest.approx(value), key
+
+
+def test_streaming_stats_empty():
+    expected, _ = StatsEngine().analyze(df=pd.DataFrame())
+    assert StreamingStats().stats() == pytest.approx(expected)
@@ -0,0 +1,51 @@
+import pytest
+
+from trading_bot.bots import BOTS_CONFIG
+from trading_bot.trainer import trainer as trainer_module
+from trading_bot.trainer.trainer import BotTrainer
+
+# tp_pct < sl_pct : aucune combinaison valide, seul le pool est créé
+EMPTY_GRID = {"trading_system": {"tp_pct": [0.01], "sl_pct": [0.02]}}
+
+
+class _RecordingExecutor:
+    created = []
+
+    def __init__(self, max_workers=None, **kwargs):
+        self.created.append((type(self).__name__, max_workers))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Process(_RecordingExecutor):
+    pass
+
+
+class _Thread(_RecordingExecutor):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# max_workers=None : nombre de CPU en mode process, THREAD_WORKERS en mode thread
+# ---------------------------------------------------------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode, max_workers, expected", [
+    ("process", None, ("_Process", 3)),
+    ("thread", None, ("_Thread", BotTrainer.THREAD_WORKERS)),
+    ("process", 2, ("_Process", 2)),
+    ("thread", 4, ("_Thread", 4)),
+])
+async def test_default_workers_per_mode(monkeypatch, mode, max_workers, expected):
+    monkeypatch.setattr(trainer_module, "ProcessPoolExecutor", _Process)
+    monkeypatch.setattr(trainer_module, "ThreadPoolExecutor", _Thread)
+    monkeypatch.setattr(trainer_module.os, "cpu_count", lambda: 3)
+    _RecordingExecutor.created.clear()
+
+    trainer = BotTrainer(next(iter(BOTS_CONFIG)))
+    await trainer.run(EMPTY_GRID, verbose=False, max_workers=max_workers, mode=mode)
+
+    assert _RecordingExecutor.created == [expected]
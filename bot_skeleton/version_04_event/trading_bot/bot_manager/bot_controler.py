@@ -9,10 +9,12 @@ from trading_bot.bots.bot import Bot
 class BotControler:
     _logger = Logger.get("BotControler")
 
-    def __init__(self, bot_type, bot_id="bot_01"):
+    def __init__(self, bot_type, bot_id="bot_01", metrics=False):
         self.bot_type = bot_type
         self.bot_id = bot_id
         self.bot = Bot(bot_type, bot_id)
+        if metrics:
+            self.bot.enable_metrics()
 
         self.backtest_lock = asyncio.Lock()
         self.train_lock = asyncio.Lock()
@@ -54,4 +56,8 @@ class BotControler:
     def get_candle_heartbeat(self):
         self._logger.info(f"Bot candle heartbeat asked")
         candle_heartbeat = self.bot.get_candle_heartbeat()
-        return candle_heartbeat
\ No newline at end of file
+        return candle_heartbeat
+
+    def get_metrics(self):
+        self._logger.info(f"Bot metrics asked")
+        return self.bot.get_metrics()
\ No newline at end of file
@@ -6,6 +6,7 @@ import aiohttp
 from aiohttp import web
 
 from trading_bot.bot_manager.bot_hanlder.bot_handler_backtest import BotHandlerBacktest
+from trading_bot.bot_manager.bot_hanlder.bot_handler_metrics import BotHandlerMetrics
 from trading_bot.bot_manager.bot_hanlder.bot_handler_start import BotHandlerStart
 from trading_bot.bot_manager.bot_hanlder.bot_handler_stats import BotHandlerStats
 from trading_bot.bot_manager.bot_hanlder.bot_handler_status import BotHandlerStatus
@@ -39,6 +40,7 @@ class HttpBotServer:
             web.post("/bot/train", BotHandlerTrain(self.bot_controler).execute),
             web.get("/bot/status", BotHandlerStatus(self.bot_controler).execute),
             web.get("/bot/stats", BotHandlerStats(self.bot_controler).execute),
+            web.get("/bot/metrics", BotHandlerMetrics(self.bot_controler).execute),
         ])
 
         self._runner = None
@@ -107,10 +109,11 @@ if __name__ == "__main__":
     parser.add_argument("--bot_type", default="sweep_bot")
     parser.add_argument("--host", default="127.0.0.1")
     parser.add_argument("--port", type=int, default=9101)
+    parser.add_argument("--metrics", action="store_true", help="Active les métriques de latence de l'EventBus")
     args = parser.parse_args()
 
     bot_id = f"{args.bot_type}_{args.port}"
-    bot_controler = BotControler(bot_type=args.bot_type, bot_id=bot_id)
+    bot_controler = BotControler(bot_type=args.bot_type, bot_id=bot_id, metrics=args.metrics)
     http_server = HttpBotServer(bot_controler=bot_controler, host=args.host ,port=args.port)
 
     async def main():
@@ -105,4 +105,7 @@ curl -X POST "http://127.0.0.1:9101/bot/train" \
       "tp_pct": [2,3],
       "sl_pct": [1,2]
   }
-}' | jq
\ No newline at end of file
+}' | jq
+/* ======================================= */
+/* Serveur lancé avec --metrics */
+curl -X GET "http://127.0.0.1:9101/bot/metrics" | jq
@@ -12,6 +12,8 @@ from trading_bot.core.logger import Logger
 
 from trading_bot.bots.engine.realtime_engine import RealTimeEngine
 from trading_bot.bots.engine.backtest_engine import BacktestEngine
+from trading_bot.bots.engine.vectorized_engine import VectorizedEngine
+from trading_bot.bots.engine.replay_engine import ReplayEngine
 from trading_bot.core.startable import Startable
 
 from trading_bot.trainer.statistiques_engine import *
@@ -63,13 +65,33 @@ class Bot(Startable):
         if self.is_running():
             raise Exception("Pas possible de changer le mode en cours d'execution !")
         self._mode = "backtest"
+        # Pas d'I/O en backtest : dispatch séquentiel, sans asyncio.gather
+        self._event_bus.sequential = True
         self.logger.info(f"Mode backtest positioné")
 
 
+    def set_replay_mode(self):
+        if self.is_running():
+            raise Exception("Pas possible de changer le mode en cours d'execution !")
+        self._mode = "replay"
+        # Replay synchrone : dispatch séquentiel obligatoire
+        self._event_bus.sequential = True
+        self.logger.info(f"Mode replay positioné")
+
+    def set_vectorized_mode(self):
+        if self.is_running():
+            raise Exception("Pas possible de changer le mode en cours d'execution !")
+        if "vectorized_system_class" not in self.config:
+            raise ValueError(f"Pas de backtest vectorisé pour le bot {self.bot_type}")
+        self._mode = "vectorized"
+        self.logger.info(f"Mode vectorized positioné")
+
+
     def set_realtime_mode(self):
         if self.is_running():
             raise Exception("Pas possible de changer le mode en cours d'execution !")
         self._mode = "realtime"
+        self._event_bus.sequential = False
         self.logger.info(f"Mode realtime positioné")
 
 
@@ -121,6 +143,18 @@ class Bot(Startable):
         )
         return stats, trades_list
     
+    def enable_metrics(self):
+        """Active l'instrumentation de l'EventBus (latences par événement / handler)."""
+        self._event_bus.enable_metrics()
+        self.logger.info(f"Métriques EventBus activées")
+
+    def get_metrics(self) -> dict | None:
+        """Snapshot des métriques EventBus, None si elles ne sont pas activées."""
+        metrics = self._event_bus.metrics
+        if metrics is None:
+            return None
+        return metrics.snapshot()
+
     def get_candle_heartbeat(self):    
         engine = self._engine
         if engine is None: raise RuntimeError("Engine non initialisé")   
@@ -135,6 +169,15 @@ class Bot(Startable):
     async def _on_start(self) -> list:
         self.logger.info("Demarrage Demandé.")
 
+        # Backtest vectorisé : pas d'EventBus, le system trading reçoit l'historique d'un bloc
+        if self._mode == "vectorized":
+            system_class = self.config["vectorized_system_class"]
+            self._system_trading = system_class(self._params)
+            self._engine = VectorizedEngine(self._system_trading, self._params)
+            await self._engine.start()
+            self.started_at = datetime.now(timezone.utc)
+            return self._system_trading.get_trades_journal()
+
         # on reinstalcie tout le System avec les paramétres en cours
         system_class = self.config["system_class"]
         self._system_trading = system_class(self._event_bus, self._params)
@@ -143,8 +186,10 @@ class Bot(Startable):
             self._engine = RealTimeEngine(self._event_bus, self._params)
         elif self._mode == "backtest":
             self._engine = BacktestEngine(self._event_bus, self._params)
+        elif self._mode == "replay":
+            self._engine = ReplayEngine(self._event_bus, self._params)
         else:
-            raise ValueError(f"Mode inconnu : {self._mode}. Valeurs acceptées : realtime, backtest.")
+            raise ValueError(f"Mode inconnu : {self._mode}. Valeurs acceptées : realtime, backtest, replay, vectorized.")
         
         await self._engine.start()
 
@@ -1,3 +1,4 @@
+import os
 from typing import override
 import pandas as pd
 
@@ -6,6 +7,7 @@ from trading_bot.core.logger import Logger
 
 from trading_bot.core.startable import Startable
 from trading_bot.market_data.candle_source_csv import CandleSourceCsv
+from trading_bot.market_data.candle_source_store import CandleSourceStore
 
 
 class BacktestEngine(Startable):
@@ -17,7 +19,21 @@ class BacktestEngine(Startable):
         self._event_bus =  event_bus
         self._params = params
 
-        self._candle_source = CandleSourceCsv(self._event_bus, self._params) 
+        source_class = self._source_class(self._params)
+        self._candle_source = source_class(self._event_bus, self._params)
+
+    @staticmethod
+    def _source_class(params: dict):
+        # path = répertoire -> CandleStore colonnaire, sinon fichier CSV
+        if os.path.isdir(params["path"]):
+            return CandleSourceStore
+        return CandleSourceCsv
+
+    @classmethod
+    def preload(cls, params: dict):
+        """Charge l'historique dans le CandleCache du process (ex: init d'un worker de BotTrainer)."""
+        source_class = cls._source_class(params)
+        source_class(EventBus(), params)._load_candles()
 
     @override
     async def _on_start(self):
@@ -21,8 +21,10 @@ class RealTimeEngine(Startable):
         self._params = params
 
         self._candle_source = CandleSourceBinance(self._event_bus, self._params) 
-        self._heartbeat = CandleHeartbeatMonitor(self._event_bus)
+        # Flux déclaré mort : rattrapage REST des bougies manquantes
+        self._heartbeat = CandleHeartbeatMonitor(self._event_bus, on_dead=self._candle_source.backfill)
         self._telegram_notifier = TelegramNotifier(self._event_bus, self._params) 
+        self._loop_monitor_task = None
 
     @override
     async def _on_start(self):
@@ -34,6 +36,10 @@ class RealTimeEngine(Startable):
         # Lancement du heartbeat candle
         await self._heartbeat.start()
 
+        # Mesure du retard de la boucle asyncio si les métriques sont activées
+        if self._event_bus.metrics is not None:
+            self._loop_monitor_task = asyncio.create_task(self._event_bus.metrics.monitor_event_loop())
+
         # Lancement du flux de candle via le websocket
         await self._candle_source.start()
 
@@ -44,5 +50,8 @@ class RealTimeEngine(Startable):
         self._candle_source.stop()
         self._telegram_notifier.stop()
         self._heartbeat.stop()
+        if self._loop_monitor_task:
+            self._loop_monitor_task.cancel()
+            self._loop_monitor_task = None
         # Ajouter code pour arrêter proprement le candle_source si nécessaire
 
@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import override
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import CandleClose, CandleHistoryReady
+from trading_bot.core.logger import Logger
+
+from trading_bot.core.startable import Startable
+from trading_bot.bots.engine.backtest_engine import BacktestEngine
+
+
+class ReplayEngine(Startable):
+    """
+    Backtest rejoué de façon synchrone : l'historique de warmup est publié en un
+    seul CandleHistoryReady puis chaque bougie en CandleClose via publish_sync,
+    sans tâche ni boucle asyncio. Le SystemTrading est le même qu'en backtest :
+    indicateurs et trader sont appelés par leurs entrées synchrones (<handler>_sync),
+    les autres handlers (moteurs de signal, risk manager, journal) restent des
+    coroutines menées à terme en un seul pas.
+    Mêmes découpages warmup / flux que les CandleSource de backtest.
+    """
+
+    logger = Logger.get("ReplayEngine")
+
+    def __init__(self, event_bus: EventBus, params: dict):
+        super().__init__()
+        self._event_bus = event_bus
+        self._event_bus.sequential = True
+        self._params = params
+
+        source_class = BacktestEngine._source_class(self._params)
+        self._candle_source = source_class(EventBus(), self._params)
+
+    def replay(self):
+        p = self._params
+        symbol = p["symbol"]
+        candles = self._candle_source._load_candles()
+
+        warmup_count = p["trading_system"]["warmup_count"]
+        if len(candles) <= warmup_count:
+            raise ValueError(f"[ReplayEngine] Pas assez de bougies : {len(candles)} <= warmup_count")
+
+        history = candles[:warmup_count] if warmup_count else list(candles)
+        columns = self._candle_source._load_columns().slice(0, len(history))
+        self.logger.info(f"Replay : {len(history)} bougies d'historique, {len(candles) - warmup_count} bougies")
+
+        publish = self._event_bus.publish_sync
+        publish(CandleHistoryReady(
+            symbol=symbol,
+            timestamp=datetime.now(),
+            period=p["interval"],
+            candles=history,
+            columns=columns
+        ))
+
+        for candle in candles[warmup_count:]:
+            if not self.is_running():
+                self.logger.info("Arrêt demandé — fin du replay.")
+                return
+            publish(CandleClose(symbol=symbol, candle=candle))
+
+    @override
+    async def _on_start(self):
+        self.logger.info("Démarrage demandé")
+        self.replay()
+
+    @override
+    def _on_stop(self):
+        self.logger.info("Arret demandé")
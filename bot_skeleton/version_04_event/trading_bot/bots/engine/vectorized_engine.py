@@ -0,0 +1,35 @@
+from typing import override
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.logger import Logger
+
+from trading_bot.core.startable import Startable
+from trading_bot.bots.engine.backtest_engine import BacktestEngine
+
+
+class VectorizedEngine(Startable):
+    """
+    Backtest sans EventBus : charge l'historique en colonnes (via le CandleCache)
+    et le passe d'un bloc au system trading vectorisé.
+    """
+
+    logger = Logger.get("VectorizedEngine")
+
+    def __init__(self, system_trading, params: dict):
+        super().__init__()
+        self._system_trading = system_trading
+        self._params = params
+
+        source_class = BacktestEngine._source_class(self._params)
+        self._candle_source = source_class(EventBus(), self._params)
+
+    @override
+    async def _on_start(self):
+        self.logger.info("Démarrage demandé")
+
+        columns = self._candle_source._load_columns()
+        self._system_trading.run(columns)
+
+    @override
+    def _on_stop(self):
+        self.logger.info("Arret demandé")
@@ -1,10 +1,12 @@
 from trading_bot.system_trading.rsi_cross_system_trading import RSICrossSystemTrading
+from trading_bot.system_trading.rsi_cross_vectorized_system_trading import RSICrossVectorizedSystemTrading
 
 BOT_NAME = "rsi_cross_bot"
 
 # --- Config globale par bot ---
 BOT_CONFIG = {
     "system_class": RSICrossSystemTrading,
+    "vectorized_system_class": RSICrossVectorizedSystemTrading,
     "default_parameters": {
         "path": "/home/xavier/Documents/gogs-repository/crypto/bot_skeleton/hitorique_binance/ETHUSDC_5m_historique_20250914_20251114.csv",
         "symbol": "ethusdc",
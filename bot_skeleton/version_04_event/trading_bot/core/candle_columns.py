@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from itertools import repeat
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from trading_bot.core.events import Candle
+
+
+@dataclass
+class CandleColumns:
+    """
+    Vue colonnaire d'une série de bougies : un tableau NumPy par champ,
+    tous alignés sur le même index.
+    Les timestamps sont des epoch en millisecondes (int64, ouverture de bougie).
+    """
+    start_ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    NAMES = ("start_ts", "open", "high", "low", "close", "volume")
+
+    def __len__(self) -> int:
+        return len(self.start_ts)
+
+    def slice(self, start: int | None = None, stop: int | None = None) -> "CandleColumns":
+        """Retourne une vue (sans copie) sur les bougies [start:stop]."""
+        return CandleColumns(*(getattr(self, name)[start:stop] for name in self.NAMES))
+
+    def merge(self, other: "CandleColumns") -> "CandleColumns":
+        """Union triée par start_ts, other prioritaire sur self pour un même timestamp."""
+        columns = [np.concatenate([getattr(self, name), getattr(other, name)]) for name in self.NAMES]
+        order = np.argsort(columns[0], kind="stable")
+        ts = columns[0][order]
+        keep = np.append(ts[1:] != ts[:-1], True)
+        return CandleColumns(*(c[order][keep] for c in columns))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.NAMES)
+
+    def to_candles(self, symbol: str, interval: int, start_index: int = 0) -> List[Candle]:
+        """
+        Matérialise les bougies (interval en secondes).
+        Les index sont numérotés à partir de start_index.
+        """
+        n = len(self)
+        # map + arguments positionnels : construction sans boucle Python ni kwargs par bougie
+        return list(map(
+            Candle,
+            range(start_index, start_index + n),
+            repeat(symbol, n),
+            repeat(interval, n),
+            self.open.tolist(),
+            self.high.tolist(),
+            self.low.tolist(),
+            self.close.tolist(),
+            self.volume.tolist(),
+            self.start_ts.tolist(),
+        ))
+
+    @classmethod
+    def from_candles(cls, candles: List[Candle]) -> "CandleColumns":
+        """Construit les colonnes depuis une liste de Candle."""
+        n = len(candles)
+        return cls(
+            start_ts=np.fromiter((c.start_ts for c in candles), dtype=np.int64, count=n),
+            open=np.fromiter((c.open for c in candles), dtype=np.float64, count=n),
+            high=np.fromiter((c.high for c in candles), dtype=np.float64, count=n),
+            low=np.fromiter((c.low for c in candles), dtype=np.float64, count=n),
+            close=np.fromiter((c.close for c in candles), dtype=np.float64, count=n),
+            volume=np.fromiter((c.volume for c in candles), dtype=np.float64, count=n),
+        )
+
+    @classmethod
+    def from_klines(cls, klines: list) -> "CandleColumns":
+        """Construit les colonnes depuis des klines REST Binance (format brut /api/v3/klines)."""
+        return cls(
+            start_ts=np.array([int(k[0]) for k in klines], dtype=np.int64),
+            open=np.array([float(k[1]) for k in klines], dtype=np.float64),
+            high=np.array([float(k[2]) for k in klines], dtype=np.float64),
+            low=np.array([float(k[3]) for k in klines], dtype=np.float64),
+            close=np.array([float(k[4]) for k in klines], dtype=np.float64),
+            volume=np.array([float(k[5]) for k in klines], dtype=np.float64),
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "CandleColumns":
+        """
+        Construit les colonnes depuis un DataFrame au format des CSV Binance
+        (colonne timestamp + open/high/low/close/volume).
+        """
+        # Conversion en bloc (format ISO 8601 connu : pas d'inférence ligne à ligne)
+        timestamps = pd.to_datetime(df["timestamp"], utc=True, format="ISO8601")
+        return cls(
+            start_ts=timestamps.dt.as_unit("ms").astype("int64").to_numpy(),
+            open=df["open"].to_numpy(dtype=np.float64),
+            high=df["high"].to_numpy(dtype=np.float64),
+            low=df["low"].to_numpy(dtype=np.float64),
+            close=df["close"].to_numpy(dtype=np.float64),
+            volume=df["volume"].to_numpy(dtype=np.float64),
+        )
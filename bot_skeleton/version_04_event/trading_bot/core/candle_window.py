@@ -0,0 +1,126 @@
+from typing import Iterable
+
+import numpy as np
+
+from trading_bot.core.events import Candle
+
+
+class CandleWindow:
+    """
+    Fenêtre glissante des N dernières bougies, stockée en colonnes NumPy
+    (ring buffer) pour les indicateurs qui ont besoin d'un historique de N barres.
+
+    Le buffer est doublé : chaque bougie est écrite aux positions i et i + N,
+    les colonnes sont donc toujours lisibles en ordre chronologique sous forme
+    de vue contiguë, sans copie.
+    Les vues retournées ne sont valides que jusqu'au prochain append().
+    """
+
+    FIELDS = ("index", "start_ts", "open", "high", "low", "close", "volume")
+
+    def __init__(self, maxlen: int):
+        if maxlen <= 0:
+            raise ValueError(f"[CandleWindow] maxlen doit être > 0 : {maxlen}")
+        self.maxlen = maxlen
+        self.symbol: str | None = None
+        self.interval: int | None = None
+
+        self._index = np.zeros(2 * maxlen, dtype=np.int64)
+        self._start_ts = np.zeros(2 * maxlen, dtype=np.int64)
+        self._open = np.zeros(2 * maxlen, dtype=np.float64)
+        self._high = np.zeros(2 * maxlen, dtype=np.float64)
+        self._low = np.zeros(2 * maxlen, dtype=np.float64)
+        self._close = np.zeros(2 * maxlen, dtype=np.float64)
+        self._volume = np.zeros(2 * maxlen, dtype=np.float64)
+
+        self._pos = 0    # prochaine position d'écriture dans [0, maxlen[
+        self._count = 0
+
+    # ------------------- Ecriture -------------------
+    def append(self, candle: Candle):
+        if self.symbol is None:
+            self.symbol = candle.symbol
+            self.interval = candle.interval
+
+        for i in (self._pos, self._pos + self.maxlen):
+            self._index[i] = candle.index
+            self._start_ts[i] = candle.start_ts
+            self._open[i] = candle.open
+            self._high[i] = candle.high
+            self._low[i] = candle.low
+            self._close[i] = candle.close
+            self._volume[i] = candle.volume
+
+        self._pos = (self._pos + 1) % self.maxlen
+        self._count = min(self._count + 1, self.maxlen)
+
+    def extend(self, candles: Iterable[Candle]):
+        for candle in candles:
+            self.append(candle)
+
+    def clear(self):
+        self._pos = 0
+        self._count = 0
+
+    # ------------------- Lecture -------------------
+    def __len__(self) -> int:
+        return self._count
+
+    def is_full(self) -> bool:
+        return self._count == self.maxlen
+
+    def _view(self, buffer: np.ndarray) -> np.ndarray:
+        if self._count < self.maxlen:
+            return buffer[:self._count]
+        return buffer[self._pos:self._pos + self.maxlen]
+
+    @property
+    def index(self) -> np.ndarray:
+        return self._view(self._index)
+
+    @property
+    def start_ts(self) -> np.ndarray:
+        return self._view(self._start_ts)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._view(self._open)
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._view(self._high)
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._view(self._low)
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._view(self._close)
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._view(self._volume)
+
+    def candle(self, i: int) -> Candle:
+        """Reconstruit la i-ème bougie de la fenêtre (index négatifs acceptés)."""
+        if not -self._count <= i < self._count:
+            raise IndexError(f"[CandleWindow] index hors fenêtre : {i} (len={self._count})")
+        if i < 0:
+            i += self._count
+        j = i if self._count < self.maxlen else self._pos + i
+
+        return Candle(
+            index=int(self._index[j]),
+            symbol=self.symbol,
+            interval=self.interval,
+            open=float(self._open[j]),
+            high=float(self._high[j]),
+            low=float(self._low[j]),
+            close=float(self._close[j]),
+            volume=float(self._volume[j]),
+            start_ts=int(self._start_ts[j])
+        )
+
+    def __getitem__(self, i: int) -> Candle:
+        return self.candle(i)
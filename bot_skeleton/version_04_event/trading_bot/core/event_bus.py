@@ -1,35 +1,215 @@
 # trading_bot/core/event_bus.py
 import asyncio
-from typing import Callable, Dict, List, Type
+import inspect
+import itertools
+import time
+from typing import Callable, Dict, Hashable, List, NamedTuple, Tuple, Type
 
 class Event:
     """Classe de base pour tous les événements."""
-    pass
+    # Pas de __dict__ imposé aux sous-classes slotted (Candle)
+    __slots__ = ()
+
+    # Sujet de l'événement (tuple hiérarchique, ex: ("RSI", 14)), None = pas de sujet
+    topic = None
+
+
+class Priority:
+    """
+    Priorités d'abonnement (valeur haute = appelé en premier).
+    En mode séquentiel elles reproduisent l'ordre obtenu avec asyncio.gather,
+    où les handlers d'un même événement démarrent avant les événements qu'ils publient.
+    """
+    TRADER = 100    # positions en cours résolues avant tout nouveau signal de la bougie
+    SIGNAL = 50     # moteurs évalués sur CandleClose avec l'état de la bougie précédente
+    FILTER = 10     # indicateurs lus par les filtres, à jour avant l'arrivée du signal
+    DEFAULT = 0
+
+
+class _Subscription(NamedTuple):
+    priority: int
+    seq: int
+    topic: Tuple | None
+    callback: Callable
+
+
+def _normalize_topic(topic) -> Tuple | None:
+    if topic is None or isinstance(topic, tuple):
+        return topic
+    return (topic,)
+
 
 class EventBus:
-    """Bus d'événements asynchrone (pub/sub)."""
-    
-    def __init__(self):
-        self._subscribers: Dict[Type[Event], List[Callable]] = {}
+    """
+    Bus d'événements asynchrone (pub/sub).
+
+    - subscribe(..., topic=...) : ne reçoit que les événements dont le topic commence
+      par ce préfixe (ex: ("RSI",) reçoit ("RSI", 14) et ("RSI", 21)).
+    - subscribe(..., priority=...) : les abonnés de priorité haute sont appelés en premier,
+      à priorité égale dans l'ordre d'abonnement.
+    - sequential=True : les abonnés sont attendus l'un après l'autre, sans asyncio.gather
+      (backtests : aucun handler ne fait d'I/O).
+    - les abonnés peuvent être des coroutines ou des fonctions simples (interface synchrone).
+    - publish_sync() : dispatch sans boucle asyncio (replay de backtest). Il appelle l'entrée
+      synchrone d'un handler quand elle existe (RSI.on_candle_close_sync pour RSI.on_candle_close),
+      sinon la coroutine est menée à terme en un seul pas et ne doit jamais se suspendre.
+    - enable_metrics() : chronométrage optionnel des publish et des abonnés (EventBusMetrics),
+      désactivé par défaut (un seul test sur self.metrics par publish).
+    - indicators : IndicatorRegistry dont le bus a acquis des indicateurs partagés (None sinon),
+      libérés par unsubscribe_all().
+    """
+
+    def __init__(self, sequential: bool = False):
+        self.sequential = sequential
+        self._subscribers: Dict[Type[Event], List[_Subscription]] = {}
+        # Liste d'appel résolue par (type, topic), invalidée à chaque (dés)abonnement
+        self._dispatch: Dict[Tuple[Type[Event], Hashable], List[Callable]] = {}
+        # Même liste en entrées synchrones (publish_sync)
+        self._dispatch_sync: Dict[Tuple[Type[Event], Hashable], List[Callable]] = {}
+        self._seq = itertools.count()
+        self.metrics = None
+        self.indicators = None
+
+    def enable_metrics(self):
+        """Active l'instrumentation (idempotent) et retourne l'objet EventBusMetrics."""
+        if self.metrics is None:
+            from trading_bot.core.metrics import EventBusMetrics
+            self.metrics = EventBusMetrics()
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
 
-    def subscribe(self, event_type: Type[Event], callback: Callable):
-        """S'abonner à un type d'événement."""
+    def subscribe(self, event_type: Type[Event], callback: Callable, topic: Hashable = None, priority: int = 0):
+        """S'abonner à un type d'événement (optionnellement à un topic)."""
         if event_type not in self._subscribers:
             self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        subscriptions = self._subscribers[event_type]
+        subscriptions.append(_Subscription(-priority, next(self._seq), _normalize_topic(topic), callback))
+        subscriptions.sort(key=lambda s: (s.priority, s.seq))
+        self._dispatch.clear()
+        self._dispatch_sync.clear()
+
+    def _callbacks(self, event_type: Type[Event], topic: Tuple | None) -> List[Callable]:
+        key = (event_type, topic)
+        callbacks = self._dispatch.get(key)
+        if callbacks is None:
+            callbacks = [
+                s.callback for s in self._subscribers.get(event_type, ())
+                if s.topic is None or (topic is not None and topic[:len(s.topic)] == s.topic)
+            ]
+            self._dispatch[key] = callbacks
+        return callbacks
 
     async def publish(self, event: Event):
         """Publie un événement et appelle tous les abonnés."""
+        callbacks = self._callbacks(type(event), event.topic)
+        if not callbacks:
+            return
+        if self.metrics is not None:
+            await self._publish_measured(event, callbacks)
+            return
+        if self.sequential:
+            for cb in callbacks:
+                result = cb(event)
+                if inspect.isawaitable(result):
+                    await result
+        else:
+            results = [cb(event) for cb in callbacks]
+            await asyncio.gather(*[r for r in results if inspect.isawaitable(r)])
+
+    async def _publish_measured(self, event: Event, callbacks: List[Callable]):
+        """Chemin instrumenté de publish : même ordre d'appel, durées enregistrées."""
+        metrics = self.metrics
         event_type = type(event)
-        if event_type in self._subscribers:
-             await asyncio.gather(*[cb(event) for cb in self._subscribers[event_type]])
+        start = time.perf_counter()
+        if self.sequential:
+            for cb in callbacks:
+                cb_start = time.perf_counter()
+                result = cb(event)
+                if inspect.isawaitable(result):
+                    await result
+                metrics.record_callback(event_type, cb, time.perf_counter() - cb_start)
+        else:
+            await asyncio.gather(*[self._measure(event, event_type, cb) for cb in callbacks])
+        metrics.record_event(event_type, time.perf_counter() - start)
+
+    async def _measure(self, event: Event, event_type: Type[Event], callback: Callable):
+        # Début pris au lancement du callback : n'inclut pas les callbacks exécutés avant lui
+        cb_start = time.perf_counter()
+        result = callback(event)
+        if inspect.isawaitable(result):
+            await result
+        self.metrics.record_callback(event_type, callback, time.perf_counter() - cb_start)
+
+    def publish_sync(self, event: Event):
+        """
+        Publie un événement sans boucle asyncio (ordre du mode séquentiel).
+        Lève RuntimeError si un handler se suspend (I/O réelle).
+        """
+        if not self.sequential:
+            raise RuntimeError("publish_sync nécessite un EventBus séquentiel")
+        key = (type(event), event.topic)
+        callbacks = self._dispatch_sync.get(key)
+        if callbacks is None:
+            callbacks = [sync_entry(cb) for cb in self._callbacks(*key)]
+            self._dispatch_sync[key] = callbacks
+        for cb in callbacks:
+            result = cb(event)
+            if inspect.iscoroutine(result):
+                _run_to_completion(result)
 
     def unsubscribe(self, event_type, callback):
         if event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+            subscriptions = self._subscribers[event_type]
+            for s in subscriptions:
+                if s.callback == callback:
+                    subscriptions.remove(s)
+                    break
+            self._dispatch.clear()
+        self._dispatch_sync.clear()
 
     def unsubscribe_all(self):
         """Désinscrit tous les abonnés sans supprimer les types d'événements."""
+        # Les indicateurs partagés ne sont plus relayés sur ce bus : références rendues au registre
+        if self.indicators is not None:
+            self.indicators.release_all(self)
+            self.indicators = None
         for event_type in self._subscribers:
-            self._subscribers[event_type].clear()
\ No newline at end of file
+            self._subscribers[event_type].clear()
+        self._dispatch.clear()
+        self._dispatch_sync.clear()
+
+
+def sync_entry(callback: Callable) -> Callable:
+    """
+    Entrée synchrone d'un handler pour publish_sync :
+    - callback.call_sync pour un objet appelable qui en fournit une (relais d'IndicatorRegistry),
+    - <handler>_sync sur l'instance d'une méthode liée (RSI.on_candle_close -> RSI.on_candle_close_sync),
+    - sinon le handler lui-même (fonction simple, ou coroutine menée à terme par publish_sync).
+    """
+    entry = getattr(callback, "call_sync", None)
+    if entry is None and inspect.ismethod(callback):
+        entry = getattr(callback.__self__, f"{callback.__name__}_sync", None)
+    return entry if entry is not None else callback
+
+
+def call_sync(callback: Callable, event: Event):
+    """Appelle un handler hors boucle asyncio, par son entrée synchrone si elle existe."""
+    result = sync_entry(callback)(event)
+    if inspect.iscoroutine(result):
+        return _run_to_completion(result)
+    return result
+
+
+def _run_to_completion(coro):
+    """Exécute en un seul send() une coroutine qui ne doit pas se suspendre (pas d'I/O, bus séquentiel)."""
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError(
+        f"[EventBus] publish_sync : le handler {coro.__qualname__} s'est suspendu (I/O ou await réel). "
+        f"Fournir une entrée synchrone <handler>_sync ou publier avec publish()."
+    )
@@ -1,15 +1,24 @@
 # trading_bot/core/events.py
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
 
 from trading_bot.core.time_frame import Timeframe
 from .event_bus import Event
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
+if TYPE_CHECKING:
+    from trading_bot.core.candle_columns import CandleColumns
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 # Une structure de type Chandelier
-@dataclass
+# Slotted + figée : une instance par bougie, partagée entre tous les composants.
+# Les timestamps sont des epoch ms (ouverture), les datetime sont construits à la demande.
+@dataclass(frozen=True, slots=True)
 class Candle(Event):
     index:int
     symbol: str
@@ -19,8 +28,19 @@ class Candle(Event):
     low: float
     close: float
     volume: float
-    start_time: datetime
-    end_time: datetime
+    start_ts: int # epoch ms (UTC)
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + self.interval * 1000
+
+    @property
+    def start_time(self) -> datetime:
+        return _EPOCH + timedelta(milliseconds=self.start_ts)
+
+    @property
+    def end_time(self) -> datetime:
+        return _EPOCH + timedelta(milliseconds=self.end_ts)
 
     def __str__(self):
         # Conversion UTC → Paris
@@ -53,6 +73,22 @@ class OrderBookUpdated(Event):
     bids: List[Tuple[float, float]]
     asks: List[Tuple[float, float]]
 
+# 📡 Message brut d'un stream websocket Binance (rejeu d'enregistrement)
+@dataclass
+class StreamMessage(Event):
+    """
+    stream : nom Binance (ex: "ethusdc@depth5@100ms"), ts : réception (epoch ms)
+    topic : stream découpé sur "@", ex: ("ethusdc", "depth5", "100ms")
+    """
+    stream: str
+    data: dict
+    ts: int
+    topic: tuple = None
+
+    def __post_init__(self):
+        if self.topic is None:
+            self.topic = tuple(self.stream.split("@"))
+
 # 📊 Support / résistance détectés
 @dataclass
 class SupportResistanceDetected(Event):
@@ -62,10 +98,18 @@ class SupportResistanceDetected(Event):
 # 📉 Indicateur technique généré
 @dataclass
 class IndicatorUpdated(Event):
-    """Événement publié lorsque les indicateurs sont recalculés."""
+    """
+    Événement publié lorsque les indicateurs sont recalculés.
+    topic : (type, paramètres...) ex: ("RSI", 14), par défaut (values["type"],)
+    """
     symbol: str
     candle: Candle
     values: dict 
+    topic: tuple = None
+
+    def __post_init__(self):
+        if self.topic is None:
+            self.topic = (self.values.get("type"),)
 
 # 📊 Signal de stratégie
 @dataclass
@@ -142,13 +186,76 @@ class CandleClose(Event):
     symbol: str
     candle: Candle
 
-# 
-@dataclass
+# Historique de warmup publié par les sources
 class CandleHistoryReady(Event):
-    symbol: str
-    timestamp: datetime
-    period: timedelta
-    candles: List[Candle]
+    """
+    Historique de warmup, sous deux formes construites l'une depuis l'autre à la demande :
+    - columns : CandleColumns fournies par la source (vues NumPy partagées, sans copie),
+    - candles : List[Candle], matérialisées au premier accès si seules les colonnes
+      sont fournies (index à partir de 0, interval déduit de period).
+    Les abonnés lisent de préférence column() / tail() / last_candle, qui ne parcourent
+    ni ne matérialisent tout l'historique.
+    """
+
+    def __init__(self, symbol: str, timestamp: datetime, period: str, candles: List[Candle] | None = None,
+                 columns: "CandleColumns | None" = None):
+        if candles is None and columns is None:
+            raise ValueError("[CandleHistoryReady] candles ou columns requis")
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.period = period
+        self._candles = candles
+        self._columns = columns
+
+    def __repr__(self):
+        return (f"CandleHistoryReady(symbol={self.symbol!r}, timestamp={self.timestamp!r}, "
+                f"period={self.period!r}, count={len(self)})")
+
+    def __len__(self) -> int:
+        return len(self._candles) if self._candles is not None else len(self._columns)
+
+    @property
+    def interval(self) -> int:
+        """Intervalle des bougies en secondes."""
+        return Timeframe.to_seconds(self.period)
+
+    @property
+    def candles(self) -> List[Candle]:
+        if self._candles is None:
+            self._candles = self._columns.to_candles(self.symbol, self.interval)
+        return self._candles
+
+    @property
+    def columns(self) -> "CandleColumns":
+        if self._columns is None:
+            from trading_bot.core.candle_columns import CandleColumns
+            self._columns = CandleColumns.from_candles(self._candles)
+        return self._columns
+
+    def column(self, name: str, last: int | None = None) -> np.ndarray:
+        """
+        Colonne name ("close", "high", "start_ts"...) des last dernières bougies :
+        vue sans copie si l'historique est colonnaire, sinon extraite des seules bougies lues.
+        """
+        if self._columns is not None:
+            values = getattr(self._columns, name)
+            return values[max(0, len(values) - last):] if last is not None else values
+        candles = self._candles[max(0, len(self._candles) - last):] if last is not None else self._candles
+        dtype = np.int64 if name in ("start_ts", "index") else np.float64
+        return np.fromiter((getattr(c, name) for c in candles), dtype=dtype, count=len(candles))
+
+    def tail(self, n: int) -> List[Candle]:
+        """Les n dernières bougies, seules matérialisées si l'historique est colonnaire."""
+        count = len(self)
+        n = min(n, count)
+        if self._candles is not None:
+            return self._candles[count - n:]
+        return self._columns.slice(count - n).to_candles(self.symbol, self.interval, start_index=count - n)
+
+    @property
+    def last_candle(self) -> Candle | None:
+        tail = self.tail(1)
+        return tail[0] if tail else None
 
 # ❌ Trade rejeté
 @dataclass
@@ -0,0 +1,131 @@
+import asyncio
+import bisect
+import time
+from typing import Callable, Dict
+
+from trading_bot.core.events import Candle
+
+
+class LatencyHistogram:
+    """
+    Histogramme de latences à buckets exponentiels (4 buckets par puissance de 2,
+    de 1 µs à ~2 min) : enregistrement en O(log n_buckets), mémoire constante.
+    Les percentiles sont approchés par la borne haute du bucket (~19 % de précision).
+    """
+
+    BOUNDS = [1e-6 * 2 ** (i / 4) for i in range(4 * 27)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return min(self.BOUNDS[i], self.max) if i < len(self.BOUNDS) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": (self.total / self.count) * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(0.50) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class EventBusMetrics:
+    """
+    Instrumentation optionnelle de l'EventBus (EventBus.enable_metrics()).
+    - events    : durée totale d'un publish par type d'événement
+    - callbacks : durée de chaque abonné, par instance (inclusive : contient les publish qu'il déclenche)
+    - latency   : candle_to_trader (réception de la bougie -> action du trader),
+                  candle_to_done (réception -> fin du traitement), event_loop_lag
+    """
+
+    def __init__(self):
+        self.events: Dict[str, LatencyHistogram] = {}
+        self.callbacks: Dict[str, LatencyHistogram] = {}
+        self.latency: Dict[str, LatencyHistogram] = {}
+
+        # (type d'événement, callback) -> histogramme, numéros d'instance par qualname
+        self._callback_histograms: Dict[tuple, LatencyHistogram] = {}
+        self._instances: Dict[str, Dict[int, int]] = {}
+
+        # Réception de la dernière bougie : (index, perf_counter)
+        self._candle_received = None
+
+    def _histogram(self, table: Dict[str, LatencyHistogram], name: str) -> LatencyHistogram:
+        histogram = table.get(name)
+        if histogram is None:
+            histogram = table[name] = LatencyHistogram()
+        return histogram
+
+    # ------------------- EventBus -------------------
+    def record_event(self, event_type: type, seconds: float):
+        self._histogram(self.events, event_type.__name__).record(seconds)
+
+    def record_callback(self, event_type: type, callback: Callable, seconds: float):
+        histogram = self._callback_histograms.get((event_type, callback))
+        if histogram is None:
+            name = f"{event_type.__name__}:{self._callback_name(callback)}"
+            histogram = self._callback_histograms[(event_type, callback)] = self._histogram(self.callbacks, name)
+        histogram.record(seconds)
+
+    def _callback_name(self, callback: Callable) -> str:
+        """
+        qualname du callback, suivi pour une méthode liée du numéro de son instance
+        (RSI.on_candle_close#1, RSI.on_candle_close#2 : RSI rapide et lent mesurés séparément).
+        """
+        name = getattr(callback, "__qualname__", repr(callback))
+        instance = getattr(callback, "__self__", None)
+        if instance is None:
+            return name
+        instances = self._instances.setdefault(name, {})
+        number = instances.setdefault(id(instance), len(instances) + 1)
+        return f"{name}#{number}"
+
+    # ------------------- Bout en bout -------------------
+    def candle_received(self, candle: Candle, received_at: float = None):
+        """Appelé par la source dès qu'une bougie clôturée arrive (received_at : perf_counter)."""
+        self._candle_received = (candle.index, time.perf_counter() if received_at is None else received_at)
+
+    def candle_done(self, candle: Candle):
+        """Appelé par la source une fois le CandleClose entièrement traité."""
+        if self._candle_received and self._candle_received[0] == candle.index:
+            self._histogram(self.latency, "candle_to_done").record(time.perf_counter() - self._candle_received[1])
+
+    def trader_acted(self, candle: Candle):
+        """Appelé par le trader quand il agit (ouverture, entrée, annulation, clôture)."""
+        if self._candle_received and self._candle_received[0] == candle.index:
+            self._histogram(self.latency, "candle_to_trader").record(time.perf_counter() - self._candle_received[1])
+
+    async def monitor_event_loop(self, interval: float = 0.5):
+        """Mesure en continu le retard de réveil de la boucle asyncio (à lancer en tâche)."""
+        histogram = self._histogram(self.latency, "event_loop_lag")
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            histogram.record(max(0.0, time.perf_counter() - start - interval))
+
+    def snapshot(self) -> dict:
+        return {
+            "events": {k: v.snapshot() for k, v in sorted(self.events.items())},
+            "callbacks": {k: v.snapshot() for k, v in sorted(self.callbacks.items())},
+            "latency": {k: v.snapshot() for k, v in sorted(self.latency.items())},
+        }
@@ -1,4 +1,5 @@
 import re
+from datetime import datetime, timezone
 
 class Timeframe:
     """
@@ -44,3 +45,19 @@ class Timeframe:
                 return f"{seconds // multiplier}{unit}"
 
         return f"{seconds}s"
+
+    @staticmethod
+    def to_epoch_ms(value: str | datetime | int | None) -> int | None:
+        """
+        Date -> epoch ms UTC (une date sans fuseau est en UTC)
+        Exemples :
+            "2024-01-01"                -> 1704067200000
+            "2024-01-01 12:00:00+02:00" -> 1704103200000
+        """
+        if value is None or isinstance(value, int):
+            return value
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
@@ -5,7 +5,7 @@ from trading_bot.core.events import (
     CandleHistoryReady,
     IndicatorUpdated,
 )
-from trading_bot.core.event_bus import EventBus
+from trading_bot.core.event_bus import EventBus, Priority
 
 from trading_bot.indicators.atr.atr_calculator import ATRCalculator
 
@@ -40,7 +40,7 @@ class Atr:
         self._initialized = False
 
         event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
-        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleClose, self.on_candle_close, priority=Priority.FILTER)
 
         self._logger.info(
             f"period={period} "
@@ -48,41 +48,73 @@ class Atr:
             f"exp_th={expansion_threshold}"
         )
 
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+
     # ------------------------------------------------------------------
     # Historique
     # ------------------------------------------------------------------
     async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
         self._logger.info("Initialisation ATR...")
 
         self.symbol = event.symbol.upper()
-        candles = event.candles
+        count = len(event)
 
-        if len(candles) < self.calculator.period:
+        if count < self.calculator.period:
             self._logger.warning(
-                f"Pas assez de données ({len(candles)}/{self.calculator.period})"
+                f"Pas assez de données ({count}/{self.calculator.period})"
             )
-            return
-
-        value = self.calculator.initialize(candles)
+            return None
+
+        # Seules les history_multiplier × period dernières bougies sont lues
+        last = self.calculator.period * self.calculator.history_multiplier
+        value = self.calculator.initialize_arrays(
+            event.column("high", last=last),
+            event.column("low", last=last),
+            event.column("close", last=last),
+        )
         if value is None:
-            return
+            return None
 
         self._initialized = True
 
-        await self._publish(candles[-1])
-
         self._logger.info(
             f"Initialisation terminée "
             f"ATR({self.calculator.period})={self.calculator.current_atr:.5f} "
             f"phase={self.calculator.market_phase()}"
         )
+        return self._updated(event.last_candle)
 
     # ------------------------------------------------------------------
     # Temps réel
     # ------------------------------------------------------------------
     async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
         if not self._initialized:
-            return
+            return None
 
         if event.symbol.upper() != self.symbol:
             raise ValueError(
@@ -94,24 +126,24 @@ class Atr:
         value = self.calculator.update(candle)
 
         if value is None:
-            return
+            return None
 
-        await self._publish(candle)
+        return self._updated(candle)
 
     # ------------------------------------------------------------------
     # Publication EventBus
     # ------------------------------------------------------------------
-    async def _publish(self, candle: Candle):
-        self._logger.debug(f"market_phase={self.calculator.market_phase()} - candle={candle}")
-        await self.event_bus.publish(IndicatorUpdated(
-                symbol=self.symbol,
-                candle=candle,
-                values={
-                    "type": self.__class__.__name__,
-                    "atr_value": self.calculator.current_atr,
-                    "atr_period": self.calculator.period,
-                    "market_phase": self.calculator.market_phase(),
-                    "is_ready": self.calculator.is_ready(),
-                },
-            )
+    def _updated(self, candle: Candle) -> IndicatorUpdated:
+        self._logger.debug(lambda: f"market_phase={self.calculator.market_phase()} - candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "atr_value": self.calculator.current_atr,
+                "atr_period": self.calculator.period,
+                "market_phase": self.calculator.market_phase(),
+                "is_ready": self.calculator.is_ready(),
+            },
+            topic=(self.__class__.__name__, self.calculator.period),
         )
@@ -67,35 +67,43 @@ class ATRCalculator:
             return None
 
         candles = candles[-self.period * self.history_multiplier :]
+        n = len(candles)
+        return self.initialize_arrays(
+            np.fromiter((c.high for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.low for c in candles), dtype=np.float64, count=n),
+            np.fromiter((c.close for c in candles), dtype=np.float64, count=n),
+        )
+
+    def initialize_arrays(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Optional[float]:
+        """
+        Comme initialize(), depuis des colonnes NumPy (seules les
+        history_multiplier × period dernières bougies sont lues).
+        """
+        if len(close) < self.period:
+            return None
+
+        start = -self.period * self.history_multiplier
+        high, low, close = high[start:], low[start:], close[start:]
 
         self.tr_values.clear()
         self.atr_values.clear()
-        self.previous_close = None
-        self.current_atr = None
-
-        tr_list: list[float] = []
 
-        # 1️⃣ Calcul des True Range
-        for candle in candles:
-            tr = self.compute_true_range(
-                candle.high,
-                candle.low,
-                candle.close
-            )
-            tr_list.append(tr)
+        # 1️⃣ True Range en un calcul vectoriel (la première bougie n'a pas de close précédent)
+        tr = high - low
+        previous_close = close[:-1]
+        tr[1:] = np.maximum.reduce([tr[1:], np.abs(high[1:] - previous_close), np.abs(low[1:] - previous_close)])
+        tr_list = tr.tolist()
+        self.previous_close = float(close[-1])
 
         # 2️⃣ Premier ATR = SMA(period)
-        if len(tr_list) < self.period:
-            return None
-
-        first_atr = float(np.mean(tr_list[: self.period]))
+        first_atr = float(np.mean(tr[: self.period]))
         self.current_atr = first_atr
         self.atr_values.append(first_atr)
 
-        # 3️⃣ Wilder smoothing
-        for tr in tr_list[self.period :]:
+        # 3️⃣ Wilder smoothing (au plus (history_multiplier - 1) × period pas)
+        for value in tr_list[self.period :]:
             self.current_atr = (
-                (self.current_atr * (self.period - 1)) + tr
+                (self.current_atr * (self.period - 1)) + value
             ) / self.period
             self.atr_values.append(self.current_atr)
 
@@ -26,7 +26,7 @@ class AtrFilter:
         self.market_phase = None
         self.candle_market_phase_update = None
 
-        event_bus.subscribe(IndicatorUpdated, self.on_indicator_update)
+        event_bus.subscribe(IndicatorUpdated, self.on_indicator_update, topic=("Atr",))
         event_bus.subscribe(TradeSignalGenerated, self.on_trade_signal_generated)
  
         self._logger.info(f" Initilisé ")
@@ -35,8 +35,6 @@ class AtrFilter:
     # Temps réel
     # ------------------------------------------------------------------
     async def on_indicator_update(self, event: IndicatorUpdated):
-        if event.values.get("type") != "Atr":
-            return
         self.market_phase = event.values["market_phase"]
         self.candle_market_phase_update = event.candle
 
@@ -0,0 +1,101 @@
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.core.event_bus import EventBus
+
+from trading_bot.indicators.moving_average.moving_average_calculator import IndicatorMovingAverageCalculator
+
+
+class AverageVolume:
+    """
+    Volume moyen sur les period dernières bougies (IndicatorAvgVolume de la v2).
+    Wrapper EventBus autour d'une SMA glissante des volumes.
+    """
+
+    _logger = Logger.get("AverageVolume")
+
+    def __init__(self, event_bus: EventBus, period: int = 14):
+        self.event_bus = event_bus
+        self.symbol = None
+
+        self.calculator = IndicatorMovingAverageCalculator(period, "SMA")
+        self._initialized = False
+
+        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
+
+        self._logger.info(f"period={period}")
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
+    # ------------------- Historique -------------------
+    async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
+        self._logger.info("Initialisation ...")
+
+        self.symbol = event.symbol.upper()
+        count = len(event)
+
+        if count < self.calculator.period:
+            self._logger.warning(f"Pas assez de données ({count}/{self.calculator.period})")
+            return None
+
+        value = self.calculator.initialize(event.column("volume", last=self.calculator.period))
+
+        last_candle = event.last_candle
+        self._initialized = True
+        update = self._updated(value, last_candle)
+
+        self._logger.info(f"Initialisation terminée {last_candle} volume moyen({self.calculator.period}) = {value:.5f}")
+        return update
+
+    # ------------------- Temps réel -------------------
+    async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
+        if not self._initialized:
+            return None
+        if event.symbol.upper() != self.symbol:
+            raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
+
+        candle = event.candle
+        value = self.calculator.update(candle.volume)
+        if value is None:
+            return None
+
+        return self._updated(value, candle)
+
+    # ------------------- Publication -------------------
+    def _updated(self, value: float, candle: Candle) -> IndicatorUpdated:
+        self._logger.debug(lambda: f" Volume moyen({self.calculator.period}) -> {value} | candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "avg_volume": value,
+                "avg_volume_period": self.calculator.period,
+            },
+            topic=(self.__class__.__name__, self.calculator.period),
+        )
@@ -0,0 +1,105 @@
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.core.event_bus import EventBus
+
+from trading_bot.indicators.bollinger_bands.bollinger_bands_calculator import BollingerBandsCalculator
+
+
+class BollingerBands:
+    """Wrapper EventBus autour du calculateur de bandes de Bollinger."""
+
+    _logger = Logger.get("BollingerBands")
+
+    def __init__(self, event_bus: EventBus, period: int = 20, num_std: float = 2.0):
+        self.event_bus = event_bus
+        self.symbol = None
+
+        self.calculator = BollingerBandsCalculator(period, num_std)
+        self._initialized = False
+
+        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
+
+        self._logger.info(f"period={period} num_std={num_std}")
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
+    # ------------------- Historique -------------------
+    async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
+        self._logger.info("Initialisation ...")
+
+        self.symbol = event.symbol.upper()
+        count = len(event)
+
+        if count < self.calculator.period:
+            self._logger.warning(f"Pas assez de données ({count}/{self.calculator.period})")
+            return None
+
+        self.calculator.initialize(event.column("close", last=self.calculator.period))
+
+        last_candle = event.last_candle
+        self._initialized = True
+        update = self._updated(last_candle)
+
+        self._logger.info(
+            f"Initialisation terminée {last_candle} "
+            f"BB({self.calculator.period}) = [{self.calculator.lower:.5f} / {self.calculator.upper:.5f}]"
+        )
+        return update
+
+    # ------------------- Temps réel -------------------
+    async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
+        if not self._initialized:
+            return None
+        if event.symbol.upper() != self.symbol:
+            raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
+
+        candle = event.candle
+        if self.calculator.update(candle.close) is None:
+            return None
+
+        return self._updated(candle)
+
+    # ------------------- Publication -------------------
+    def _updated(self, candle: Candle) -> IndicatorUpdated:
+        c = self.calculator
+        self._logger.debug(lambda: f" BB({c.period}) -> middle={c.middle} upper={c.upper} lower={c.lower} | candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "bb_middle": c.middle,
+                "bb_upper": c.upper,
+                "bb_lower": c.lower,
+                "bb_bandwidth": c.bandwidth(),
+                "bb_percent_b": c.percent_b(candle.close),
+                "bb_period": c.period,
+            },
+            topic=(self.__class__.__name__, c.period, c.num_std),
+        )
@@ -0,0 +1,94 @@
+import math
+from collections import deque
+from typing import Deque, Optional, Sequence
+
+import numpy as np
+
+
+class BollingerBandsCalculator:
+    """
+    Bandes de Bollinger sur les period dernières clôtures :
+    middle = SMA(period), upper / lower = middle ± num_std × écart-type (population).
+
+    Moyenne et somme des carrés des écarts (M2) sont tenues par Welford sur fenêtre
+    glissante : chaque update ajoute la nouvelle clôture et retire la plus ancienne en O(1),
+    sans la dérive numérique d'un calcul Σx² - (Σx)² / n.
+    """
+
+    def __init__(self, period: int = 20, num_std: float = 2.0):
+        if period < 2:
+            raise ValueError("period must be >= 2")
+
+        self.period = period
+        self.num_std = num_std
+        self.values: Deque[float] = deque(maxlen=period)
+
+        self.mean: Optional[float] = None
+        self._m2 = 0.0
+
+        self.middle: Optional[float] = None
+        self.upper: Optional[float] = None
+        self.lower: Optional[float] = None
+
+    # ------------------- Initialisation -------------------
+    def initialize(self, closes: Sequence[float] | np.ndarray) -> Optional[float]:
+        """
+        Initialise la fenêtre à partir d'une liste ou d'un tableau NumPy de clôtures
+        (seules les period dernières sont lues). Retourne la bande centrale.
+        """
+        if len(closes) < self.period:
+            return None
+
+        tail = np.asarray(closes[-self.period:], dtype=np.float64)
+        self.values = deque(tail.tolist(), maxlen=self.period)
+        self.mean = float(tail.mean())
+        self._m2 = float(np.square(tail - self.mean).sum())
+        return self._compute_bands()
+
+    # ------------------- Update -------------------
+    def update(self, close: float) -> Optional[float]:
+        values = self.values
+
+        if len(values) < self.period:
+            # Remplissage : Welford classique
+            values.append(close)
+            count = len(values)
+            mean = self.mean if self.mean is not None else 0.0
+            delta = close - mean
+            self.mean = mean + delta / count
+            self._m2 += delta * (close - self.mean)
+            if count < self.period:
+                return None
+            return self._compute_bands()
+
+        # Fenêtre pleine : la plus ancienne clôture est remplacée par la nouvelle
+        oldest = values[0]
+        values.append(close)
+        previous_mean = self.mean
+        self.mean = previous_mean + (close - oldest) / self.period
+        self._m2 += (close - oldest) * (close - self.mean + oldest - previous_mean)
+        return self._compute_bands()
+
+    # ------------------- Bandes -------------------
+    @property
+    def std(self) -> float:
+        return math.sqrt(max(self._m2, 0.0) / self.period)
+
+    def _compute_bands(self) -> float:
+        width = self.num_std * self.std
+        self.middle = self.mean
+        self.upper = self.mean + width
+        self.lower = self.mean - width
+        return self.middle
+
+    def bandwidth(self) -> Optional[float]:
+        """Largeur relative (upper - lower) / middle."""
+        if self.middle is None or self.middle == 0:
+            return None
+        return (self.upper - self.lower) / self.middle
+
+    def percent_b(self, close: float) -> Optional[float]:
+        """Position de close dans les bandes : 0 sur lower, 1 sur upper."""
+        if self.middle is None or self.upper == self.lower:
+            return None
+        return (close - self.lower) / (self.upper - self.lower)
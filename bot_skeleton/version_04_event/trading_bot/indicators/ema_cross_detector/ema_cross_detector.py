@@ -33,23 +33,35 @@ class EmaCrossDetector:
             slope_threshold=slope_threshold
         )
 
-        # On écoute tous les IndicatorUpdated
-        self.event_bus.subscribe(IndicatorUpdated, self.handle_indicator_updated)
+        # On écoute les EMA publiées par MovingAverage
+        self.event_bus.subscribe(IndicatorUpdated, self.handle_indicator_updated, topic=("MovingAverage", "EMA"))
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(IndicatorUpdated, self.handle_indicator_updated)
 
 
     # ----------------------------------------------------------------------
     async def handle_indicator_updated(self, event: IndicatorUpdated):
         """Réception d’un indicateur EMA fast/slow → test de cross."""
-        
-        if event.values.get("type") != "MovingAverage":
-            return
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def handle_indicator_updated_sync(self, event: IndicatorUpdated):
+        """Entrée synchrone de handle_indicator_updated (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: IndicatorUpdated) -> IndicatorUpdated | None:
         period = event.values.get("ema_period")
         value = event.values.get("ema_value")
         
         ts = datetime.now(timezone.utc)
 
         if period is None or value is None:
-            return
+            return None
 
         # ---------------------------
         # Identifier fast / slow EMA
@@ -63,15 +75,15 @@ class EmaCrossDetector:
             self.last_slow_update = ts
 
         else:
-            return  # EMA non concernée
+            return None  # EMA non concernée
 
 
         # Faut-il calculer ?
         if not self._both_ema_updated():
-            return
+            return None
 
         if not self._ema_updates_synchronized():
-            return
+            return None
 
         # ---------------------------
         # Application stratégie
@@ -80,24 +92,25 @@ class EmaCrossDetector:
  
         if signal:
             self._logger.debug(f"Signal détecté: {signal}")
-            await self._publish(signal, event.candle)
+            return self._updated(signal, event.candle)
 
-        return
+        return None
 
     # ------------------- Publication -------------------
-    async def _publish(self, signal: int,  candle: Candle):
-        await self.event_bus.publish(IndicatorUpdated(
-                    symbol=candle.symbol,
-                    candle=candle,
-                    values={
-                        "type": self.__class__.__name__,
-                        "signal": signal,
-                        "fast_value": self.fast_value,
-                        "fast_period": self.fast_period,
-                        "slow_value": self.slow_value,
-                        "slow_period": self.slow_period,
-                    },
-                ))
+    def _updated(self, signal: int,  candle: Candle) -> IndicatorUpdated:
+        return IndicatorUpdated(
+            symbol=candle.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "signal": signal,
+                "fast_value": self.fast_value,
+                "fast_period": self.fast_period,
+                "slow_value": self.slow_value,
+                "slow_period": self.slow_period,
+            },
+            topic=(self.__class__.__name__, self.fast_period, self.slow_period),
+        )
 
     # ----------------------------------------------------------------------
     def _both_ema_updated(self):
@@ -0,0 +1,242 @@
+import dataclasses
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Type, TypeVar
+
+from trading_bot.core.event_bus import Event, EventBus, call_sync
+from trading_bot.core.logger import Logger
+
+T = TypeVar("T")
+
+
+class _CaptureBus(EventBus):
+    """
+    Bus privé d'un indicateur partagé : il n'appelle personne, il retient les
+    abonnements de l'indicateur (relayés sur les bus des bots) et capture ce qu'il publie.
+    """
+
+    def __init__(self):
+        super().__init__(sequential=True)
+        self.outputs: List[Event] = []
+
+    async def publish(self, event: Event):
+        self.outputs.append(event)
+
+    def publish_sync(self, event: Event):
+        self.outputs.append(event)
+
+    def subscriptions(self):
+        """(type d'événement, topic, priorité, callback) dans l'ordre d'abonnement."""
+        for event_type, subscriptions in self._subscribers.items():
+            for s in subscriptions:
+                yield event_type, s.topic, -s.priority, s.callback
+
+
+class _Relay:
+    """
+    Abonnement d'un bus de bot vers le handler d'un indicateur partagé.
+    Porte le qualname / l'instance du handler : les métriques restent nommées comme lui.
+    """
+
+    def __init__(self, shared: "_SharedIndicator", event_bus: EventBus, callback):
+        self._shared = shared
+        self._event_bus = event_bus
+        self._callback = callback
+        self.__qualname__ = getattr(callback, "__qualname__", repr(callback))
+        self.__self__ = getattr(callback, "__self__", None)
+
+    async def __call__(self, event: Event):
+        outputs = await self._shared.run(self._callback, event)
+        candle = _event_candle(event)
+        for output in outputs:
+            await self._event_bus.publish(_rebind(output, candle))
+
+    def call_sync(self, event: Event):
+        """Entrée synchrone du relais (EventBus.publish_sync)."""
+        outputs = self._shared.run_sync(self._callback, event)
+        candle = _event_candle(event)
+        for output in outputs:
+            self._event_bus.publish_sync(_rebind(output, candle))
+
+
+class _SharedIndicator:
+    """
+    Indicateur partagé et ses consommateurs (un bus par bot).
+    Chaque bougie n'est calculée qu'une fois : les sorties sont gardées par
+    (topic, start_ts, close) de l'événement déclencheur et rejouées pour les autres bus.
+    """
+
+    _CACHE_SIZE = 64
+
+    def __init__(self, indicator_class: Type, params: dict):
+        self.bus = _CaptureBus()
+        self.indicator = indicator_class(self.bus, **params)
+        self.refcounts: Dict[int, int] = {}
+        self.relays: Dict[int, Tuple[EventBus, list]] = {}
+        self._outputs: OrderedDict = OrderedDict()
+
+    def attach(self, event_bus: EventBus):
+        if id(event_bus) not in self.relays:
+            relays = []
+            for event_type, topic, priority, callback in self.bus.subscriptions():
+                relay = _Relay(self, event_bus, callback)
+                event_bus.subscribe(event_type, relay, topic=topic, priority=priority)
+                relays.append((event_type, relay))
+            self.relays[id(event_bus)] = (event_bus, relays)
+            self.refcounts[id(event_bus)] = 0
+        self.refcounts[id(event_bus)] += 1
+
+    def detach(self, event_bus: EventBus, all_refs: bool = False) -> bool:
+        """Libère une (ou toutes les) références de event_bus. True si l'indicateur n'a plus de consommateur."""
+        self.refcounts[id(event_bus)] = 0 if all_refs else self.refcounts[id(event_bus)] - 1
+        if self.refcounts[id(event_bus)] == 0:
+            del self.refcounts[id(event_bus)]
+            _, relays = self.relays.pop(id(event_bus))
+            for event_type, relay in relays:
+                event_bus.unsubscribe(event_type, relay)
+        return not self.refcounts
+
+    @property
+    def refcount(self) -> int:
+        return sum(self.refcounts.values())
+
+    async def run(self, callback, event: Event) -> List[Event]:
+        """Sorties de callback(event), calculées au premier bus qui livre cet événement."""
+        key, outputs = self._cached(callback, event)
+        if outputs is None:
+            self.bus.outputs = outputs = []
+            result = callback(event)
+            if inspect.isawaitable(result):
+                await result  # ne se suspend pas : le bus privé ne fait que capturer
+            self._store(key, outputs)
+        return outputs
+
+    def run_sync(self, callback, event: Event) -> List[Event]:
+        """run() hors boucle asyncio, par l'entrée synchrone du handler."""
+        key, outputs = self._cached(callback, event)
+        if outputs is None:
+            self.bus.outputs = outputs = []
+            call_sync(callback, event)
+            self._store(key, outputs)
+        return outputs
+
+    def _cached(self, callback, event: Event):
+        candle = _event_candle(event)
+        if candle is None:
+            return None, None
+        # Historique terminé à la bougie T et clôture de T : même état de l'indicateur
+        key = (event.topic, candle.start_ts, candle.close)
+        return key, self._outputs.get(key)
+
+    def _store(self, key, outputs: List[Event]):
+        if key is None:
+            return
+        self._outputs[key] = outputs
+        if len(self._outputs) > self._CACHE_SIZE:
+            self._outputs.popitem(last=False)
+
+
+def _event_candle(event: Event):
+    """Bougie qui identifie l'événement : candle, ou dernière bougie d'un historique."""
+    candle = getattr(event, "candle", None)
+    if candle is None and hasattr(event, "last_candle"):
+        candle = event.last_candle
+    return candle
+
+
+def _rebind(output: Event, candle) -> Event:
+    """Sortie rejouée sur un autre bus : elle porte la bougie de ce bus (même start_ts, index propre)."""
+    output_candle = getattr(output, "candle", None)
+    if candle is None or output_candle is None or output_candle is candle or output_candle.start_ts != candle.start_ts:
+        return output
+    return dataclasses.replace(output, candle=candle)
+
+
+class IndicatorRegistry:
+    """
+    Registre des indicateurs partagés du process (IndicatorRegistry.shared()) :
+    un indicateur n'est instancié qu'une fois par (classe, paramètres, symbole, intervalle),
+    quel que soit le nombre de bots / systèmes qui le demandent.
+
+    Les paramètres sont normalisés avec les valeurs par défaut du constructeur :
+    acquire(bus, "ethusdc", "5m", RSI, period=14) et acquire(bus, "ETHUSDC", "5m", RSI, period=14, oversold=30.0)
+    partagent la même instance.
+
+    Chaque bot garde son EventBus : l'indicateur vit sur un bus privé et ses handlers
+    sont relayés sur le bus de chaque consommateur (même topic, même priorité).
+    Une bougie n'est calculée qu'une fois, ses IndicatorUpdated sont rejoués sur les autres bus.
+    Les bots qui partagent un indicateur suivent donc le même flux de bougies (même marché, temps réel).
+
+    acquire() / release() comptent les consommateurs. Au dernier release(),
+    l'indicateur est désabonné (close()). EventBus.unsubscribe_all() libère tout ce que le bus a acquis.
+
+    Une instance par thread : les backtests parallèles du trainer (une boucle asyncio
+    par thread, chacun à sa position dans l'historique) ne partagent pas leurs indicateurs.
+    """
+
+    _logger = Logger.get("IndicatorRegistry")
+    _local = threading.local()
+
+    def __init__(self):
+        self._indicators: Dict[Tuple, _SharedIndicator] = {}
+        self._keys: Dict[int, Tuple] = {}
+
+    @classmethod
+    def shared(cls) -> "IndicatorRegistry":
+        """Instance unique du process (une par thread)."""
+        registry = getattr(cls._local, "registry", None)
+        if registry is None:
+            registry = cls._local.registry = cls()
+        return registry
+
+    @staticmethod
+    def key(symbol: str, interval: str, indicator_class: Type, **params) -> Tuple:
+        """Clé normalisée (classe, paramètres triés avec leurs défauts, symbole, intervalle)."""
+        bound = inspect.signature(indicator_class).bind(None, **params)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]  # sans event_bus
+        return indicator_class, tuple(sorted(arguments)), symbol.upper(), interval
+
+    def acquire(self, event_bus: EventBus, symbol: str, interval: str, indicator_class: Type[T], **params) -> T:
+        """Instance partagée de indicator_class(**params) pour symbol / interval, relayée sur event_bus."""
+        key = self.key(symbol, interval, indicator_class, **params)
+        shared = self._indicators.get(key)
+        if shared is None:
+            shared = _SharedIndicator(indicator_class, params)
+            self._indicators[key] = shared
+            self._keys[id(shared.indicator)] = key
+        else:
+            self._logger.debug(lambda: f"{indicator_class.__name__}{dict(key[1])} {key[2]} {key[3]} partagé")
+        shared.attach(event_bus)
+        event_bus.indicators = self
+        return shared.indicator
+
+    def release(self, event_bus: EventBus, indicator):
+        """Libère une référence de event_bus, l'indicateur est désabonné au dernier consommateur."""
+        key = self._keys.get(id(indicator))
+        shared = self._indicators.get(key)
+        if shared is None or id(event_bus) not in shared.refcounts:
+            raise KeyError(f"[IndicatorRegistry] Indicateur inconnu pour ce bus : {indicator!r}")
+        if shared.detach(event_bus):
+            self._remove(key)
+
+    def release_all(self, event_bus: EventBus):
+        """Libère tous les indicateurs acquis par event_bus (arrêt du bot)."""
+        for key, shared in list(self._indicators.items()):
+            if id(event_bus) in shared.refcounts and shared.detach(event_bus, all_refs=True):
+                self._remove(key)
+
+    def _remove(self, key: Tuple):
+        shared = self._indicators.pop(key)
+        del self._keys[id(shared.indicator)]
+        shared.indicator.close()
+        self._logger.debug(lambda: f"{key[0].__name__}{dict(key[1])} {key[2]} {key[3]} libéré")
+
+    def refcount(self, indicator) -> int:
+        """Nombre de références, tous bus confondus."""
+        shared = self._indicators.get(self._keys.get(id(indicator)))
+        return shared.refcount if shared is not None else 0
+
+    def __len__(self) -> int:
+        return len(self._indicators)
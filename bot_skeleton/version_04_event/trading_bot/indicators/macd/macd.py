@@ -0,0 +1,103 @@
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.core.event_bus import EventBus
+
+from trading_bot.indicators.macd.macd_calculator import MACDCalculator
+
+
+class MACD:
+    """Wrapper EventBus autour du calculateur MACD."""
+
+    _logger = Logger.get("MACD")
+
+    def __init__(self, event_bus: EventBus, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.event_bus = event_bus
+        self.symbol = None
+
+        self.calculator = MACDCalculator(fast_period, slow_period, signal_period)
+        self._initialized = False
+
+        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
+
+        self._logger.info(f"fast={fast_period} slow={slow_period} signal={signal_period}")
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
+    # ------------------- Historique -------------------
+    async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
+        self._logger.info("Initialisation ...")
+
+        self.symbol = event.symbol.upper()
+        count = len(event)
+
+        if count < self.calculator.min_history:
+            self._logger.warning(f"Pas assez de données ({count}/{self.calculator.min_history})")
+            return None
+
+        # Les EMA dépendent de tout l'historique : colonne complète (vue sans copie)
+        self.calculator.initialize(event.column("close"))
+
+        last_candle = event.last_candle
+        self._initialized = True
+        update = self._updated(last_candle)
+
+        self._logger.info(
+            f"Initialisation terminée {last_candle} "
+            f"MACD = {self.calculator.macd:.5f} signal = {self.calculator.signal:.5f}"
+        )
+        return update
+
+    # ------------------- Temps réel -------------------
+    async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
+        if not self._initialized:
+            return None
+        if event.symbol.upper() != self.symbol:
+            raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
+
+        candle = event.candle
+        if self.calculator.update(candle.close) is None:
+            return None
+
+        return self._updated(candle)
+
+    # ------------------- Publication -------------------
+    def _updated(self, candle: Candle) -> IndicatorUpdated:
+        c = self.calculator
+        self._logger.debug(lambda: f" MACD -> macd={c.macd} signal={c.signal} histogram={c.histogram} | candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "macd_value": c.macd,
+                "macd_signal": c.signal,
+                "macd_histogram": c.histogram,
+            },
+            topic=(self.__class__.__name__, c.fast_period, c.slow_period, c.signal_period),
+        )
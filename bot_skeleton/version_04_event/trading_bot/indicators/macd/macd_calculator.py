@@ -0,0 +1,81 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class MACDCalculator:
+    """
+    MACD : macd = EMA(fast) - EMA(slow), signal = EMA(signal_period) du macd,
+    histogram = macd - signal.
+
+    Les EMA sont récursives (alpha = 2 / (period + 1), amorcées sur la première valeur,
+    comme ewm(span=period, adjust=False)) : update en O(1), initialize calcule les trois
+    séries en un passage vectoriel et ne garde que le dernier état.
+    """
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        if fast_period >= slow_period:
+            raise ValueError("fast_period must be < slow_period")
+
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+
+        self.fast_alpha = 2 / (fast_period + 1)
+        self.slow_alpha = 2 / (slow_period + 1)
+        self.signal_alpha = 2 / (signal_period + 1)
+
+        self.fast_ema: Optional[float] = None
+        self.slow_ema: Optional[float] = None
+
+        self.macd: Optional[float] = None
+        self.signal: Optional[float] = None
+        self.histogram: Optional[float] = None
+
+        self.count = 0
+
+    @property
+    def min_history(self) -> int:
+        """Bougies nécessaires avant de publier : EMA lente puis EMA du signal amorcées."""
+        return self.slow_period + self.signal_period - 1
+
+    # ------------------- Initialisation -------------------
+    def initialize(self, closes: Sequence[float] | np.ndarray) -> Optional[Tuple[float, float, float]]:
+        """Initialise les trois EMA sur toute la série de clôtures (liste ou tableau NumPy)."""
+        if len(closes) < self.min_history:
+            return None
+
+        series = pd.Series(np.asarray(closes, dtype=np.float64))
+        fast = series.ewm(span=self.fast_period, adjust=False).mean()
+        slow = series.ewm(span=self.slow_period, adjust=False).mean()
+        macd = fast - slow
+        signal = macd.ewm(span=self.signal_period, adjust=False).mean()
+
+        self.fast_ema = float(fast.iloc[-1])
+        self.slow_ema = float(slow.iloc[-1])
+        self.macd = float(macd.iloc[-1])
+        self.signal = float(signal.iloc[-1])
+        self.histogram = self.macd - self.signal
+        self.count = len(series)
+        return self.macd, self.signal, self.histogram
+
+    # ------------------- Update -------------------
+    def update(self, close: float) -> Optional[Tuple[float, float, float]]:
+        self.count += 1
+        if self.fast_ema is None:
+            self.fast_ema = self.slow_ema = close
+        else:
+            self.fast_ema += (close - self.fast_ema) * self.fast_alpha
+            self.slow_ema += (close - self.slow_ema) * self.slow_alpha
+
+        self.macd = self.fast_ema - self.slow_ema
+        if self.signal is None:
+            self.signal = self.macd
+        else:
+            self.signal += (self.macd - self.signal) * self.signal_alpha
+        self.histogram = self.macd - self.signal
+
+        if self.count < self.min_history:
+            return None
+        return self.macd, self.signal, self.histogram
@@ -0,0 +1,38 @@
+from collections import deque
+from typing import Any, Tuple
+
+
+class MonotonicDeque:
+    """
+    Extremum glissant en O(1) amorti : éléments (position, valeur, objet) de valeurs
+    décroissantes (maximum) ou croissantes (minimum) depuis la tête.
+    A valeur égale l'élément le plus ancien reste devant.
+    """
+
+    __slots__ = ("_items", "_maximum")
+
+    def __init__(self, maximum: bool):
+        self._items: deque = deque()
+        self._maximum = maximum
+
+    def push(self, position: int, value: float, item: Any = None):
+        items = self._items
+        if self._maximum:
+            while items and items[-1][1] < value:
+                items.pop()
+        else:
+            while items and items[-1][1] > value:
+                items.pop()
+        items.append((position, value, item))
+
+    def expire(self, oldest: int):
+        """Retire les éléments antérieurs à la position oldest."""
+        items = self._items
+        while items and items[0][0] < oldest:
+            items.popleft()
+
+    def front(self) -> Tuple[int, float, Any] | None:
+        return self._items[0] if self._items else None
+
+    def clear(self):
+        self._items.clear()
@@ -1,4 +1,5 @@
 from datetime import datetime
+
 from trading_bot.core.logger import Logger
 from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
 from trading_bot.core.event_bus import EventBus
@@ -23,53 +24,80 @@ class MovingAverage:
 
         self._logger.info(f"mode={mode} period={period}")
 
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
     # ------------------- Historique -------------------
     async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
         self._logger.info("Initialisation ...")
 
         self.symbol = event.symbol.upper()
-        candles = event.candles
+        count = len(event)
 
-        if len(candles) < self.calculator.period :
-            self._logger.warning(f"Pas assez de données ({len(candles)}/{self.calculator.period})")
-            return
+        if count < self.calculator.period :
+            self._logger.warning(f"Pas assez de données ({count}/{self.calculator.period})")
+            return None
         
-        closes = [c.close for c in candles]
-        value = self.calculator.initialize(closes)
+        # Seules les period dernières clôtures servent à l'initialisation
+        value = self.calculator.initialize(event.column("close", last=self.calculator.period))
 
+        last_candle = event.last_candle
         self._initialized = True
-        await self._publish(value, candles[-1])
 
         self._logger.info(
-            f"Initialisation Terminée {candles[-1]} "
+            f"Initialisation Terminée {last_candle} "
             f"{self.calculator.mode}({self.calculator.period}) = {value:.5f}"
         )
+        return self._updated(value, last_candle)
 
     # ------------------- Temps réel -------------------
     async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
         if not self._initialized:
-            return
+            return None
         if event.symbol.upper() != self.symbol:
             raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
         
         candle = event.candle
         value = self.calculator.update(candle.close)
         if value is None:
-            return
+            return None
 
-        await self._publish(value, candle)
+        return self._updated(value, candle)
 
     # ------------------- Publication -------------------
-    async def _publish(self, value: float, candle: Candle):
+    def _updated(self, value: float, candle: Candle) -> IndicatorUpdated:
         self._logger.debug(f" Nouvelle Valeur EMA({self.calculator.period}) = {self.calculator.current}")
-        await self.event_bus.publish(IndicatorUpdated(
-                symbol=self.symbol,
-                candle=candle,
-                values={
-                    "type": self.__class__.__name__,
-                    f"{self.calculator.mode.lower()}_value": value,
-                    f"{self.calculator.mode.lower()}_period": self.calculator.period,
-                }
-            )
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                f"{self.calculator.mode.lower()}_value": value,
+                f"{self.calculator.mode.lower()}_period": self.calculator.period,
+            },
+            topic=(self.__class__.__name__, self.calculator.mode, self.calculator.period),
         )
-
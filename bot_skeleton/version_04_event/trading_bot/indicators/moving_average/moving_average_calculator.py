@@ -1,6 +1,6 @@
 import numpy as np
 from collections import deque
-from typing import Optional, Deque
+from typing import Optional, Deque, Sequence
 
 from trading_bot.core.events import Candle
 
@@ -20,14 +20,16 @@ class IndicatorMovingAverageCalculator:
         self._sum = 0.0
         self.multiplier = 2 / (period + 1)
 
-    def initialize(self, closes: list[float]) -> Optional[float]:
+    def initialize(self, closes: Sequence[float] | np.ndarray) -> Optional[float]:
         """
-        Initialise la MA à partir d'une liste brute de valeurs.
+        Initialise la MA à partir d'une liste ou d'un tableau NumPy de valeurs
+        (seules les period dernières sont lues).
         """
         if len(closes) < self.period:
             return None
 
-        self.values = deque(closes[-self.period:], maxlen=self.period)
+        tail = np.asarray(closes[-self.period:], dtype=np.float64)
+        self.values = deque(tail.tolist(), maxlen=self.period)
 
         if self.mode == "SMA":
             self._sum = float(sum(self.values))
@@ -35,9 +37,9 @@ class IndicatorMovingAverageCalculator:
 
         else:  # EMA
             alpha = self.multiplier
-            weights = (1 - alpha) ** np.arange(len(self.values) - 1, -1, -1)
+            weights = (1 - alpha) ** np.arange(len(tail) - 1, -1, -1)
             weights /= weights.sum()
-            self.current = float(np.dot(self.values, weights))
+            self.current = float(np.dot(tail, weights))
 
         return self.current
 
@@ -0,0 +1,90 @@
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.core.event_bus import EventBus
+
+from trading_bot.indicators.obv.obv_calculator import OBVCalculator
+
+
+class OBV:
+    """Wrapper EventBus autour du calculateur On-Balance Volume."""
+
+    _logger = Logger.get("OBV")
+
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+        self.symbol = None
+
+        self.calculator = OBVCalculator()
+        self._initialized = False
+
+        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
+    # ------------------- Historique -------------------
+    async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
+        self._logger.info("Initialisation ...")
+
+        self.symbol = event.symbol.upper()
+        if not len(event):
+            self._logger.warning("Pas assez de données (0/1)")
+            return None
+
+        value = self.calculator.initialize(event.column("close"), event.column("volume"))
+
+        last_candle = event.last_candle
+        self._initialized = True
+        update = self._updated(last_candle)
+
+        self._logger.info(f"Initialisation terminée {last_candle} OBV = {value:.5f}")
+        return update
+
+    # ------------------- Temps réel -------------------
+    async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
+        if not self._initialized:
+            return None
+        if event.symbol.upper() != self.symbol:
+            raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
+
+        candle = event.candle
+        self.calculator.update(candle.close, candle.volume)
+        return self._updated(candle)
+
+    # ------------------- Publication -------------------
+    def _updated(self, candle: Candle) -> IndicatorUpdated:
+        self._logger.debug(lambda: f" OBV -> {self.calculator.current} | candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "obv_value": self.calculator.current,
+            },
+            topic=(self.__class__.__name__,),
+        )
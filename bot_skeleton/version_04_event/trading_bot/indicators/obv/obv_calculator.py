@@ -0,0 +1,39 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class OBVCalculator:
+    """
+    On-Balance Volume : le volume de la bougie est ajouté si la clôture monte,
+    retranché si elle baisse, ignoré si elle est inchangée. L'OBV part de 0
+    sur la première bougie de l'historique.
+    """
+
+    def __init__(self):
+        self.prev_close: Optional[float] = None
+        self.current: Optional[float] = None
+
+    # ------------------- Initialisation -------------------
+    def initialize(self, closes: Sequence[float] | np.ndarray,
+                   volumes: Sequence[float] | np.ndarray) -> Optional[float]:
+        """Initialise sur tout l'historique (listes ou tableaux NumPy) en un passage vectoriel."""
+        if len(closes) == 0:
+            return None
+
+        closes = np.asarray(closes, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        self.current = float(np.dot(np.sign(np.diff(closes)), volumes[1:]))
+        self.prev_close = float(closes[-1])
+        return self.current
+
+    # ------------------- Update -------------------
+    def update(self, close: float, volume: float) -> float:
+        if self.prev_close is None:
+            self.current = 0.0
+        elif close > self.prev_close:
+            self.current += volume
+        elif close < self.prev_close:
+            self.current -= volume
+        self.prev_close = close
+        return self.current
@@ -27,34 +27,62 @@ class RSI:
 
         self._logger.info(f"RSI period={period} - [{oversold}/{overbought}]")
 
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
     # ------------------- Historique -------------------
     async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
         self._logger.info("Initialisation RSI ...")
 
         self.symbol = event.symbol.upper()
-        candles = event.candles
+        count = len(event)
 
-        if len(candles) < self.calculator.period + 1:
+        if count < self.calculator.period + 1:
             self._logger.warning(
-                f"Pas assez de données ({len(candles)}/{self.calculator.period + 1})"
+                f"Pas assez de données ({count}/{self.calculator.period + 1})"
             )
-            return
+            return None
 
-        closes = [c.close for c in candles]
-        value, state = self.calculator.initialize(closes)
+        # Seules les period + 1 dernières clôtures servent à l'initialisation
+        value, state = self.calculator.initialize(event.column("close", last=self.calculator.period + 1))
 
+        last_candle = event.last_candle
         self._initialized = True
-        await self._publish(value, state, candles[-1])
 
         self._logger.info(
-            f"Initialisation terminée {candles[-1]} "
+            f"Initialisation terminée {last_candle} "
             f"RSI({self.calculator.period}) = {value:.2f}"
         )
+        return self._updated(value, state, last_candle)
 
     # ------------------- Temps réel -------------------
     async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
         if not self._initialized:
-            return
+            return None
 
         if event.symbol.upper() != self.symbol:
             raise ValueError(
@@ -63,26 +91,26 @@ class RSI:
 
         candle = event.candle
         value, state = self.calculator.update(candle.close)
-        self._logger.debug(f" RSI({self.calculator.period}) -> Nouvelle valeur : value={value} | state={state} | candle={candle}")
+        # lambda : la bougie n'est formatée que si le debug est actif
+        self._logger.debug(lambda: f" RSI({self.calculator.period}) -> Nouvelle valeur : value={value} | state={state} | candle={candle}")
 
         if value is None:
-            return
+            return None
 
-        await self._publish(value, state, candle)
+        return self._updated(value, state, candle)
 
     # ------------------- Publication -------------------
-    async def _publish(self, value: float, state:str, candle: Candle):
-        await self.event_bus.publish(
-            IndicatorUpdated(
-                symbol=self.symbol,
-                candle=candle,
-                values={
-                    "type": self.__class__.__name__,
-                    "rsi_value": value,
-                    "rsi_state": state,
-                    "rsi_period": self.calculator.period,
-                    "rsi_is_oversold": self.calculator.is_overbought(),
-                    "rsi_is_overbought": self.calculator.is_oversold(),
-                },
-            )
+    def _updated(self, value: float, state:str, candle: Candle) -> IndicatorUpdated:
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "rsi_value": value,
+                "rsi_state": state,
+                "rsi_period": self.calculator.period,
+                "rsi_is_oversold": self.calculator.is_overbought(),
+                "rsi_is_overbought": self.calculator.is_oversold(),
+            },
+            topic=(self.__class__.__name__, self.calculator.period),
         )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 from collections import deque
 import numpy as np
 
@@ -35,20 +35,20 @@ class IndicatorRSICalculator:
         self.losses = deque(maxlen=period)
 
     # ------------------- Initialisation -------------------
-    def initialize(self, closes: list[float]) -> Optional[float]:
+    def initialize(self, closes: Sequence[float] | np.ndarray) -> Optional[float]:
+        """
+        Initialise les moyennes sur les period dernières variations
+        (liste ou tableau NumPy de closes, seule la fin est lue).
+        """
         if len(closes) < self.period + 1:
             return None
 
-        gains, losses = [], []
+        tail = np.asarray(closes[-(self.period + 1):], dtype=np.float64)
+        deltas = np.diff(tail)
 
-        for i in range(-self.period, 0):
-            delta = closes[i] - closes[i - 1]
-            gains.append(max(delta, 0.0))
-            losses.append(max(-delta, 0.0))
-
-        self.avg_gain = float(np.mean(gains))
-        self.avg_loss = float(np.mean(losses))
-        self.prev_close = closes[-1]
+        self.avg_gain = float(np.maximum(deltas, 0.0).mean())
+        self.avg_loss = float(np.maximum(-deltas, 0.0).mean())
+        self.prev_close = float(tail[-1])
 
         self.current = self._compute_rsi()
         self.state = self._compute_state(self.current)
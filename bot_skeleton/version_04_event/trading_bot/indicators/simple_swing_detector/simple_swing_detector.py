@@ -1,18 +1,18 @@
-from collections import deque
-from typing import Deque, Optional, List, override
+from typing import Optional, List, override
 from datetime import datetime
-import numpy as np
 import json
 
 from trading_bot.core.logger import Logger
 from trading_bot.core.event_bus import EventBus
 from trading_bot.core.events import CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.indicators.simple_swing_detector.swing_calculator import SwingCalculator
 
 
 class SimpleSwingDetector():
     """
     Détecte les swings highs/lows sur une fenêtre historique de N bougies.
     Conserve le max swing high et le min swing low dans cette fenêtre.
+    Calcul incrémental (SwingCalculator) : O(1) amorti par bougie quel que soit swing_window.
     """
     _logger = Logger.get("IndicatorSimpleSwingDetector")
 
@@ -21,7 +21,8 @@ class SimpleSwingDetector():
         self.event_bus = event_bus
         self.swing_side = swing_side
         self.swing_window = swing_window
-        self.candles = deque(maxlen=swing_window)
+        self.calculator = SwingCalculator(side=swing_side, window=swing_window)
+        self.last_candle = None
         self.symbol = None
 
         self.max_swing_high = None
@@ -34,85 +35,99 @@ class SimpleSwingDetector():
 
         self._logger.info(f"Démarré avec swing_side={self.swing_side} swing_window={self.swing_window}")
 
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleHistoryReady, self._on_history_ready)
+        self.event_bus.unsubscribe(CandleClose, self._on_candle_close)
+
 
     # =====================================================
     # Initialisation avec l'historique
     # =====================================================
     async def _on_history_ready(self, event: CandleHistoryReady):
+        if self._initialize(event):
+            await self.execute()
+
+    def _on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de _on_history_ready (EventBus.publish_sync)."""
+        if self._initialize(event):
+            self.execute_sync()
+
+    def _initialize(self, event: CandleHistoryReady) -> bool:
         self._logger.info(f"Initialisation ...")
-        if not event.candles:
-            return
-        if len(event.candles) < self.candles.maxlen:
+        if not len(event):
+            return False
+        if len(event) < self.swing_window:
             raise Exception(f"[IndicatorSimpleSwingDetector] pas suffisament de bougie pour initilisé l'indicateur - "
-                            f"swing_window={self.swing_window} > event.candles.len={len(event.candles)}")
+                            f"swing_window={self.swing_window} > event.candles.len={len(event)}")
 
         self.symbol = event.symbol.upper()
-        for c in event.candles[-self.candles.maxlen:]:
-            self.candles.append(c)
+        self.calculator.reset()
+        # Seules les swing_window dernières bougies sont matérialisées
+        window = event.tail(self.swing_window)
+        for candle in window:
+            self.calculator.update(candle)
+        self.last_candle = window[-1]
         
         self._logger.info(f"Initialisation terminée ({self.swing_window})")
         # print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [IndicatorSimpleSwingDetector] Première bougie: {self.candles[0]} ")
         # print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [IndicatorSimpleSwingDetector] Dernière bougie: {self.candles[-1]}")
-
-        await self.execute()
+        return True
 
     # =====================================================
     # Temps réel
     # =====================================================
     async def _on_candle_close(self, event: CandleClose):
+        if self._update(event):
+            await self.execute()
+
+    def _on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de _on_candle_close (EventBus.publish_sync)."""
+        if self._update(event):
+            self.execute_sync()
+
+    def _update(self, event: CandleClose) -> bool:
         if event.symbol.upper() != self.symbol:
-            return
+            return False
         
-        self.candles.append(event.candle)
-        await self.execute()
+        self.calculator.update(event.candle)
+        self.last_candle = event.candle
+        return True
 
     # =====================================================
     # Calculs internes
     # =====================================================
     def _find_swings(self):
         """
-        Identifie, dans tout l'historique self.candles, 
-        le swing high le plus haut et le swing low le plus bas.
+        Swing high le plus haut et swing low le plus bas de la fenêtre.
         Retourne (max_swing_high, min_swing_low).
         """
-        candles = list(self.candles)
-        n = self.swing_side
-
-        swing_high = None
-        swing_low = None
-
-        # Parcours des bougies avec une marge avant/après pour analyser les swings
-        for i in range(n, len(candles) - n):
-
-            c = candles[i]
-            window = candles[i - n : i + n + 1]
-
-            # --- Swing High ---
-            if c.high == max(x.high for x in window):
-                if swing_high is None or c.high > swing_high.high:
-                    swing_high = c
-
-            # --- Swing Low ---
-            if c.low == min(x.low for x in window):
-                if swing_low is None or c.low < swing_low.low:
-                    swing_low = c
-
-        return swing_high, swing_low
+        if self.calculator.count < 2 * self.swing_side + 1:
+            return None, None
+        return self.calculator.max_swing_high, self.calculator.min_swing_low
 
     
     async def execute(self):
-        
-        candles = list(self.candles)
+        update = self._swings_updated()
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def execute_sync(self):
+        update = self._swings_updated()
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _swings_updated(self) -> IndicatorUpdated | None:
 
         new_high, new_low = self._find_swings()
 
         # Si on ne trouve rien, on ne publie rien
         if new_high is None or new_low is None:
-            return
+            return None
 
         # Si rien n'a changé, on arrête
         if new_high == self.prev_max and new_low == self.prev_min:
-            return
+            return None
 
         # MàJ
         self.prev_max = self.max_swing_high = new_high
@@ -124,18 +139,17 @@ class SimpleSwingDetector():
         #       )
 
         # compute highest/lowest of history window
-        window_high = max(c.high for c in candles)
-        window_low = min(c.low for c in candles)
-
-        await self.event_bus.publish(IndicatorUpdated(
-                symbol=self.symbol,
-                candle=self.candles[-1],
-                values={
-                    "type": self.__class__.__name__,
-                    "last_swing_high": new_high,
-                    "last_swing_low": new_low,
-                    "window_high": window_high,
-                    "window_low": window_low
-                }
-            )
+        window_high = self.calculator.window_high
+        window_low = self.calculator.window_low
+
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=self.last_candle,
+            values={
+                "type": self.__class__.__name__,
+                "last_swing_high": new_high,
+                "last_swing_low": new_low,
+                "window_high": window_high,
+                "window_low": window_low
+            }
         )
@@ -0,0 +1,88 @@
+from collections import deque
+
+from trading_bot.core.events import Candle
+from trading_bot.indicators.monotonic_deque import MonotonicDeque
+
+
+class SwingCalculator:
+    """
+    Swings sur les swing_window dernières bougies, mis à jour en O(1) amorti par bougie.
+
+    Une bougie est un swing high (low) si son high (low) est l'extrême des bougies
+    [i - side, i + side], toutes dans la fenêtre. Le pivot est confirmé side bougies
+    après son apparition et reste valable tant que sa bougie i - side est dans la fenêtre.
+    max_swing_high / min_swing_low : swing le plus haut / le plus bas encore valable
+    (le plus ancien en cas d'égalité), window_high / window_low : extrêmes de la fenêtre.
+    """
+
+    def __init__(self, side: int = 2, window: int = 21):
+        self.side = side
+        self.window = window
+
+        self._local_high = MonotonicDeque(maximum=True)    # fenêtre 2 * side + 1
+        self._local_low = MonotonicDeque(maximum=False)
+        self._window_high = MonotonicDeque(maximum=True)   # fenêtre swing_window
+        self._window_low = MonotonicDeque(maximum=False)
+        self._swing_highs = MonotonicDeque(maximum=True)   # pivots confirmés
+        self._swing_lows = MonotonicDeque(maximum=False)
+        self._recent: deque = deque(maxlen=side + 1)      # candidats en attente de confirmation
+
+        self._t = -1      # position de la dernière bougie
+        self.count = 0    # bougies reçues depuis reset()
+
+    def reset(self):
+        for d in (self._local_high, self._local_low, self._window_high, self._window_low,
+                  self._swing_highs, self._swing_lows):
+            d.clear()
+        self._recent.clear()
+        self._t = -1
+        self.count = 0
+
+    def update(self, candle: Candle):
+        t = self._t = self._t + 1
+        self.count += 1
+        n = self.side
+
+        self._recent.append(candle)
+        self._local_high.push(t, candle.high)
+        self._local_low.push(t, candle.low)
+        self._local_high.expire(t - 2 * n)
+        self._local_low.expire(t - 2 * n)
+
+        self._window_high.push(t, candle.high)
+        self._window_low.push(t, candle.low)
+        self._window_high.expire(t - self.window + 1)
+        self._window_low.expire(t - self.window + 1)
+
+        # Confirmation du pivot t - side, dont les 2 * side voisins sont connus
+        if self.count >= 2 * n + 1:
+            pivot = self._recent[0]
+            if pivot.high == self._local_high.front()[1]:
+                self._swing_highs.push(t - n, pivot.high, pivot)
+            if pivot.low == self._local_low.front()[1]:
+                self._swing_lows.push(t - n, pivot.low, pivot)
+
+        # Pivot j valable tant que j - side est dans la fenêtre
+        self._swing_highs.expire(t - self.window + 1 + n)
+        self._swing_lows.expire(t - self.window + 1 + n)
+
+    # ------------------- Lecture -------------------
+    @property
+    def max_swing_high(self) -> Candle | None:
+        front = self._swing_highs.front()
+        return front[2] if front else None
+
+    @property
+    def min_swing_low(self) -> Candle | None:
+        front = self._swing_lows.front()
+        return front[2] if front else None
+
+    @property
+    def window_high(self) -> float | None:
+        front = self._window_high.front()
+        return front[1] if front else None
+
+    @property
+    def window_low(self) -> float | None:
+        front = self._window_low.front()
+        return front[1] if front else None
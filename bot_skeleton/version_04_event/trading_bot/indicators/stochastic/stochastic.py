@@ -0,0 +1,111 @@
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.core.event_bus import EventBus
+
+from trading_bot.indicators.stochastic.stochastic_calculator import StochasticCalculator
+
+
+class Stochastic:
+    """Wrapper EventBus autour du calculateur stochastique."""
+
+    _logger = Logger.get("Stochastic")
+
+    def __init__(self, event_bus: EventBus, k_period: int = 14, d_period: int = 3,
+                 oversold: float = 20.0, overbought: float = 80.0):
+        self.event_bus = event_bus
+        self.symbol = None
+
+        self.calculator = StochasticCalculator(k_period, d_period)
+        self.oversold = oversold
+        self.overbought = overbought
+        self._initialized = False
+
+        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
+
+        self._logger.info(f"k_period={k_period} d_period={d_period} - [{oversold}/{overbought}]")
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
+    # ------------------- Historique -------------------
+    async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
+        self._logger.info("Initialisation ...")
+
+        self.symbol = event.symbol.upper()
+        count = len(event)
+        last = self.calculator.min_history
+
+        if count < last:
+            self._logger.warning(f"Pas assez de données ({count}/{last})")
+            return None
+
+        self.calculator.initialize(
+            event.column("high", last=last),
+            event.column("low", last=last),
+            event.column("close", last=last),
+        )
+
+        last_candle = event.last_candle
+        self._initialized = True
+        update = self._updated(last_candle)
+
+        self._logger.info(
+            f"Initialisation terminée {last_candle} "
+            f"%K = {self.calculator.k:.2f} %D = {self.calculator.d:.2f}"
+        )
+        return update
+
+    # ------------------- Temps réel -------------------
+    async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
+        if not self._initialized:
+            return None
+        if event.symbol.upper() != self.symbol:
+            raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
+
+        candle = event.candle
+        if self.calculator.update(candle.high, candle.low, candle.close) is None:
+            return None
+
+        return self._updated(candle)
+
+    # ------------------- Publication -------------------
+    def _updated(self, candle: Candle) -> IndicatorUpdated:
+        c = self.calculator
+        self._logger.debug(lambda: f" Stochastic({c.k_period}, {c.d_period}) -> %K={c.k} %D={c.d} | candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "stoch_k": c.k,
+                "stoch_d": c.d,
+                "stoch_is_oversold": c.is_oversold(self.oversold),
+                "stoch_is_overbought": c.is_overbought(self.overbought),
+            },
+            topic=(self.__class__.__name__, c.k_period, c.d_period),
+        )
@@ -0,0 +1,110 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from trading_bot.indicators.monotonic_deque import MonotonicDeque
+
+
+class StochasticCalculator:
+    """
+    Oscillateur stochastique :
+    %K = 100 × (close - plus bas) / (plus haut - plus bas) sur les k_period dernières bougies,
+    %D = SMA(d_period) de %K. Range nul (plus haut == plus bas) : %K = 50.
+
+    Plus haut / plus bas glissants tenus par deux MonotonicDeque et %D par une somme
+    glissante : update en O(1) amorti.
+    """
+
+    def __init__(self, k_period: int = 14, d_period: int = 3):
+        self.k_period = k_period
+        self.d_period = d_period
+
+        self._highs = MonotonicDeque(maximum=True)
+        self._lows = MonotonicDeque(maximum=False)
+        self._k_values: Deque[float] = deque(maxlen=d_period)
+        self._k_sum = 0.0
+
+        self._t = -1      # position de la dernière bougie
+        self.k: Optional[float] = None
+        self.d: Optional[float] = None
+
+    @property
+    def min_history(self) -> int:
+        return self.k_period + self.d_period - 1
+
+    def reset(self):
+        self._highs.clear()
+        self._lows.clear()
+        self._k_values.clear()
+        self._k_sum = 0.0
+        self._t = -1
+        self.k = self.d = None
+
+    # ------------------- Initialisation -------------------
+    def initialize(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Optional[Tuple[float, float]]:
+        """
+        Initialise depuis des colonnes NumPy : les d_period derniers %K sont calculés
+        en un passage vectoriel (seules les k_period + d_period - 1 dernières bougies sont lues).
+        """
+        if len(close) < self.min_history:
+            return None
+
+        start = -self.min_history
+        high = np.asarray(high[start:], dtype=np.float64)
+        low = np.asarray(low[start:], dtype=np.float64)
+        close = np.asarray(close[start:], dtype=np.float64)
+
+        highest = sliding_window_view(high, self.k_period).max(axis=1)
+        lowest = sliding_window_view(low, self.k_period).min(axis=1)
+        k_values = self._percent_k(close[self.k_period - 1:], highest, lowest)
+
+        self.reset()
+        for h, l in zip(high[-self.k_period:].tolist(), low[-self.k_period:].tolist()):
+            self._push(h, l)
+        self._k_values.extend(k_values.tolist())
+        self._k_sum = float(k_values.sum())
+
+        self.k = float(k_values[-1])
+        self.d = self._k_sum / self.d_period
+        return self.k, self.d
+
+    @staticmethod
+    def _percent_k(close, highest, lowest) -> np.ndarray:
+        span = highest - lowest
+        return np.where(span > 0, 100.0 * (close - lowest) / np.where(span > 0, span, 1.0), 50.0)
+
+    # ------------------- Update -------------------
+    def _push(self, high: float, low: float):
+        t = self._t = self._t + 1
+        self._highs.push(t, high)
+        self._lows.push(t, low)
+        self._highs.expire(t - self.k_period + 1)
+        self._lows.expire(t - self.k_period + 1)
+
+    def update(self, high: float, low: float, close: float) -> Optional[Tuple[float, float]]:
+        self._push(high, low)
+        if self._t + 1 < self.k_period:
+            return None
+
+        highest = self._highs.front()[1]
+        lowest = self._lows.front()[1]
+        self.k = 100.0 * (close - lowest) / (highest - lowest) if highest > lowest else 50.0
+
+        if len(self._k_values) == self.d_period:
+            self._k_sum -= self._k_values[0]
+        self._k_values.append(self.k)
+        self._k_sum += self.k
+
+        if len(self._k_values) < self.d_period:
+            return None
+        self.d = self._k_sum / self.d_period
+        return self.k, self.d
+
+    # ------------------- Zones -------------------
+    def is_oversold(self, level: float = 20.0) -> bool:
+        return self.k is not None and self.k <= level
+
+    def is_overbought(self, level: float = 80.0) -> bool:
+        return self.k is not None and self.k >= level
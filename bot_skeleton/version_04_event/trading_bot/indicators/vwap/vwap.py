@@ -0,0 +1,97 @@
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady, IndicatorUpdated
+from trading_bot.core.event_bus import EventBus
+
+from trading_bot.indicators.vwap.vwap_calculator import VWAPCalculator
+
+
+class VWAP:
+    """Wrapper EventBus autour du calculateur de VWAP de session."""
+
+    _logger = Logger.get("VWAP")
+
+    def __init__(self, event_bus: EventBus, session_seconds: int = VWAPCalculator.DAY):
+        self.event_bus = event_bus
+        self.symbol = None
+
+        self.calculator = VWAPCalculator(session_seconds)
+        self._initialized = False
+
+        event_bus.subscribe(CandleClose, self.on_candle_close)
+        event_bus.subscribe(CandleHistoryReady, self.on_history_ready)
+
+        self._logger.info(f"session={session_seconds}s")
+
+    def close(self):
+        """Désabonne l'indicateur du bus."""
+        self.event_bus.unsubscribe(CandleClose, self.on_candle_close)
+        self.event_bus.unsubscribe(CandleHistoryReady, self.on_history_ready)
+
+    # ------------------- Historique -------------------
+    async def on_history_ready(self, event: CandleHistoryReady):
+        update = self._initialize(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_history_ready_sync(self, event: CandleHistoryReady):
+        """Entrée synchrone de on_history_ready (EventBus.publish_sync)."""
+        update = self._initialize(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _initialize(self, event: CandleHistoryReady) -> IndicatorUpdated | None:
+        self._logger.info("Initialisation ...")
+
+        self.symbol = event.symbol.upper()
+        if not len(event):
+            self._logger.warning("Pas assez de données (0/1)")
+            return None
+
+        # Seule la dernière session est lue par le calculateur
+        value = self.calculator.initialize(*(event.column(name) for name in ("start_ts", "high", "low", "close", "volume")))
+
+        last_candle = event.last_candle
+        self._initialized = True
+        update = self._updated(last_candle) if value is not None else None
+
+        self._logger.info(f"Initialisation terminée {last_candle} VWAP = {value}")
+        return update
+
+    # ------------------- Temps réel -------------------
+    async def on_candle_close(self, event: CandleClose):
+        update = self._update(event)
+        if update is not None:
+            await self.event_bus.publish(update)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        update = self._update(event)
+        if update is not None:
+            self.event_bus.publish_sync(update)
+
+    def _update(self, event: CandleClose) -> IndicatorUpdated | None:
+        if not self._initialized:
+            return None
+        if event.symbol.upper() != self.symbol:
+            raise ValueError(f"Erreur de symbole event={event.symbol.upper()} / indicator={self.symbol}")
+
+        candle = event.candle
+        if self.calculator.update(candle.start_ts, candle.high, candle.low, candle.close, candle.volume) is None:
+            return None
+
+        return self._updated(candle)
+
+    # ------------------- Publication -------------------
+    def _updated(self, candle: Candle) -> IndicatorUpdated:
+        c = self.calculator
+        self._logger.debug(lambda: f" VWAP -> {c.current} | candle={candle}")
+        return IndicatorUpdated(
+            symbol=self.symbol,
+            candle=candle,
+            values={
+                "type": self.__class__.__name__,
+                "vwap_value": c.current,
+                "vwap_session_start": c.session_start,
+            },
+            topic=(self.__class__.__name__, c.session_seconds),
+        )
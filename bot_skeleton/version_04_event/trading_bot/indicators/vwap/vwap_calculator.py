@@ -0,0 +1,60 @@
+from typing import Optional
+
+import numpy as np
+
+
+class VWAPCalculator:
+    """
+    VWAP de session : Σ(prix typique × volume) / Σ(volume) depuis le début de la session,
+    prix typique = (high + low + close) / 3. Une session dure session_seconds
+    (par défaut la journée UTC) : les cumuls repartent de zéro à chaque nouvelle session.
+    Update en O(1), initialize ne lit que les bougies de la dernière session.
+    """
+
+    DAY = 24 * 3600
+
+    def __init__(self, session_seconds: int = DAY):
+        self.session_seconds = session_seconds
+        self._session_ms = session_seconds * 1000
+
+        self.session_start: Optional[int] = None   # epoch ms
+        self.cum_pv = 0.0
+        self.cum_volume = 0.0
+        self.current: Optional[float] = None
+
+    def session_of(self, start_ts: int) -> int:
+        """Début (epoch ms) de la session contenant start_ts."""
+        return start_ts - start_ts % self._session_ms
+
+    # ------------------- Initialisation -------------------
+    def initialize(self, start_ts: np.ndarray, high: np.ndarray, low: np.ndarray,
+                   close: np.ndarray, volume: np.ndarray) -> Optional[float]:
+        """Initialise depuis des colonnes NumPy, seules les bougies de la dernière session sont lues."""
+        if len(start_ts) == 0:
+            return None
+
+        self.session_start = self.session_of(int(start_ts[-1]))
+        first = int(np.searchsorted(start_ts, self.session_start, side="left"))
+
+        typical = (high[first:] + low[first:] + close[first:]) / 3.0
+        self.cum_pv = float(np.dot(typical, volume[first:]))
+        self.cum_volume = float(volume[first:].sum())
+        return self._compute()
+
+    # ------------------- Update -------------------
+    def update(self, start_ts: int, high: float, low: float, close: float, volume: float) -> Optional[float]:
+        session = self.session_of(start_ts)
+        if session != self.session_start:
+            self.session_start = session
+            self.cum_pv = 0.0
+            self.cum_volume = 0.0
+
+        self.cum_pv += (high + low + close) / 3.0 * volume
+        self.cum_volume += volume
+        return self._compute()
+
+    def _compute(self) -> Optional[float]:
+        # Session sans volume : VWAP indéfini, la dernière valeur est conservée
+        if self.cum_volume > 0:
+            self.current = self.cum_pv / self.cum_volume
+        return self.current
@@ -0,0 +1,130 @@
+import json
+from typing import Any, Callable
+
+import numpy as np
+
+from trading_bot.core.events import Candle
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec est optionnel
+    msgspec = None
+
+
+# ------------------- Décodeur JSON -------------------
+def _stdlib_loads(message):
+    return json.loads(message)
+
+
+_DECODERS: dict[str, Callable[[Any], Any]] = {"json": _stdlib_loads}
+if orjson is not None:
+    _DECODERS["orjson"] = orjson.loads
+if msgspec is not None:
+    _DECODERS["msgspec"] = msgspec.json.Decoder().decode
+
+# Décodeur le plus rapide disponible : orjson > msgspec > json
+decoder_name = next(name for name in ("orjson", "msgspec", "json") if name in _DECODERS)
+loads: Callable[[Any], Any] = _DECODERS[decoder_name]
+
+
+def available_decoders() -> list:
+    return list(_DECODERS)
+
+
+def use_decoder(name: str):
+    """Force le décodeur JSON ("orjson", "msgspec" ou "json")."""
+    global decoder_name, loads
+    if name not in _DECODERS:
+        raise ValueError(f"Décodeur JSON indisponible : {name}. Disponibles : {available_decoders()}")
+    decoder_name = name
+    loads = _DECODERS[name]
+
+
+def decode(message) -> Any:
+    """Décode un message websocket / REST (str ou bytes) avec le décodeur courant."""
+    return loads(message)
+
+
+# ------------------- Klines -------------------
+def is_open_kline(message) -> bool:
+    """
+    Vrai si le message brut est une kline non clôturée (k["x"] == False),
+    testé sur le texte sans décoder le JSON.
+    """
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        message = bytes(message)
+        return b'"e":"kline"' in message and b'"x":false' in message
+    return '"e":"kline"' in message and '"x":false' in message
+
+
+def kline_to_candle(k: dict, index: int, symbol: str, interval: int) -> Candle:
+    """Kline websocket (dict "k") -> Candle, sans structure intermédiaire."""
+    return Candle(
+        index=index,
+        symbol=symbol,
+        interval=interval,
+        open=float(k["o"]),
+        high=float(k["h"]),
+        low=float(k["l"]),
+        close=float(k["c"]),
+        volume=float(k["v"]),
+        start_ts=int(k["t"])
+    )
+
+
+# ------------------- Depth -------------------
+class DepthLevels:
+    """
+    Niveaux de carnet (prix, quantité) dans des tableaux NumPy préalloués,
+    réécrits en place à chaque message depth (aucune liste de tuples par niveau).
+
+    bids / asks : vues (n, 2) sur les niveaux valides du dernier message,
+    dans l'ordre Binance (bids décroissants, asks croissants).
+    Accepte les messages partiels (@depthN : "bids" / "asks")
+    et différentiels (@depth : "b" / "a").
+    """
+
+    __slots__ = ("capacity", "_bids", "_asks", "n_bids", "n_asks", "last_update_id")
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._bids = np.zeros((capacity, 2), dtype=np.float64)
+        self._asks = np.zeros((capacity, 2), dtype=np.float64)
+        self.n_bids = 0
+        self.n_asks = 0
+        self.last_update_id = None
+
+    def update(self, data: dict) -> "DepthLevels":
+        bids = data.get("bids", data.get("b", ()))
+        asks = data.get("asks", data.get("a", ()))
+        self.n_bids = self._fill(self._bids, bids)
+        self.n_asks = self._fill(self._asks, asks)
+        self.last_update_id = data.get("lastUpdateId", data.get("u"))
+        return self
+
+    def _fill(self, buffer: np.ndarray, levels) -> int:
+        n = min(len(levels), self.capacity)
+        if n:
+            # NumPy convertit directement les chaînes Binance en float64
+            buffer[:n] = levels[:n]
+        return n
+
+    @property
+    def bids(self) -> np.ndarray:
+        return self._bids[:self.n_bids]
+
+    @property
+    def asks(self) -> np.ndarray:
+        return self._asks[:self.n_asks]
+
+    def imbalance(self, levels: int | None = None) -> float:
+        """Volume bids / (bids + asks) sur les `levels` premiers niveaux."""
+        bid_volume = float(self._bids[:min(levels or self.n_bids, self.n_bids), 1].sum())
+        ask_volume = float(self._asks[:min(levels or self.n_asks, self.n_asks), 1].sum())
+        total = bid_volume + ask_volume
+        return bid_volume / total if total else 0.5
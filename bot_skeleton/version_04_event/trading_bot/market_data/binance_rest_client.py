@@ -0,0 +1,167 @@
+import asyncio
+import os
+import time
+from typing import List
+
+import aiohttp
+
+from trading_bot.core.logger import Logger
+from trading_bot.core.time_frame import Timeframe
+
+
+class BinanceRestError(Exception):
+    """Erreur définitive de l'API REST Binance (hors erreurs transitoires)."""
+
+
+class BinanceRestClient:
+    """
+    Client REST asynchrone Binance (aiohttp), non bloquant pour la boucle asyncio.
+
+    - une session aiohttp poolée (créée à la demande, fermée par close()),
+    - get_klines() : une page /klines (1000 bougies max) avec retry / backoff exponentiel
+      sur les erreurs réseau, 429 / 418 (Retry-After) et 5xx,
+    - fetch_klines() : plage [start_ts, end_ts] découpée en pages récupérées en parallèle
+      (nombre de requêtes simultanées borné par concurrency),
+    - budget de poids par minute (weight_limit, sous la limite Binance de 6000) :
+      chaque requête réserve son poids, au-delà on attend la minute suivante.
+      Le poids consommé annoncé par Binance (X-MBX-USED-WEIGHT-1M) est repris
+      s'il est supérieur (autres process sur la même IP).
+
+    Les timestamps sont des epoch ms (ouverture de bougie), bornes incluses.
+    L'URL par défaut peut être remplacée par BINANCE_REST_URL (ex: ExchangeSimulator).
+    """
+
+    logger = Logger.get("BinanceRestClient")
+
+    BASE_URL = "https://api.binance.com"
+    KLINES_LIMIT = 1000
+    KLINES_WEIGHT = 2
+    WEIGHT_WINDOW = 60  # secondes, fenêtre REQUEST_WEIGHT de Binance
+
+    def __init__(self, base_url: str | None = None, concurrency: int = 4, max_retries: int = 5,
+                 backoff: float = 0.5, timeout: float = 10, weight_limit: int = 5000):
+        self.base_url = (base_url or os.environ.get("BINANCE_REST_URL", self.BASE_URL)).rstrip("/")
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.weight_limit = weight_limit
+        self.used_weight = 0
+        self._weight_window = None
+        self._session: aiohttp.ClientSession | None = None
+
+    # ------------------- Session -------------------
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=aiohttp.TCPConnector(limit=self.concurrency)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # ------------------- Klines -------------------
+    async def get_klines(self, symbol: str, interval: str, start_ts: int = None, end_ts: int = None,
+                         limit: int = KLINES_LIMIT) -> List[list]:
+        """Une page /api/v3/klines (format brut Binance)."""
+        params = {"symbol": symbol.upper(), "interval": interval, "limit": limit}
+        if start_ts is not None:
+            params["startTime"] = int(start_ts)
+        if end_ts is not None:
+            params["endTime"] = int(end_ts)
+        return await self._get("/api/v3/klines", params, weight=self.KLINES_WEIGHT)
+
+    async def fetch_klines(self, symbol: str, interval: str, start_ts: int, end_ts: int) -> List[list]:
+        """
+        Toutes les bougies dont l'ouverture est dans [start_ts, end_ts],
+        pages de KLINES_LIMIT récupérées en parallèle, triées et dédoublonnées.
+        """
+        if end_ts < start_ts:
+            return []
+
+        interval_ms = Timeframe.to_seconds(interval) * 1000
+        page_ms = self.KLINES_LIMIT * interval_ms
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_page(page_start: int):
+            async with semaphore:
+                page_end = min(page_start + page_ms - interval_ms, end_ts)
+                return await self.get_klines(symbol, interval, page_start, page_end)
+
+        pages = await asyncio.gather(*[fetch_page(ts) for ts in range(int(start_ts), int(end_ts) + 1, page_ms)])
+        self.logger.debug(lambda: f"{symbol.upper()} {interval} : {len(pages)} pages /klines récupérées")
+
+        klines = {}
+        for page in pages:
+            for k in page:
+                klines[int(k[0])] = k
+        return [klines[ts] for ts in sorted(klines)]
+
+    async def fetch_closed_klines(self, symbol: str, interval: str, start_ts: int, end_ts: int | None = None) -> List[list]:
+        """
+        Comme fetch_klines, borné à la dernière bougie clôturée (end_ts par défaut)
+        et sans la bougie en cours éventuellement renvoyée par Binance.
+        """
+        now_ms = int(time.time() * 1000)
+        if end_ts is None:
+            end_ts = self.last_closed_start_ts(interval, now_ms)
+        klines = await self.fetch_klines(symbol, interval, start_ts, end_ts)
+        return [k for k in klines if int(k[6]) < now_ms]
+
+    @staticmethod
+    def last_closed_start_ts(interval: str, now_ms: int | None = None) -> int:
+        """Ouverture (epoch ms) de la dernière bougie clôturée."""
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        interval_ms = Timeframe.to_seconds(interval) * 1000
+        return (now_ms // interval_ms) * interval_ms - interval_ms
+
+    # ------------------- Poids des requêtes -------------------
+    async def _acquire_weight(self, weight: int):
+        """Réserve le poids d'une requête dans la fenêtre courante, attend la suivante si le budget est épuisé."""
+        while True:
+            window = int(time.time() // self.WEIGHT_WINDOW)
+            if window != self._weight_window:
+                self._weight_window = window
+                self.used_weight = 0
+            if self.used_weight + weight <= self.weight_limit:
+                self.used_weight += weight
+                return
+            delay = (window + 1) * self.WEIGHT_WINDOW - time.time()
+            self.logger.warning(f"Budget de poids atteint ({self.used_weight}/{self.weight_limit}), pause de {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def _update_weight(self, headers):
+        used = headers.get("X-MBX-USED-WEIGHT-1M")
+        if used is not None and int(time.time() // self.WEIGHT_WINDOW) == self._weight_window:
+            self.used_weight = max(self.used_weight, int(used))
+
+    # ------------------- HTTP -------------------
+    async def _get(self, path: str, params: dict, weight: int = 1):
+        url = f"{self.base_url}{path}"
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff * (2 ** attempt)
+            await self._acquire_weight(weight)
+            try:
+                async with self._get_session().get(url, params=params) as resp:
+                    self._update_weight(resp.headers)
+                    if resp.status in (418, 429):
+                        delay = float(resp.headers.get("Retry-After", delay))
+                        error = f"HTTP {resp.status} (rate limit)"
+                    elif resp.status >= 500:
+                        error = f"HTTP {resp.status}"
+                    elif resp.status >= 400:
+                        raise BinanceRestError(f"[BinanceRestClient] {url} {params} : HTTP {resp.status} {await resp.text()}")
+                    else:
+                        return await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = repr(e)
+
+            if attempt == self.max_retries:
+                raise BinanceRestError(f"[BinanceRestClient] {url} {params} : échec après {attempt + 1} tentatives ({error})")
+            self.logger.warning(f"{path} {params} : {error}, nouvel essai dans {delay:.1f}s")
+            await asyncio.sleep(delay)
@@ -0,0 +1,196 @@
+import asyncio
+import itertools
+import json
+import os
+from typing import Callable, Dict, List
+
+import websockets
+
+from trading_bot.core.logger import Logger
+from trading_bot.market_data import binance_decoder
+
+
+class BinanceStreamManager:
+    """
+    Connexion websocket unique aux combined streams Binance (/stream?streams=a/b/c),
+    partagée par toutes les sources du process (klines, depth, trades...).
+
+    - subscribe(stream, callback) / unsubscribe(stream, callback) : comptage de références
+      par stream, SUBSCRIBE / UNSUBSCRIBE envoyés à Binance uniquement au premier abonné
+      et au départ du dernier,
+    - chaque message est décodé une seule fois (binance_decoder : orjson / msgspec si installés),
+      le dict "data" est passé tel quel à tous les abonnés du stream (à ne pas modifier),
+    - skip_open_klines : les klines non clôturées sont écartées sur le texte brut, sans décodage,
+    - les callbacks sont synchrones et doivent rester courts (typiquement un put_nowait
+      dans la file de l'abonné) : un abonné lent ne bloque pas les autres,
+    - reconnexion automatique tant qu'il reste des abonnés (fermeture, handshake refusé,
+      erreur inattendue), la connexion est fermée au départ du dernier abonné,
+    - un frame illisible est compté (malformed) et ignoré sans couper la connexion.
+    - add_recorder() : les frames bruts (avant tout filtre) sont aussi passés aux
+      StreamRecorder attachés.
+    L'URL par défaut peut être remplacée par BINANCE_WS_URL (ex: ExchangeSimulator).
+    """
+
+    logger = Logger.get("BinanceStreamManager")
+
+    URL = "wss://stream.binance.com:9443/stream"
+
+    _shared: "BinanceStreamManager | None" = None
+
+    def __init__(self, url: str | None = None, reconnect_delay: float = 5, skip_open_klines: bool = True):
+        self.url = url or os.environ.get("BINANCE_WS_URL", self.URL)
+        self.reconnect_delay = reconnect_delay
+        self.skip_open_klines = skip_open_klines
+
+        self._subscribers: Dict[str, List[Callable[[dict], None]]] = {}
+        self._ws = None
+        self._task: asyncio.Task | None = None
+        self._pending: set = set()
+        self._request_id = itertools.count(1)
+        self._recorders: list = []
+
+        # Compteurs (diagnostic)
+        self.connections = 0
+        self.messages = 0
+        self.skipped = 0
+        self.malformed = 0
+        self.errors = 0
+
+    @classmethod
+    def shared(cls) -> "BinanceStreamManager":
+        """Instance unique du process."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    # ------------------- Noms de streams -------------------
+    @staticmethod
+    def kline_stream(symbol: str, interval: str) -> str:
+        return f"{symbol.lower()}@kline_{interval}"
+
+    @staticmethod
+    def depth_stream(symbol: str, levels: int | None = None, speed_ms: int | None = None) -> str:
+        stream = f"{symbol.lower()}@depth{levels or ''}"
+        return f"{stream}@{speed_ms}ms" if speed_ms else stream
+
+    @staticmethod
+    def trade_stream(symbol: str) -> str:
+        return f"{symbol.lower()}@trade"
+
+    # ------------------- Abonnements -------------------
+    @property
+    def streams(self) -> List[str]:
+        return list(self._subscribers)
+
+    def subscriber_count(self, stream: str) -> int:
+        return len(self._subscribers.get(stream, ()))
+
+    def subscribe(self, stream: str, callback: Callable[[dict], None]):
+        callbacks = self._subscribers.setdefault(stream, [])
+        callbacks.append(callback)
+        if len(callbacks) == 1:
+            self._send("SUBSCRIBE", [stream])
+        self.logger.debug(lambda: f"subscribe {stream} ({len(callbacks)} abonnés)")
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def unsubscribe(self, stream: str, callback: Callable[[dict], None]):
+        callbacks = self._subscribers.get(stream)
+        if not callbacks or callback not in callbacks:
+            return
+        callbacks.remove(callback)
+        self.logger.debug(lambda: f"unsubscribe {stream} ({len(callbacks)} abonnés)")
+
+        if not callbacks:
+            del self._subscribers[stream]
+            self._send("UNSUBSCRIBE", [stream])
+
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def add_recorder(self, recorder):
+        """Attache un enregistreur de frames bruts (StreamRecorder)."""
+        self._recorders.append(recorder)
+
+    def remove_recorder(self, recorder):
+        if recorder in self._recorders:
+            self._recorders.remove(recorder)
+
+    def _send(self, method: str, streams: List[str]):
+        """Requête SUBSCRIBE / UNSUBSCRIBE sur la connexion ouverte (sinon prise en compte à la connexion)."""
+        if self._ws is None:
+            return
+        message = json.dumps({"method": method, "params": streams, "id": next(self._request_id)})
+        task = asyncio.create_task(self._ws.send(message))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    # ------------------- Connexion -------------------
+    async def _run(self):
+        while self._subscribers:
+            streams = list(self._subscribers)
+            url = f"{self.url}?streams={'/'.join(streams)}"
+            try:
+                self.logger.info(f"Connexion combined stream Binance ({len(streams)} streams)...")
+                async with websockets.connect(url, ping_interval=120, ping_timeout=20, max_size=None) as ws:
+                    self._ws = ws
+                    self.connections += 1
+                    self.logger.info("✅ Connecté au combined stream Binance")
+
+                    # Abonnements modifiés pendant la connexion
+                    added = [s for s in self._subscribers if s not in streams]
+                    removed = [s for s in streams if s not in self._subscribers]
+                    if added:
+                        self._send("SUBSCRIBE", added)
+                    if removed:
+                        self._send("UNSUBSCRIBE", removed)
+
+                    while True:
+                        # bytes bruts : pas de décodage UTF-8 avant le filtre / décodeur JSON
+                        self._dispatch(await ws.recv(decode=False))
+
+            except (websockets.ConnectionClosed, OSError) as e:
+                self.logger.warning(f"Combined stream fermé : {e}. Reconnexion dans {self.reconnect_delay}s...")
+            except Exception as e:
+                # Handshake refusé (InvalidStatus), erreur inattendue : la tâche ne doit pas s'arrêter
+                self.errors += 1
+                self.logger.error(f"Erreur combined stream : {e!r}. Reconnexion dans {self.reconnect_delay}s...")
+            finally:
+                self._ws = None
+
+            if self._subscribers:
+                await asyncio.sleep(self.reconnect_delay)
+
+    def _dispatch(self, message):
+        for recorder in list(self._recorders):
+            try:
+                recorder.write(message)
+            except Exception as e:
+                self.logger.error(f"Erreur enregistreur {recorder!r} : {e!r}")
+
+        if self.skip_open_klines and binance_decoder.is_open_kline(message):
+            self.skipped += 1
+            return
+
+        try:
+            msg = binance_decoder.decode(message)
+            stream = msg.get("stream")
+        except Exception as e:
+            # Frame mal formé : ignoré, la connexion reste ouverte
+            self.malformed += 1
+            self.logger.error(f"Message illisible ignoré ({e!r}) : {message[:200]!r}")
+            return
+        if stream is None:
+            # Réponse à un SUBSCRIBE / UNSUBSCRIBE
+            self.logger.debug(lambda: f"Réponse Binance : {msg}")
+            return
+
+        self.messages += 1
+        data = msg["data"]
+        for callback in list(self._subscribers.get(stream, ())):
+            try:
+                callback(data)
+            except Exception as e:
+                self.logger.error(f"Erreur abonné {stream} : {e!r}")
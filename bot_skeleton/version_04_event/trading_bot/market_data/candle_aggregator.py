@@ -0,0 +1,176 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import Candle, CandleClose, CandleHistoryReady
+from trading_bot.core.logger import Logger
+from trading_bot.core.time_frame import Timeframe
+
+
+def resample(columns: CandleColumns, interval: str) -> Tuple[CandleColumns, np.ndarray]:
+    """
+    Agrégation vectorisée vers un timeframe supérieur, buckets alignés sur l'epoch UTC
+    (comme Binance pour s / m / h / d).
+    Retourne (colonnes agrégées, nombre de bougies source par bucket).
+    """
+    n = len(columns)
+    if n == 0:
+        return columns.slice(0, 0), np.zeros(0, dtype=np.int64)
+
+    interval_ms = Timeframe.to_seconds(interval) * 1000
+    ts = np.asarray(columns.start_ts, dtype=np.int64)
+    bucket = ts - ts % interval_ms
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], n]
+
+    aggregated = CandleColumns(
+        start_ts=bucket[starts],
+        open=np.asarray(columns.open)[starts],
+        high=np.maximum.reduceat(np.asarray(columns.high), starts),
+        low=np.minimum.reduceat(np.asarray(columns.low), starts),
+        close=np.asarray(columns.close)[ends - 1],
+        volume=np.add.reduceat(np.asarray(columns.volume), starts),
+    )
+    return aggregated, ends - starts
+
+
+class _Bucket:
+    """Bougie en cours d'agrégation (état O(1) par timeframe)."""
+
+    __slots__ = ("start_ts", "open", "high", "low", "close", "volume", "count")
+
+    def __init__(self, start_ts: int, open: float, high: float, low: float, close: float, volume: float, count: int = 1):
+        self.start_ts = start_ts
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.count = count
+
+
+class _Timeframe:
+    __slots__ = ("interval", "seconds", "interval_ms", "event_bus", "bucket", "index")
+
+    def __init__(self, interval: str, event_bus: EventBus):
+        self.interval = interval
+        self.seconds = Timeframe.to_seconds(interval)
+        self.interval_ms = self.seconds * 1000
+        self.event_bus = event_bus
+        self.bucket: _Bucket | None = None
+        self.index = 0
+
+
+class CandleAggregator:
+    """
+    Construit les timeframes supérieurs à partir d'un seul flux de base (ex: 1m) :
+
+    - abonné au CandleHistoryReady / CandleClose du bus de base,
+    - add_timeframe("5m", bus) : publie sur `bus` un CandleHistoryReady agrégé (resample
+      vectorisé, bucket de tête partiel écarté s'il est clôturé dans l'historique) puis
+      un CandleClose par bougie 5m, dès la clôture de la dernière bougie de base du bucket,
+    - un bucket interrompu par un trou du flux de base est publié tel quel.
+
+    L'historique du flux de base doit couvrir le warmup de chaque timeframe
+    (base_warmup_count).
+    """
+
+    logger = Logger.get("CandleAggregator")
+
+    def __init__(self, event_bus: EventBus, base_interval: str = "1m"):
+        self.event_bus = event_bus
+        self.base_interval = base_interval
+        self.base_ms = Timeframe.to_seconds(base_interval) * 1000
+        self._timeframes: List[_Timeframe] = []
+
+        event_bus.subscribe(CandleHistoryReady, self._on_history)
+        event_bus.subscribe(CandleClose, self._on_candle_close)
+
+    def add_timeframe(self, interval: str, event_bus: EventBus):
+        timeframe = _Timeframe(interval, event_bus)
+        if timeframe.interval_ms <= self.base_ms or timeframe.interval_ms % self.base_ms:
+            raise ValueError(f"[CandleAggregator] {interval} n'est pas un multiple de {self.base_interval}")
+        self._timeframes.append(timeframe)
+        self.logger.info(f"Timeframe {interval} ajouté (base {self.base_interval})")
+
+    def base_warmup_count(self, interval: str, warmup_count: int) -> int:
+        """Nombre de bougies de base nécessaires pour warmup_count bougies `interval` complètes."""
+        ratio = Timeframe.to_seconds(interval) * 1000 // self.base_ms
+        return (warmup_count + 1) * ratio
+
+    # ------------------- Historique -------------------
+    async def _on_history(self, event: CandleHistoryReady):
+        columns = event.columns
+        for tf in self._timeframes:
+            aggregated, counts = resample(columns, tf.interval)
+            start, stop = 0, len(aggregated)
+            tf.bucket = None
+
+            if stop:
+                # Bucket de tête commencé avant l'historique (conservé s'il est aussi le bucket en cours)
+                if aggregated.start_ts[0] < columns.start_ts[0]:
+                    start = 1
+                # Bucket de queue pas encore clôturé : il devient l'état incrémental
+                last_end = int(columns.start_ts[-1]) + self.base_ms
+                if int(aggregated.start_ts[-1]) + tf.interval_ms > last_end:
+                    stop -= 1
+                    tf.bucket = _Bucket(int(aggregated.start_ts[-1]), float(aggregated.open[-1]), float(aggregated.high[-1]),
+                                        float(aggregated.low[-1]), float(aggregated.close[-1]), float(aggregated.volume[-1]),
+                                        int(counts[-1]))
+
+            start = min(start, stop)
+            history = aggregated.slice(start, stop)
+            tf.index = len(history)
+            self.logger.info(f"{tf.interval} : {len(history)} bougies agrégées depuis {len(columns)} bougies {self.base_interval}")
+
+            await tf.event_bus.publish(CandleHistoryReady(
+                symbol=event.symbol,
+                timestamp=event.timestamp,
+                period=tf.interval,
+                columns=history
+            ))
+
+    # ------------------- Flux -------------------
+    async def _on_candle_close(self, event: CandleClose):
+        c = event.candle
+        for tf in self._timeframes:
+            start_ts = c.start_ts - c.start_ts % tf.interval_ms
+            bucket = tf.bucket
+
+            if bucket is not None and bucket.start_ts != start_ts:
+                self.logger.warning(f"{tf.interval} : bougie {bucket.start_ts} incomplète ({bucket.count} bougies {self.base_interval})")
+                await self._emit(tf, event.symbol)
+                bucket = None
+
+            if bucket is None:
+                tf.bucket = _Bucket(start_ts, c.open, c.high, c.low, c.close, c.volume)
+            else:
+                if c.high > bucket.high:
+                    bucket.high = c.high
+                if c.low < bucket.low:
+                    bucket.low = c.low
+                bucket.close = c.close
+                bucket.volume += c.volume
+                bucket.count += 1
+
+            if c.start_ts + self.base_ms >= start_ts + tf.interval_ms:
+                await self._emit(tf, event.symbol)
+
+    async def _emit(self, tf: _Timeframe, symbol: str):
+        b = tf.bucket
+        tf.bucket = None
+        candle = Candle(
+            index=tf.index,
+            symbol=symbol,
+            interval=tf.seconds,
+            open=b.open,
+            high=b.high,
+            low=b.low,
+            close=b.close,
+            volume=b.volume,
+            start_ts=b.start_ts
+        )
+        tf.index += 1
+        await tf.event_bus.publish(CandleClose(symbol=symbol, candle=candle))
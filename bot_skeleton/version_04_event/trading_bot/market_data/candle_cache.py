@@ -0,0 +1,148 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.events import Candle
+from trading_bot.core.logger import Logger
+
+
+class CachedCandles:
+    """
+    Entrée du cache : les colonnes d'un historique + les bougies matérialisées
+    une seule fois, au premier accès (les backtests vectorisés n'en ont pas besoin).
+    La taille estimée inclut les bougies dès l'insertion.
+    """
+
+    def __init__(self, columns: CandleColumns, symbol: str, interval: int):
+        self.columns = columns
+        self.symbol = symbol
+        self.interval = interval
+        self._candles: List[Candle] | None = None
+        self._lock = threading.Lock()
+        self.nbytes = columns.nbytes + len(columns) * _candle_nbytes(columns, symbol, interval)
+
+    @property
+    def candles(self) -> List[Candle]:
+        if self._candles is None:
+            with self._lock:
+                if self._candles is None:
+                    self._candles = self.columns.to_candles(self.symbol, self.interval)
+        return self._candles
+
+
+def _candle_nbytes(columns: CandleColumns, symbol: str, interval: int) -> int:
+    """Estimation de l'empreinte mémoire d'une bougie (objet slotted + index/timestamp + floats)."""
+    if not len(columns):
+        return 0
+    c = columns.slice(0, 1).to_candles(symbol, interval)[0]
+    return (
+        sys.getsizeof(c)
+        + sys.getsizeof(c.index)
+        + sys.getsizeof(c.start_ts)
+        + 5 * sys.getsizeof(c.close)
+    )
+
+
+class CandleCache:
+    """
+    Cache process-wide des historiques de bougies, partagé par tous les backtests
+    d'un même process (BotTrainer lance un Bot / BacktestEngine / CandleSource par combinaison).
+
+    Clé : (path, symbol, interval, mtime du fichier) -> un fichier modifié est relu.
+    Eviction LRU dès que la taille estimée dépasse max_bytes.
+    Les bougies sont partagées entre les runs : elles ne doivent pas être modifiées.
+    """
+
+    _logger = Logger.get("CandleCache")
+
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 Go
+
+    _shared: "CandleCache | None" = None
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, CachedCandles]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading_locks: dict[Tuple, threading.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "CandleCache":
+        """Instance unique du process."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    # ------------------- API -------------------
+    def get(self, path: str, symbol: str, interval: int, loader: Callable[[], CandleColumns]) -> CachedCandles:
+        """
+        Retourne l'historique en cache, ou le charge via loader() (une seule fois
+        même si plusieurs threads le demandent en même temps).
+        interval est exprimé en secondes.
+        """
+        key = (os.path.abspath(path), symbol, interval, os.path.getmtime(path))
+
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+
+        with self._loading_lock(key):
+            # Un autre thread a pu charger l'entrée pendant l'attente
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry
+
+            entry = CachedCandles(loader(), symbol, interval)
+            self._insert(key, entry)
+            return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._loading_locks.clear()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(e.nbytes for e in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------- Interne -------------------
+    def _lookup(self, key: Tuple) -> CachedCandles | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _loading_lock(self, key: Tuple) -> threading.Lock:
+        with self._lock:
+            return self._loading_locks.setdefault(key, threading.Lock())
+
+    def _insert(self, key: Tuple, entry: CachedCandles):
+        with self._lock:
+            # Les versions précédentes du même fichier (mtime différent) sont obsolètes
+            for old_key in [k for k in self._entries if k[:3] == key[:3]]:
+                del self._entries[old_key]
+                self._loading_locks.pop(old_key, None)
+
+            self._entries[key] = entry
+
+            while len(self._entries) > 1 and self.nbytes > self.max_bytes:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._loading_locks.pop(evicted_key, None)
+                self._logger.info(f"Eviction LRU {evicted_key[0]} ({evicted_key[1]})")
+
+        self._logger.info(
+            f"Historique chargé {key[0]} ({key[1]}) : {len(entry.columns)} bougies, "
+            f"~{entry.nbytes / 1e6:.1f} Mo - cache={self.nbytes / 1e6:.1f}/{self.max_bytes / 1e6:.0f} Mo"
+        )
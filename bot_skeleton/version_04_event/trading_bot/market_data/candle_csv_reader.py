@@ -0,0 +1,158 @@
+import asyncio
+import os
+import threading
+from typing import AsyncIterator, Iterator
+
+import numpy as np
+import pandas as pd
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.events import Candle
+from trading_bot.core.logger import Logger
+from trading_bot.core.time_frame import Timeframe
+
+
+class CandleCsvReader:
+    """
+    Lecture d'un CSV historique Binance (timestamp, open, high, low, close, volume, ...) :
+
+    - seules les 6 colonnes utiles sont parsées, les timestamps sont convertis
+      en bloc en epoch ms (int64), jamais ligne par ligne,
+    - read() : série complète en colonnes,
+    - chunks() / candles() : lecture par blocs de chunk_size lignes,
+      mémoire constante quelle que soit la taille du fichier,
+    - start_ts / end_ts (epoch ms, bornes incluses) : le début de la plage est trouvé
+      par dichotomie sur le fichier (trié par timestamp), les lignes ignorées ne sont pas lues,
+    - read_ahead() : blocs lus dans un thread, quelques blocs d'avance sur le consommateur.
+    Les fins de bougie ne sont pas stockées : Candle.end_ts les déduit de start_ts.
+    """
+
+    logger = Logger.get("CandleCsvReader")
+
+    COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+    DEFAULT_CHUNK_SIZE = 100_000
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self._header = list(pd.read_csv(self.path, nrows=0).columns)
+        if not set(self.COLUMNS).issubset(self._header):
+            raise ValueError(f"[CandleCsvReader] Le CSV doit contenir les colonnes : {set(self.COLUMNS)}")
+        self._ts_column = self._header.index("timestamp")
+
+    def _read(self, source=None, **kwargs):
+        if source is None:
+            source = self.path
+        else:
+            # lecture depuis une position du fichier : plus d'en-tête
+            kwargs.update(header=None, names=self._header)
+        return pd.read_csv(source, usecols=list(self.COLUMNS), dtype={"timestamp": str}, **kwargs)
+
+    # ------------------- Lecture -------------------
+    def read(self, start_ts: int | None = None, end_ts: int | None = None, limit: int | None = None) -> CandleColumns:
+        """Série complète, ou bornée à [start_ts, end_ts] et à limit bougies."""
+        if start_ts is None and end_ts is None and limit is None:
+            return CandleColumns.from_dataframe(self._read())
+        chunks = list(self.chunks(start_ts, end_ts, limit))
+        if not chunks:
+            return CandleColumns(np.empty(0, dtype=np.int64), *(np.empty(0) for _ in range(5)))
+        return CandleColumns(*(np.concatenate([getattr(c, name) for c in chunks]) for name in CandleColumns.NAMES))
+
+    def chunks(self, start_ts: int | None = None, end_ts: int | None = None,
+               limit: int | None = None) -> Iterator[CandleColumns]:
+        """Blocs successifs de chunk_size bougies au plus, dans [start_ts, end_ts] et limités à limit bougies."""
+        if limit is not None and limit <= 0:
+            return
+        with open(self.path, "rb") as f:
+            offset = self.offset_for(start_ts) if start_ts is not None else None
+            if offset is not None:
+                if offset >= os.fstat(f.fileno()).st_size:
+                    return
+                f.seek(offset)
+            chunk_size = min(self.chunk_size, limit) if limit else self.chunk_size
+            with self._read(f if offset is not None else None, chunksize=chunk_size, nrows=limit) as reader:
+                for df in reader:
+                    columns = CandleColumns.from_dataframe(df)
+                    if end_ts is not None and len(columns) and columns.start_ts[-1] > end_ts:
+                        stop = int(columns.start_ts.searchsorted(end_ts, side="right"))
+                        if stop:
+                            yield columns.slice(0, stop)
+                        return
+                    yield columns
+
+    def candles(self, symbol: str, interval: int, start_index: int = 0,
+                start_ts: int | None = None, end_ts: int | None = None) -> Iterator[Candle]:
+        """Bougies une à une (interval en secondes), matérialisées bloc par bloc."""
+        index = start_index
+        for columns in self.chunks(start_ts, end_ts):
+            yield from columns.to_candles(symbol, interval, start_index=index)
+            index += len(columns)
+
+    async def read_ahead(self, start_ts: int | None = None, end_ts: int | None = None,
+                         depth: int = 2) -> AsyncIterator[CandleColumns]:
+        """
+        Comme chunks(), la lecture et le parsing se font dans un thread dédié
+        avec au plus depth blocs d'avance : la boucle asyncio n'est jamais bloquée.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        stopped = threading.Event()
+
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce():
+            try:
+                for columns in self.chunks(start_ts, end_ts):
+                    if stopped.is_set():
+                        return
+                    put(columns)
+                put(None)
+            except Exception as e:
+                if not stopped.is_set():
+                    put(e)
+
+        thread = threading.Thread(target=produce, name=f"CandleCsvReader-{os.path.basename(self.path)}", daemon=True)
+        thread.start()
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+            # Débloque le thread s'il attend une place dans la file
+            while not queue.empty():
+                queue.get_nowait()
+
+    # ------------------- Dichotomie -------------------
+    def offset_for(self, ts: int) -> int:
+        """Position (octets) de la première ligne dont le timestamp est >= ts."""
+        with open(self.path, "rb") as f:
+            data_start = len(f.readline())
+            size = os.fstat(f.fileno()).st_size
+
+            def line_start(pos: int) -> int:
+                # Début de la première ligne commençant à pos ou après
+                if pos <= data_start:
+                    return data_start
+                f.seek(pos - 1)
+                f.readline()
+                return f.tell()
+
+            def reached(pos: int) -> bool:
+                f.seek(line_start(pos))
+                line = f.readline()
+                return not line.strip() or self._line_ts(line) >= ts
+
+            lo, hi = data_start, size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if reached(mid):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            return line_start(lo)
+
+    def _line_ts(self, line: bytes) -> int:
+        return Timeframe.to_epoch_ms(line.split(b",")[self._ts_column].decode().strip())
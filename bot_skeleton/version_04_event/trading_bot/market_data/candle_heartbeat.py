@@ -1,4 +1,5 @@
 import asyncio
+from typing import Awaitable, Callable
 from datetime import datetime, timezone
 from trading_bot.core.logger import Logger
 from trading_bot.core.events import CandleClose
@@ -11,13 +12,19 @@ class CandleHeartbeatMonitor(Startable):
     Heartbeat basé sur les événements CandleClose.
     Vérifie que le flux de candles reste actif en fonction
     de l'intervalle réel de la candle (en secondes).
+    on_dead : coroutine optionnelle appelée à chaque contrôle où le flux est mort
+    (ex: CandleSourceBinance.backfill pour rattraper les bougies manquantes).
     """
 
     logger = Logger.get("CandleHeartbeatMonitor")
 
+    # Attente (s) entre deux vérifications tant qu'aucun CandleClose n'est reçu
+    first_candle_poll = 10
+
     def __init__(
         self,
-        event_bus: EventBus
+        event_bus: EventBus,
+        on_dead: Callable[[], Awaitable[None]] | None = None
     ):
         super().__init__()
 
@@ -30,6 +37,7 @@ class CandleHeartbeatMonitor(Startable):
         self._task: asyncio.Task | None = None
 
         self.heartbeat = "alive"
+        self._on_dead = on_dead
 
         event_bus.subscribe(CandleClose, self._on_candle_close)
 
@@ -77,7 +85,7 @@ class CandleHeartbeatMonitor(Startable):
             while True:
                 if self._interval_seconds is None:
                     # self.logger.warning("⚠️ En attente du premier CandleClose...")
-                    await asyncio.sleep(10)
+                    await asyncio.sleep(self.first_candle_poll)
                     continue
 
                 max_delay = self._interval_seconds * self.tolerance_factor
@@ -97,7 +105,11 @@ class CandleHeartbeatMonitor(Startable):
                         f"— dernier CandleClose il y a {int(elapsed)}s "
                         f"(max autorisé {int(max_delay)}s)"
                     )
-                    # 👉 action possible ici (event, pause trading, restart feed)
+                    if self._on_dead is not None:
+                        try:
+                            await self._on_dead()
+                        except Exception as e:
+                            self.logger.error(f"Erreur action heartbeat mort : {e!r}")
                 else:
                     self.heartbeat = "alive"
                     self.logger.debug(
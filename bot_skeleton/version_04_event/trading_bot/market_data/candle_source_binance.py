@@ -1,17 +1,18 @@
 from typing import override
-import pandas as pd
-import requests
-import json
-import websockets
 import asyncio
-from datetime import datetime, timedelta
-import pytz
+import time
+from datetime import datetime
 
 
+from trading_bot.core.candle_columns import CandleColumns
 from trading_bot.core.time_frame import Timeframe
 from trading_bot.core.logger import Logger
 from trading_bot.core.events import Candle, CandleHistoryReady, CandleClose
+from trading_bot.market_data.binance_decoder import kline_to_candle
+from trading_bot.market_data.binance_rest_client import BinanceRestClient
+from trading_bot.market_data.binance_stream_manager import BinanceStreamManager
 from trading_bot.market_data.candle_source import CandleSource
+from trading_bot.market_data.candle_store import CandleStore
 from trading_bot.core.event_bus import EventBus
 
 
@@ -29,112 +30,171 @@ class CandleSourceBinance(CandleSource):
         self.interval  = params["interval"]
         self.warmup_count = params["trading_system"]["warmup_count"]
 
-        self._ws_url = f"wss://stream.binance.com:9443/ws/{self.symbol}@kline_{self.interval}"
-        self._rest_url = f"https://api.binance.com/api/v3/klines?symbol={self.symbol.upper()}&interval={self.interval}&limit={self.warmup_count + 1}"
-        self._reconnect_delay = 5  # secondes
+        self._streams = BinanceStreamManager.shared()
+        # Session HTTP gardée toute la vie de la source (warmup, rattrapages), fermée en fin de flux
+        self._rest = BinanceRestClient()
+        self._store = CandleStore(params["store"]) if params.get("store") else None
 
         self._seconds = Timeframe.to_seconds(self.interval) # intervalle en secondes
+        self._interval_ms = self._seconds * 1000
+
+        # Ouverture de la dernière bougie publiée (détection des trous du flux)
+        self._last_start_ts: int | None = None
+        # Sérialise flux websocket et rattrapage REST (ordre de publication)
+        self._publish_lock = asyncio.Lock()
         self.logger.info(f"Initialisé - running={self.is_running()}")
 
     @override
     async def _warmup(self):
         """
-        Récupère les dernières bougies via l'API REST
-        et publie un CandleHistoryReady.
+        Récupère les warmup_count dernières bougies clôturées via l'API REST (aiohttp,
+        pages parallèles) et publie un CandleHistoryReady.
+        Si params["store"] désigne un CandleStore, seule la fin manquante est demandée
+        à Binance et le store est complété.
         """
+        interval_ms = self._interval_ms
+        end_ts = BinanceRestClient.last_closed_start_ts(self.interval)
+        start_ts = end_ts - (max(self.warmup_count, 1) - 1) * interval_ms
+
         try:
-            resp = requests.get(self._rest_url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            columns = await self._load_history(start_ts, end_ts)
         except Exception as e:
             self.logger.error(f"Erreur récupération bougies via REST : {e}")
-            return pd.DataFrame(columns=["timestamp", "timestamp_paris", "open", "high", "low", "close", "volume"])
+            return
 
-        data = data[:-1]  # ignorer la dernière bougie potentiellement en cours
+        history = CandleHistoryReady(
+            symbol=self.symbol,
+            timestamp=datetime.now(),
+            period=self.interval,
+            columns=columns
+        )
+        self.index = len(columns)
+        if len(columns):
+            self._last_start_ts = int(columns.start_ts[-1])
 
-        self.index = 0
+        self.logger.info(f"Warmup chargé ({len(columns)} bougies)")
+        if len(columns):
+            self.logger.info(f"Première bougie: {columns.slice(0, 1).to_candles(self.symbol, self._seconds)[0]}")
+            self.logger.info(f"Dernière bougie: {history.last_candle}")
 
-        candles = [self._dict_to_candle(k) for k in data[-self.warmup_count:]]
+        await self.event_bus.publish(history)
 
-        self.logger.info(f"Warmup chargé ({len(candles)} bougies)")
-        self.logger.info(f"Première bougie: {candles[0]}")
-        self.logger.info(f"Dernière bougie: {candles[-1]}")
+    async def _load_history(self, start_ts: int, end_ts: int) -> CandleColumns:
+        """Bougies [start_ts, end_ts] : store local complété par la fin manquante côté REST."""
+        interval_ms = self._interval_ms
+        stored = None
+        if self._store is not None and self._store.exists(self.symbol, self.interval):
+            stored = self._store.load(self.symbol, self.interval, mmap=False)
 
-        await self.event_bus.publish(
-            CandleHistoryReady(
-                symbol=self.symbol,
-                timestamp=datetime.now(),
-                period=self.interval,
-                candles=candles
-            )
-        )
+        # Le store n'est utile que s'il couvre le début de la fenêtre
+        fetch_from = start_ts
+        if stored is not None and len(stored) and stored.start_ts[0] <= start_ts:
+            fetch_from = max(start_ts, int(stored.start_ts[-1]) + interval_ms)
+
+        klines = await self._rest.fetch_closed_klines(self.symbol, self.interval, fetch_from, end_ts)
+        fetched = CandleColumns.from_klines(klines)
+        self.logger.info(f"{len(fetched)} bougies récupérées via REST depuis {fetch_from}")
+
+        merged = fetched if stored is None else stored.merge(fetched)
+        if self._store is not None and len(fetched):
+            self._store.write(self.symbol, self.interval, merged, source="binance_rest")
+
+        mask = (merged.start_ts >= start_ts) & (merged.start_ts <= end_ts)
+        return CandleColumns(*(getattr(merged, name)[mask] for name in CandleColumns.NAMES))
 
     @override
     async def _stream(self):
         """
         Flux temps réel : publie un CandleClose pour chaque bougie clôturée.
+        Les klines arrivent par le combined stream partagé du process (BinanceStreamManager)
+        et sont traitées dans l'ordre via une file propre à cette source.
+        La fin du flux (stop() annule la tâche) ferme la session REST de la source.
         """
-        while not self.should_stop():
-            try:
-                self.logger.info(f"Connexion au websocket Binance ({self.symbol}, {self.interval})...")
-                async with websockets.connect(
-                    self._ws_url,
-                    ping_interval=120,   # ping automatique tous les 120s
-                    ping_timeout=20     # timeout si pas de pong en 20s
-
-                ) as ws:
-                    self.logger.info("✅ Connecté au websocket Binance")
-                    async for message in ws:
-                        data = json.loads(message)
-                        k = data["k"]
-                        if k["x"]:  # bougie clôturée
-                            candle = self._ws_dict_to_candle(k)
-                            self.logger.debug(f"Bougie Close : {candle}")
-                            await self.event_bus.publish(CandleClose(
-                                symbol=self.symbol,
-                                candle=candle
-                            ))
-
-            except websockets.ConnectionClosed as e:
-                self.logger.warning(f"Websocket fermé : {e}. Reconnexion dans {self._reconnect_delay}s...")
-                await asyncio.sleep(self._reconnect_delay)
-            # except Exception as e:
-            #     self.logger.error(f"Erreur websocket inattendue : {e}. Reconnexion dans {self._reconnect_delay}s...")
-            #     await asyncio.sleep(self._reconnect_delay)
+        stream = BinanceStreamManager.kline_stream(self.symbol, self.interval)
+        queue: asyncio.Queue = asyncio.Queue()
 
-    # --- Méthodes utilitaires ---
-    def _dict_to_candle(self, k) -> Candle:
-        """Transforme une entrée REST en Candle."""
-        ts_utc = pd.to_datetime(k[0], unit="ms", utc=True)
-        candle = Candle(
-            index=self.index,
+        def on_kline(data: dict):
+            queue.put_nowait((time.perf_counter(), data))
+
+        self.logger.info(f"Abonnement au stream Binance {stream}")
+        self._streams.subscribe(stream, on_kline)
+        try:
+            while not self.should_stop():
+                received_at, data = await queue.get()
+                k = data["k"]
+                if k["x"]:  # bougie clôturée
+                    await self._on_closed_kline(k, received_at)
+        finally:
+            self._streams.unsubscribe(stream, on_kline)
+            await self._rest.close()
+
+    async def _on_closed_kline(self, k: dict, received_at: float | None = None):
+        """
+        Publie une bougie clôturée du websocket.
+        Les bougies manquantes depuis la dernière publiée (coupure, reconnexion)
+        sont d'abord rattrapées via REST et publiées dans l'ordre ;
+        les doublons / bougies déjà publiées sont ignorés.
+        """
+        async with self._publish_lock:
+            start_ts = int(k["t"])
+            if self._last_start_ts is not None:
+                if start_ts <= self._last_start_ts:
+                    self.logger.debug(lambda: f"Bougie déjà publiée ignorée : {start_ts}")
+                    return
+                if start_ts > self._last_start_ts + self._interval_ms:
+                    await self._backfill(start_ts - self._interval_ms)
+
+            candle = self._ws_dict_to_candle(k)
+            self.logger.debug(f"Bougie Close : {candle}")
+            await self._publish_candle(candle, received_at)
+
+    async def backfill(self):
+        """
+        Rattrape via REST les bougies clôturées depuis la dernière publiée
+        (appelé par le CandleHeartbeatMonitor quand le flux est déclaré mort).
+        """
+        if self.should_stop():
+            return  # source arrêtée : la session REST est fermée
+        async with self._publish_lock:
+            await self._backfill(BinanceRestClient.last_closed_start_ts(self.interval))
+
+    async def _backfill(self, end_ts: int):
+        if self._last_start_ts is None:
+            return
+        start_ts = self._last_start_ts + self._interval_ms
+        if end_ts < start_ts:
+            return
+
+        missing = (end_ts - start_ts) // self._interval_ms + 1
+        self.logger.warning(f"Trou de {missing} bougie(s) dans le flux depuis {start_ts}, rattrapage REST...")
+        try:
+            klines = await self._rest.fetch_closed_klines(self.symbol, self.interval, start_ts, end_ts)
+        except Exception as e:
+            self.logger.error(f"Erreur rattrapage REST : {e}")
+            return
+
+        candles = CandleColumns.from_klines(klines).to_candles(self.symbol, self._seconds, start_index=self.index)
+        self.index += len(candles)
+        for candle in candles:
+            await self._publish_candle(candle)
+        self.logger.info(f"{len(candles)}/{missing} bougie(s) rattrapée(s)")
+
+    async def _publish_candle(self, candle: Candle, received_at: float | None = None):
+        metrics = self.event_bus.metrics
+        if metrics is not None and received_at is not None:
+            metrics.candle_received(candle, received_at)
+        await self.event_bus.publish(CandleClose(
             symbol=self.symbol,
-            interval=self._seconds,
-            open=float(k[1]),
-            high=float(k[2]),
-            low=float(k[3]),
-            close=float(k[4]),
-            volume=float(k[5]),
-            start_time=ts_utc,
-            end_time=ts_utc + timedelta(seconds=self._seconds)
-        )
-        self.index += 1
-        return candle
+            candle=candle
+        ))
+        if metrics is not None and received_at is not None:
+            metrics.candle_done(candle)
+        self._last_start_ts = candle.start_ts
 
+    # --- Méthodes utilitaires ---
     def _ws_dict_to_candle(self, k) -> Candle:
         """Transforme une entrée websocket en Candle."""
-        ts_utc = datetime.fromtimestamp(k["t"] / 1000, tz=pytz.UTC)
-        candle = Candle(
-            index=self.index,
-            symbol=self.symbol,
-            interval=self._seconds,
-            open=float(k["o"]),
-            high=float(k["h"]),
-            low=float(k["l"]),
-            close=float(k["c"]),
-            volume=float(k["v"]),
-            start_time=ts_utc,
-            end_time=ts_utc + timedelta(seconds=self._seconds)
-        )
+        candle = kline_to_candle(k, self.index, self.symbol, self._seconds)
         self.index += 1
         return candle
+
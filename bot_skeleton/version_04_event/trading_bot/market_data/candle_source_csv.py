@@ -1,13 +1,15 @@
 
-import pandas as pd
 from typing import List, override
-from datetime import datetime, timedelta
+from datetime import datetime
 
 
+from trading_bot.core.candle_columns import CandleColumns
 from trading_bot.core.time_frame import Timeframe
 from trading_bot.core.logger import Logger
 from trading_bot.core.events import Candle, CandleHistoryReady, CandleClose
 from trading_bot.market_data.candle_source import CandleSource
+from trading_bot.market_data.candle_cache import CandleCache, CachedCandles
+from trading_bot.market_data.candle_csv_reader import CandleCsvReader
 from trading_bot.core.event_bus import EventBus
 
 class CandleSourceCsv(CandleSource):
@@ -15,11 +17,15 @@ class CandleSourceCsv(CandleSource):
     Source de données basée sur un fichier CSV.
     Fournit les bougies soit en bloc (warmup),
     soit sous forme de flux simulé (stream).
+
+    Par défaut l'historique complet est chargé une fois par process (CandleCache).
+    Avec params["chunk_size"], params["start"] ou params["end"] (dates ISO, bornes incluses),
+    le flux est lu par blocs depuis le fichier dans un thread (params["read_ahead"] blocs
+    d'avance) : mémoire bornée, premières bougies publiées sans attendre la fin de la lecture,
+    lignes hors plage jamais lues.
     """
     logger = Logger.get("CandleSourceCsv")
 
-    REQUIRED_COLS = {"timestamp", "open", "high", "low", "close", "volume"}
-
     def __init__(self, event_bus: EventBus, params: dict):
         super().__init__(event_bus)
         self.params = params
@@ -27,55 +33,66 @@ class CandleSourceCsv(CandleSource):
         self.logger.info(f"Initialisé - running={self.is_running()}")
         self.index = 0
 
-    def _read_csv(self) -> pd.DataFrame:
-        """Lit le CSV et convertit les timestamps en datetime UTC."""
-        df = pd.read_csv(self.params["path"])
-        if not self.REQUIRED_COLS.issubset(df.columns):
-            raise ValueError(f"[CandleSourceCsv] Le CSV doit contenir les colonnes : {self.REQUIRED_COLS}")
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        return df
-
-    def _create_candle(self, row, seconds) -> Candle:
-        start_time = row["timestamp"].to_pydatetime()
-        end_time = start_time + timedelta(seconds=seconds)
-        candle = Candle(
-            index=self.index,
-            symbol=self.params["symbol"],
-            interval=self.interval,
-            open=float(row["open"]),
-            high=float(row["high"]),
-            low=float(row["low"]),
-            close=float(row["close"]),
-            volume=float(row["volume"]),
-            start_time=start_time,
-            end_time=end_time
-        )
-        self.index += 1
-        return candle
-    
+        self._start_ts = Timeframe.to_epoch_ms(params.get("start"))
+        self._end_ts = Timeframe.to_epoch_ms(params.get("end"))
+        self._chunked = bool(params.get("chunk_size") or self._start_ts or self._end_ts)
+        self._stream_from = self._start_ts
+
+    def _reader(self) -> CandleCsvReader:
+        chunk_size = self.params.get("chunk_size") or CandleCsvReader.DEFAULT_CHUNK_SIZE
+        return CandleCsvReader(self.params["path"], chunk_size=chunk_size)
+
+    def _read_csv(self) -> CandleColumns:
+        """Lit le CSV et convertit les colonnes (timestamps en epoch ms)."""
+        return CandleCsvReader(self.params["path"]).read()
+
+    def _load_entry(self) -> CachedCandles:
+        """Historique complet, lu une seule fois par process via le CandleCache."""
+        p = self.params
+        return CandleCache.shared().get(p["path"], p["symbol"], self.interval, loader=self._read_csv)
+
+    def _load_candles(self) -> List[Candle]:
+        if self._chunked:
+            return self._load_columns().to_candles(self.params["symbol"], self.interval)
+        return self._load_entry().candles
+
+    def _load_columns(self) -> CandleColumns:
+        if self._chunked:
+            return self._reader().read(self._start_ts, self._end_ts)
+        return self._load_entry().columns
+
     @override
     async def _warmup(self):
         p = self.params
-        df = self._read_csv()
-
-        # Limite du nombre de bougies
         warmup_count = p["trading_system"]["warmup_count"]
-        if warmup_count and len(df) > warmup_count:
-            df = df.head(warmup_count)
+        if self._chunked:
+            # Seules les warmup_count premières bougies de la plage sont lues,
+            # les bougies ne sont matérialisées que si un abonné les demande
+            columns = self._reader().read(self._start_ts, self._end_ts, limit=warmup_count)
+            candles = None
+            if len(columns):
+                self._stream_from = int(columns.start_ts[-1]) + 1
+        else:
+            candles = self._load_candles()
+            columns = self._load_columns()
 
-        seconds = int(p["interval"][:-1]) * 60
+            # Limite du nombre de bougies
+            if warmup_count and len(candles) > warmup_count:
+                candles = candles[:warmup_count]
+                columns = columns.slice(0, warmup_count)
+            else:
+                candles = list(candles)
 
-        self.index += 0
-        candles: List[Candle] = [self._create_candle(row, seconds) for _, row in df.iterrows()]
+        self.index = len(columns)
 
-        self.logger.info(f"Snapshot CSV chargé ({len(candles)} bougies)")
-        # self.logger.debug(f"candles {candles} ")
+        self.logger.info(f"Snapshot CSV chargé ({len(columns)} bougies)")
         await self.event_bus.publish(
             CandleHistoryReady(
                 symbol=p["symbol"],
                 timestamp=datetime.now(),
                 period=p["interval"],
-                candles=candles
+                candles=candles,
+                columns=columns
             )
         )
 
@@ -85,23 +102,33 @@ class CandleSourceCsv(CandleSource):
 
     @override
     async def _stream(self):
+        if self._chunked:
+            await self._stream_chunks()
+            return
+
         p = self.params
-        df = self._read_csv()
+        candles = self._load_candles()
 
         warmup_count = p["trading_system"]["warmup_count"]
-        if len(df) > warmup_count:
-            df = df.iloc[warmup_count:]
-        else:
+        if len(candles) <= warmup_count:
             raise ValueError(f"[CandleSourceCsv] Le CSV ne contient pas assez de bougies : len(df) < warmup_count")
 
-        seconds = int(p["interval"][:-1]) * 60
-
-        for _, row in df.iterrows():
+        for candle in candles[warmup_count:]:
             if self.should_stop(): 
                 self.logger.info("Arrêt demandé — fin du flux CSV.")
                 return
         
-            candle = self._create_candle(row, seconds)
+            self.index = candle.index + 1
             # self.logger.debug(f"candles {candle} ")
             await self.event_bus.publish(CandleClose(symbol=p["symbol"], candle=candle))
 
+    async def _stream_chunks(self):
+        """Flux lu par blocs, à la suite des bougies de warmup."""
+        p = self.params
+        async for columns in self._reader().read_ahead(self._stream_from, self._end_ts, depth=p.get("read_ahead", 2)):
+            for candle in columns.to_candles(p["symbol"], self.interval, start_index=self.index):
+                if self.should_stop():
+                    self.logger.info("Arrêt demandé — fin du flux CSV.")
+                    return
+                self.index = candle.index + 1
+                await self.event_bus.publish(CandleClose(symbol=p["symbol"], candle=candle))
@@ -0,0 +1,95 @@
+import os
+from typing import List, override
+from datetime import datetime
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.time_frame import Timeframe
+from trading_bot.core.logger import Logger
+from trading_bot.core.events import Candle, CandleHistoryReady, CandleClose
+from trading_bot.market_data.candle_source import CandleSource
+from trading_bot.market_data.candle_store import CandleStore
+from trading_bot.market_data.candle_cache import CandleCache, CachedCandles
+from trading_bot.core.event_bus import EventBus
+
+
+class CandleSourceStore(CandleSource):
+    """
+    Source de données basée sur le CandleStore colonnaire.
+    params["path"] désigne la racine du store, la série est choisie
+    par params["symbol"] / params["interval"].
+    Le store est lu une seule fois par process (memory-map + CandleCache).
+    """
+    logger = Logger.get("CandleSourceStore")
+
+    def __init__(self, event_bus: EventBus, params: dict):
+        super().__init__(event_bus)
+        self.params = params
+        self.interval = Timeframe.to_seconds(self.params["interval"])
+        self.store = CandleStore(self.params["path"])
+        self.index = 0
+        self.logger.info(f"Initialisé - running={self.is_running()}")
+
+    def _load_entry(self) -> CachedCandles:
+        """Historique lu une seule fois par process via le CandleCache."""
+        p = self.params
+        meta_path = os.path.join(self.store.path_for(p["symbol"], p["interval"]), "meta.json")
+        if not os.path.isfile(meta_path):
+            raise FileNotFoundError(f"[CandleSourceStore] Aucune donnée pour {p['symbol'].upper()} {p['interval']} dans {self.store.root}")
+
+        def loader():
+            return self.store.load(p["symbol"], p["interval"])
+
+        return CandleCache.shared().get(meta_path, p["symbol"], self.interval, loader=loader)
+
+    def _load_candles(self) -> List[Candle]:
+        return self._load_entry().candles
+
+    def _load_columns(self) -> CandleColumns:
+        return self._load_entry().columns
+
+    @override
+    async def _warmup(self):
+        p = self.params
+        candles = self._load_candles()
+        columns = self._load_columns()
+
+        warmup_count = p["trading_system"]["warmup_count"]
+        if warmup_count and len(candles) > warmup_count:
+            candles = candles[:warmup_count]
+            columns = columns.slice(0, warmup_count)
+        else:
+            candles = list(candles)
+
+        self.index = len(candles)
+
+        self.logger.info(f"Snapshot store chargé ({len(candles)} bougies)")
+        await self.event_bus.publish(
+            CandleHistoryReady(
+                symbol=p["symbol"],
+                timestamp=datetime.now(),
+                period=p["interval"],
+                candles=candles,
+                columns=columns
+            )
+        )
+
+    async def join(self):
+        if self._stream_task:
+            await self._stream_task
+
+    @override
+    async def _stream(self):
+        p = self.params
+        candles = self._load_candles()
+
+        warmup_count = p["trading_system"]["warmup_count"]
+        if len(candles) <= warmup_count:
+            raise ValueError(f"[CandleSourceStore] Le store ne contient pas assez de bougies : {len(candles)} <= warmup_count")
+
+        for candle in candles[warmup_count:]:
+            if self.should_stop():
+                self.logger.info("Arrêt demandé — fin du flux store.")
+                return
+
+            self.index = candle.index + 1
+            await self.event_bus.publish(CandleClose(symbol=p["symbol"], candle=candle))
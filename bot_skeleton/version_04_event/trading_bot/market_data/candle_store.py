@@ -0,0 +1,192 @@
+import argparse
+import io
+import json
+import os
+import shutil
+
+import numpy as np
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.logger import Logger
+from trading_bot.market_data.candle_csv_reader import CandleCsvReader
+
+
+class CandleStore:
+    """
+    Stockage colonnaire des bougies sur disque, un répertoire par (symbole, intervalle) :
+
+        <root>/<SYMBOL>/<interval>/start_ts.npy
+                                   open.npy ... volume.npy
+                                   meta.json
+
+    Les fichiers .npy sont relus en memory-map : aucun parsing, les pages
+    ne sont chargées que lorsqu'elles sont lues.
+    """
+
+    logger = Logger.get("CandleStore")
+
+    # En-têtes .npy par version de format (mise à jour de la forme en place par append())
+    _READ_HEADER = {(1, 0): np.lib.format.read_array_header_1_0, (2, 0): np.lib.format.read_array_header_2_0}
+    _WRITE_HEADER = {(1, 0): np.lib.format.write_array_header_1_0, (2, 0): np.lib.format.write_array_header_2_0}
+
+    def __init__(self, root: str):
+        self.root = root
+
+    # ------------------- Chemins -------------------
+    def path_for(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def exists(self, symbol: str, interval: str) -> bool:
+        path = self.path_for(symbol, interval)
+        self._recover(path)
+        return os.path.isfile(os.path.join(path, "meta.json"))
+
+    @staticmethod
+    def _recover(path: str):
+        """Série interrompue entre les deux renommages de write() : l'ancienne version est restaurée."""
+        if not os.path.isdir(path) and os.path.isdir(f"{path}.old"):
+            os.rename(f"{path}.old", path)
+
+    # ------------------- Lecture / Ecriture -------------------
+    def write(self, symbol: str, interval: str, columns: CandleColumns, source: str | None = None):
+        """
+        Ecrit (en écrasant) la série complète du couple symbole / intervalle.
+        Colonnes et meta.json sont écrits dans un répertoire temporaire substitué d'un bloc
+        à la série : une interruption laisse l'ancienne ou la nouvelle version, jamais
+        un mélange des deux. Les memory-maps déjà ouverts sur l'ancienne version restent valides.
+        """
+        path = self.path_for(symbol, interval)
+        self._recover(path)
+        tmp, old = f"{path}.tmp", f"{path}.old"
+        for leftover in (tmp, old):
+            shutil.rmtree(leftover, ignore_errors=True)
+        os.makedirs(tmp)
+
+        for name in CandleColumns.NAMES:
+            dtype = np.int64 if name == "start_ts" else np.float64
+            np.save(os.path.join(tmp, f"{name}.npy"), np.ascontiguousarray(getattr(columns, name), dtype=dtype))
+        meta = self._write_meta(tmp, symbol, interval, len(columns), columns, source)
+
+        if os.path.isdir(path):
+            os.rename(path, old)
+        os.rename(tmp, path)
+        shutil.rmtree(old, ignore_errors=True)
+
+        self.logger.info(f"{meta['symbol']} {interval} : {meta['count']} bougies écrites dans {path}")
+
+    def append(self, symbol: str, interval: str, columns: CandleColumns, source: str | None = None) -> CandleColumns:
+        """
+        Ajoute des bougies à la série existante (dédoublonnées par start_ts,
+        les nouvelles remplacent les anciennes) et retourne la série complète.
+
+        Bougies toutes postérieures à la série : seules les nouvelles lignes sont écrites
+        à la fin des .npy, puis meta.json (count) valide l'ajout. Sinon la série est
+        fusionnée et réécrite (write()).
+        """
+        if not len(columns):
+            return self.load(symbol, interval) if self.exists(symbol, interval) else columns
+        if not self.exists(symbol, interval):
+            self.write(symbol, interval, columns, source=source)
+            return columns
+
+        meta = self.meta(symbol, interval)
+        if meta["last_ts"] is not None and columns.start_ts[0] > meta["last_ts"] and self._append_rows(symbol, interval, columns, meta, source):
+            return self.load(symbol, interval)
+
+        columns = self.load(symbol, interval, mmap=False).merge(columns)
+        self.write(symbol, interval, columns, source=source)
+        return columns
+
+    def _append_rows(self, symbol: str, interval: str, columns: CandleColumns, meta: dict, source: str | None) -> bool:
+        """
+        Ecrit les lignes après les meta["count"] lignes valides de chaque colonne et met à jour
+        l'en-tête .npy en place. Retourne False si un en-tête change de taille (réécriture complète).
+        Une interruption avant meta.json laisse des lignes au-delà de count, ignorées par load().
+        """
+        path = self.path_for(symbol, interval)
+        count = meta["count"]
+        total = count + len(columns)
+
+        for name in CandleColumns.NAMES:
+            with open(os.path.join(path, f"{name}.npy"), "r+b") as f:
+                version = np.lib.format.read_magic(f)
+                _, fortran_order, dtype = self._READ_HEADER[version](f)
+                offset = f.tell()
+
+                header = io.BytesIO()
+                self._WRITE_HEADER[version](header, {"descr": np.lib.format.dtype_to_descr(dtype),
+                                                     "fortran_order": fortran_order, "shape": (total,)})
+                if len(header.getvalue()) != offset:
+                    return False
+
+                f.seek(offset + count * dtype.itemsize)
+                f.truncate()
+                f.write(np.ascontiguousarray(getattr(columns, name), dtype=dtype).tobytes())
+                f.seek(0)
+                f.write(header.getvalue())
+
+        first_ts = meta["first_ts"]
+        meta = self._write_meta(path, symbol, interval, total, columns, source, first_ts=first_ts)
+        self.logger.debug(lambda: f"{meta['symbol']} {interval} : {len(columns)} bougies ajoutées ({total} au total)")
+        return True
+
+    @staticmethod
+    def _write_meta(path: str, symbol: str, interval: str, count: int, columns: CandleColumns,
+                    source: str | None, first_ts: int | None = None) -> dict:
+        """meta.json écrit en dernier via un fichier temporaire : il valide les colonnes."""
+        meta = {
+            "symbol": symbol.upper(),
+            "interval": interval,
+            "count": count,
+            "first_ts": first_ts if first_ts is not None else (int(columns.start_ts[0]) if len(columns) else None),
+            "last_ts": int(columns.start_ts[-1]) if len(columns) else None,
+            "source": source,
+        }
+        target = os.path.join(path, "meta.json")
+        with open(f"{target}.tmp", "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(f"{target}.tmp", target)
+        return meta
+
+    def load(self, symbol: str, interval: str, mmap: bool = True) -> CandleColumns:
+        """
+        Relit la série du couple symbole / intervalle (memory-map par défaut).
+        Seules les meta["count"] premières lignes de chaque colonne sont valides.
+        """
+        if not self.exists(symbol, interval):
+            raise FileNotFoundError(f"[CandleStore] Aucune donnée pour {symbol.upper()} {interval} dans {self.root}")
+
+        path = self.path_for(symbol, interval)
+        count = self.meta(symbol, interval)["count"]
+        mmap_mode = "r" if mmap else None
+        arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in CandleColumns.NAMES]
+        short = [name for name, array in zip(CandleColumns.NAMES, arrays) if len(array) < count]
+        if short:
+            raise ValueError(f"[CandleStore] {symbol.upper()} {interval} corrompu : {short} < {count} lignes")
+        return CandleColumns(*(array[:count] if len(array) > count else array for array in arrays))
+
+    def meta(self, symbol: str, interval: str) -> dict:
+        with open(os.path.join(self.path_for(symbol, interval), "meta.json")) as f:
+            return json.load(f)
+
+    # ------------------- Conversion CSV -------------------
+    def import_csv(self, csv_path: str, symbol: str, interval: str) -> CandleColumns:
+        """Conversion unique d'un CSV historique Binance vers le store."""
+        columns = CandleCsvReader(csv_path).read()
+        self.write(symbol, interval, columns, source=os.path.basename(csv_path))
+        return columns
+
+
+if __name__ == "__main__":
+    # Exemple :
+    # python -m trading_bot.market_data.candle_store \
+    #     --csv ../hitorique_binance/ETHUSDC_5m_historique_20250914_20251114.csv \
+    #     --symbol ethusdc --interval 5m --store ../hitorique_binance/store
+    parser = argparse.ArgumentParser(description="Conversion CSV -> CandleStore")
+    parser.add_argument("--csv", required=True)
+    parser.add_argument("--symbol", required=True)
+    parser.add_argument("--interval", required=True)
+    parser.add_argument("--store", required=True)
+    args = parser.parse_args()
+
+    CandleStore(args.store).import_csv(args.csv, args.symbol, args.interval)
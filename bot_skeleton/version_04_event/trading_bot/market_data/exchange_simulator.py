@@ -0,0 +1,350 @@
+import argparse
+import asyncio
+import json
+from typing import Dict, List, Set
+
+import numpy as np
+from aiohttp import web, WSMsgType
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.logger import Logger
+from trading_bot.core.time_frame import Timeframe
+from trading_bot.market_data.binance_rest_client import BinanceRestClient
+from trading_bot.market_data.candle_csv_reader import CandleCsvReader
+from trading_bot.market_data.stream_recorder import StreamLogReader
+
+
+def _dumps(payload) -> str:
+    return json.dumps(payload, separators=(",", ":"))
+
+
+class _KlineSeries:
+    """Série rejouée : colonnes + curseur (index de la prochaine bougie à clôturer)."""
+
+    __slots__ = ("symbol", "interval", "interval_ms", "columns", "start_ts", "cursor", "history")
+
+    def __init__(self, symbol: str, interval: str, columns: CandleColumns, history: int):
+        self.symbol = symbol.upper()
+        self.interval = interval
+        self.interval_ms = Timeframe.to_seconds(interval) * 1000
+        self.columns = columns
+        self.history = min(history, len(columns))
+        self.start_ts = np.asarray(columns.start_ts, dtype=np.int64)
+        self.cursor = self.history
+
+    def rebase(self, last_closed_ts: int):
+        """Décale les timestamps : la dernière bougie de l'historique est la dernière clôturée."""
+        ts = np.asarray(self.columns.start_ts, dtype=np.int64)
+        ref = ts[self.history - 1] if self.history else ts[0] - self.interval_ms
+        self.start_ts = ts + (last_closed_ts - int(ref))
+
+    def rest_kline(self, i: int) -> list:
+        c, t = self.columns, int(self.start_ts[i])
+        return [t, str(float(c.open[i])), str(float(c.high[i])), str(float(c.low[i])), str(float(c.close[i])),
+                str(float(c.volume[i])), t + self.interval_ms - 1, "0", 0, "0", "0", "0"]
+
+    def ws_kline(self, i: int, closed: bool, event_ms: int) -> dict:
+        c, t = self.columns, int(self.start_ts[i])
+        return {"e": "kline", "E": event_ms, "s": self.symbol, "k": {
+            "t": t, "T": t + self.interval_ms - 1, "s": self.symbol, "i": self.interval,
+            "o": str(float(c.open[i])), "c": str(float(c.close[i])),
+            "h": str(float(c.high[i])), "l": str(float(c.low[i])),
+            "v": str(float(c.volume[i])), "n": 0, "x": closed,
+        }}
+
+    def last_price(self) -> float:
+        return float(self.columns.close[max(self.cursor - 1, 0)])
+
+
+class _Connection:
+    __slots__ = ("ws", "combined", "streams")
+
+    def __init__(self, ws: web.WebSocketResponse, combined: bool, streams: Set[str]):
+        self.ws = ws
+        self.combined = combined
+        self.streams = streams
+
+
+class ExchangeSimulator:
+    """
+    Serveur local (aiohttp) qui imite l'API Binance Spot pour tester le temps réel hors ligne :
+
+    - REST : /api/v3/klines, /api/v3/depth, /api/v3/ticker/price,
+    - websocket : combined streams (/stream?streams=a/b, SUBSCRIBE / UNSUBSCRIBE)
+      et streams simples (/ws/<stream>), klines et depth (@depthN, @depthN@100ms, @depth),
+    - klines rejouées depuis des CSV hitorique_binance (ou des CandleColumns) : les
+      `history` premières bougies sont déjà clôturées au démarrage (timestamps décalés
+      pour que la dernière soit la dernière bougie clôturée réelle), les suivantes
+      sont clôturées toutes les interval / speedup secondes,
+    - captures de messages websocket (StreamRecorder, JSONL {"ts", "stream", "data"}) rejouées
+      avec leurs écarts d'origine divisés par speedup,
+    - depth synthétique autour du dernier close (REST et streams @depth abonnés).
+
+    Les clients s'y branchent via BINANCE_REST_URL / BINANCE_WS_URL (rest_url / ws_url).
+    """
+
+    logger = Logger.get("ExchangeSimulator")
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, speedup: float = 60.0,
+                 kline_updates: int = 0, depth_period: float = 0.1):
+        self.host = host
+        self.port = port
+        self.speedup = speedup
+        self.kline_updates = kline_updates
+        self.depth_period = depth_period
+
+        self._series: Dict[tuple, _KlineSeries] = {}
+        self._captures: List[list] = []
+        self._connections: Set[_Connection] = set()
+        self._tasks: List[asyncio.Task] = []
+        self._runner: web.AppRunner | None = None
+        self._update_id = 0
+
+        # Compteurs (benchmarks de débit)
+        self.messages_sent = 0
+        self.rest_requests = 0
+
+        self.app = web.Application()
+        self.app.add_routes([
+            web.get("/api/v3/klines", self._handle_klines),
+            web.get("/api/v3/depth", self._handle_depth),
+            web.get("/api/v3/ticker/price", self._handle_ticker_price),
+            web.get("/stream", self._handle_ws),
+            web.get("/ws/{stream}", self._handle_ws),
+        ])
+
+    # ------------------- Données -------------------
+    def add_klines(self, symbol: str, interval: str, columns: CandleColumns, history: int = 1000):
+        self._series[(symbol.upper(), interval)] = _KlineSeries(symbol, interval, columns, history)
+
+    def add_csv(self, csv_path: str, symbol: str, interval: str, history: int = 1000):
+        self.add_klines(symbol, interval, CandleCsvReader(csv_path).read(), history)
+
+    def add_capture(self, path: str):
+        """
+        Capture de messages websocket : journal StreamRecorder (répertoire ou segment .jsonl.gz)
+        ou fichier JSONL, une ligne {"ts": epoch ms, "stream": ..., "data": ...}.
+        """
+        messages = list(StreamLogReader(path).frames())
+        self._captures.append(sorted(messages, key=lambda m: m["ts"]))
+
+    # ------------------- Cycle de vie -------------------
+    @property
+    def rest_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/stream"
+
+    async def start(self):
+        for series in self._series.values():
+            series.rebase(BinanceRestClient.last_closed_start_ts(series.interval))
+
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+        self._tasks = [asyncio.create_task(self._replay_klines(s)) for s in self._series.values()]
+        self._tasks += [asyncio.create_task(self._replay_capture(c)) for c in self._captures]
+        self._tasks.append(asyncio.create_task(self._publish_depth()))
+        self.logger.info(f"Simulateur démarré : {self.rest_url} / {self.ws_url} (x{self.speedup})")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for conn in list(self._connections):
+            await conn.ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        self.logger.info(f"Simulateur arrêté ({self.messages_sent} messages, {self.rest_requests} requêtes REST)")
+
+    # ------------------- REST -------------------
+    def _find_series(self, request) -> _KlineSeries | None:
+        symbol = request.query.get("symbol", "").upper()
+        interval = request.query.get("interval")
+        if interval is not None:
+            return self._series.get((symbol, interval))
+        return next((s for (sym, _), s in self._series.items() if sym == symbol), None)
+
+    @staticmethod
+    def _invalid_symbol():
+        return web.json_response({"code": -1121, "msg": "Invalid symbol."}, status=400)
+
+    async def _handle_klines(self, request):
+        self.rest_requests += 1
+        series = self._find_series(request)
+        if series is None:
+            return self._invalid_symbol()
+
+        limit = min(int(request.query.get("limit", 500)), 1000)
+        visible = series.start_ts[:series.cursor]
+        lo = int(np.searchsorted(visible, int(request.query["startTime"]))) if "startTime" in request.query else None
+        hi = int(np.searchsorted(visible, int(request.query["endTime"]), side="right")) if "endTime" in request.query else len(visible)
+        if lo is None:
+            lo = max(hi - limit, 0)
+        return web.json_response([series.rest_kline(i) for i in range(lo, min(hi, lo + limit))], dumps=_dumps)
+
+    async def _handle_depth(self, request):
+        self.rest_requests += 1
+        series = self._find_series(request)
+        if series is None:
+            return self._invalid_symbol()
+        return web.json_response(self._depth(series, min(int(request.query.get("limit", 100)), 5000)), dumps=_dumps)
+
+    async def _handle_ticker_price(self, request):
+        self.rest_requests += 1
+        if "symbol" not in request.query:
+            prices = {s.symbol: s.last_price() for s in self._series.values()}
+            return web.json_response([{"symbol": sym, "price": str(p)} for sym, p in prices.items()], dumps=_dumps)
+        series = self._find_series(request)
+        if series is None:
+            return self._invalid_symbol()
+        return web.json_response({"symbol": series.symbol, "price": str(series.last_price())}, dumps=_dumps)
+
+    def _depth(self, series: _KlineSeries, levels: int) -> dict:
+        """Carnet synthétique : niveaux espacés de 0.01 % autour du dernier close."""
+        self._update_id += 1
+        price = series.last_price()
+        steps = np.arange(1, levels + 1) * price * 1e-4
+        quantities = np.round(1.0 + (np.arange(levels) % 7) * 0.5, 3)
+        return {
+            "lastUpdateId": self._update_id,
+            "bids": [[f"{p:.8f}", str(q)] for p, q in zip(price - steps, quantities)],
+            "asks": [[f"{p:.8f}", str(q)] for p, q in zip(price + steps, quantities)],
+        }
+
+    # ------------------- Websocket -------------------
+    async def _handle_ws(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        if "stream" in request.match_info:
+            conn = _Connection(ws, combined=False, streams={request.match_info["stream"]})
+        else:
+            conn = _Connection(ws, combined=True, streams=set(filter(None, request.query.get("streams", "").split("/"))))
+        self._connections.add(conn)
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                req = json.loads(msg.data)
+                method, params = req.get("method"), req.get("params", [])
+                result = None
+                if method == "SUBSCRIBE":
+                    conn.streams.update(params)
+                elif method == "UNSUBSCRIBE":
+                    conn.streams.difference_update(params)
+                elif method == "LIST_SUBSCRIPTIONS":
+                    result = sorted(conn.streams)
+                await ws.send_str(_dumps({"result": result, "id": req.get("id")}))
+        finally:
+            self._connections.discard(conn)
+        return ws
+
+    def _subscribed(self, stream: str) -> bool:
+        return any(stream in conn.streams for conn in self._connections)
+
+    async def _broadcast(self, stream: str, data: dict):
+        raw = combined = None
+        for conn in list(self._connections):
+            if stream not in conn.streams or conn.ws.closed:
+                continue
+            if conn.combined:
+                combined = combined or _dumps({"stream": stream, "data": data})
+                text = combined
+            else:
+                raw = raw or _dumps(data)
+                text = raw
+            try:
+                await conn.ws.send_str(text)
+                self.messages_sent += 1
+            except ConnectionError:
+                self._connections.discard(conn)
+
+    # ------------------- Rejeu -------------------
+    async def _replay_klines(self, series: _KlineSeries):
+        loop = asyncio.get_running_loop()
+        stream = f"{series.symbol.lower()}@kline_{series.interval}"
+        period = series.interval_ms / 1000 / self.speedup
+        step = period / (self.kline_updates + 1)
+        deadline = loop.time()
+
+        while series.cursor < len(series.columns):
+            i = series.cursor
+            # Mises à jour intermédiaires de la bougie en cours (x = false)
+            for _ in range(self.kline_updates):
+                deadline += step
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+                await self._broadcast(stream, series.ws_kline(i, closed=False, event_ms=int(series.start_ts[i])))
+
+            deadline += step
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            series.cursor += 1
+            await self._broadcast(stream, series.ws_kline(i, closed=True, event_ms=int(series.start_ts[i]) + series.interval_ms))
+
+        self.logger.info(f"{series.symbol} {series.interval} : fin du rejeu ({len(series.columns)} bougies)")
+
+    async def _replay_capture(self, messages: list):
+        loop = asyncio.get_running_loop()
+        start, first_ts = loop.time(), messages[0]["ts"] if messages else 0
+        for m in messages:
+            await asyncio.sleep(max(0.0, start + (m["ts"] - first_ts) / 1000 / self.speedup - loop.time()))
+            await self._broadcast(m["stream"], m["data"])
+
+    async def _publish_depth(self):
+        while True:
+            await asyncio.sleep(self.depth_period)
+            streams = {s for conn in self._connections for s in conn.streams if "@depth" in s}
+            for stream in streams:
+                symbol, kind = stream.split("@", 1)
+                series = next((s for (sym, _), s in self._series.items() if sym == symbol.upper()), None)
+                if series is None:
+                    continue
+                digits = kind.split("@")[0][len("depth"):]
+                depth = self._depth(series, int(digits) if digits else 10)
+                if not digits:
+                    # Stream différentiel
+                    depth = {"e": "depthUpdate", "s": series.symbol, "u": depth["lastUpdateId"],
+                             "b": depth["bids"], "a": depth["asks"]}
+                await self._broadcast(stream, depth)
+
+
+if __name__ == "__main__":
+    # Exemple :
+    # python -m trading_bot.market_data.exchange_simulator \
+    #     --csv ../hitorique_binance/ETHUSDC_5m_historique_20250914_20251114.csv \
+    #     --symbol ethusdc --interval 5m --speedup 300 --port 9300
+    # puis : BINANCE_REST_URL=http://127.0.0.1:9300 BINANCE_WS_URL=ws://127.0.0.1:9300/stream
+    parser = argparse.ArgumentParser(description="Simulateur local de l'API Binance")
+    parser.add_argument("--csv", action="append", default=[])
+    parser.add_argument("--symbol", action="append", default=[])
+    parser.add_argument("--interval", action="append", default=[])
+    parser.add_argument("--capture", action="append", default=[])
+    parser.add_argument("--history", type=int, default=1000)
+    parser.add_argument("--speedup", type=float, default=60.0)
+    parser.add_argument("--kline-updates", type=int, default=0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9300)
+    args = parser.parse_args()
+
+    simulator = ExchangeSimulator(host=args.host, port=args.port, speedup=args.speedup, kline_updates=args.kline_updates)
+    for csv_path, symbol, interval in zip(args.csv, args.symbol, args.interval):
+        simulator.add_csv(csv_path, symbol, interval, history=args.history)
+    for capture in args.capture:
+        simulator.add_capture(capture)
+
+    async def main():
+        await simulator.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await simulator.stop()
+
+    asyncio.run(main())
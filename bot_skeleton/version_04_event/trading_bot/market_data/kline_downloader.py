@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import itertools
+import os
+from typing import Dict, Iterable, Tuple
+
+import pandas as pd
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.logger import Logger
+from trading_bot.core.time_frame import Timeframe
+from trading_bot.market_data.binance_rest_client import BinanceRestClient
+from trading_bot.market_data.candle_store import CandleStore
+
+
+class KlineDownloader:
+    """
+    Téléchargement incrémental de l'historique Binance vers un CandleStore,
+    pour plusieurs couples (symbole, intervalle) en parallèle :
+
+    - reprise après la dernière bougie du store (meta.json "last_ts"),
+      sinon depuis start_ts (avancé à la première bougie existante du symbole),
+    - la plage est récupérée par tranches de chunk_candles bougies, ajoutées au store
+      au fur et à mesure : un téléchargement interrompu reprend là où il s'est arrêté,
+    - un seul BinanceRestClient partagé : connexions poolées et budget de poids
+      par minute commun à tous les couples.
+
+    Les timestamps sont des epoch ms (ouverture de bougie).
+    """
+
+    logger = Logger.get("KlineDownloader")
+
+    def __init__(self, store: CandleStore, rest: BinanceRestClient | None = None,
+                 pair_concurrency: int = 4, chunk_candles: int = 50_000):
+        self.store = store
+        self.rest = rest or BinanceRestClient(concurrency=8)
+        self.pair_concurrency = pair_concurrency
+        self.chunk_candles = chunk_candles
+
+    async def close(self):
+        await self.rest.close()
+
+    # ------------------- Téléchargement -------------------
+    def resume_ts(self, symbol: str, interval: str, start_ts: int) -> int:
+        """Première bougie à demander : après la fin du store, sinon start_ts."""
+        if self.store.exists(symbol, interval):
+            last_ts = self.store.meta(symbol, interval)["last_ts"]
+            if last_ts is not None:
+                return max(start_ts, last_ts + Timeframe.to_seconds(interval) * 1000)
+        return start_ts
+
+    async def download(self, symbol: str, interval: str, start_ts: int, end_ts: int | None = None) -> int:
+        """Complète le store pour un couple, retourne le nombre de bougies ajoutées."""
+        interval_ms = Timeframe.to_seconds(interval) * 1000
+        if end_ts is None:
+            end_ts = self.rest.last_closed_start_ts(interval)
+
+        fetch_from = self.resume_ts(symbol, interval, start_ts)
+        if not self.store.exists(symbol, interval):
+            # Evite de parcourir des pages vides avant la cotation du symbole
+            first = await self.rest.get_klines(symbol, interval, start_ts, end_ts, limit=1)
+            if not first:
+                self.logger.info(f"{symbol.upper()} {interval} : aucune bougie disponible")
+                return 0
+            fetch_from = int(first[0][0])
+
+        added = 0
+        chunk_ms = self.chunk_candles * interval_ms
+        for chunk_start in range(fetch_from, end_ts + 1, chunk_ms):
+            chunk_end = min(chunk_start + chunk_ms - interval_ms, end_ts)
+            klines = await self.rest.fetch_closed_klines(symbol, interval, chunk_start, chunk_end)
+            if klines:
+                self.store.append(symbol, interval, CandleColumns.from_klines(klines), source="binance_rest")
+                added += len(klines)
+            self.logger.debug(lambda: f"{symbol.upper()} {interval} : {added} bougies ajoutées (jusqu'à {chunk_end})")
+
+        self.logger.info(f"{symbol.upper()} {interval} : {added} nouvelles bougies depuis {fetch_from}")
+        return added
+
+    async def download_all(self, pairs: Iterable[Tuple[str, str]], start_ts: int,
+                           end_ts: int | None = None) -> Dict[Tuple[str, str], int | Exception]:
+        """
+        Télécharge tous les couples (au plus pair_concurrency à la fois).
+        Retourne, par couple, le nombre de bougies ajoutées ou l'exception rencontrée.
+        """
+        semaphore = asyncio.Semaphore(self.pair_concurrency)
+
+        async def run(symbol: str, interval: str):
+            async with semaphore:
+                try:
+                    return await self.download(symbol, interval, start_ts, end_ts)
+                except Exception as e:
+                    self.logger.error(f"{symbol.upper()} {interval} : échec du téléchargement ({e})")
+                    return e
+
+        pairs = [(symbol.upper(), interval) for symbol, interval in pairs]
+        results = await asyncio.gather(*[run(symbol, interval) for symbol, interval in pairs])
+        return dict(zip(pairs, results))
+
+    # ------------------- Export CSV -------------------
+    def export_csv(self, symbol: str, interval: str, directory: str) -> int:
+        """
+        Ajoute au CSV <directory>/<SYMBOL>_<interval>_historique.csv les bougies du store
+        postérieures à sa dernière ligne (format des CSV historiques Binance).
+        Retourne le nombre de lignes ajoutées.
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{symbol.upper()}_{interval}_historique.csv")
+        columns = self.store.load(symbol, interval)
+
+        last_ts = _csv_last_ts(path)
+        start = 0 if last_ts is None else int(columns.start_ts.searchsorted(last_ts, side="right"))
+        new = columns.slice(start)
+        if not len(new):
+            return 0
+
+        df = pd.DataFrame({
+            "timestamp": pd.to_datetime(new.start_ts, unit="ms", utc=True),
+            "open": new.open,
+            "high": new.high,
+            "low": new.low,
+            "close": new.close,
+            "volume": new.volume,
+        })
+        header = not os.path.isfile(path) or os.path.getsize(path) == 0
+        df.to_csv(path, mode="a", header=header, index=False)
+        self.logger.info(f"{len(df)} lignes ajoutées à {path}")
+        return len(df)
+
+
+def _csv_last_ts(path: str) -> int | None:
+    """Timestamp (epoch ms) de la dernière ligne d'un CSV, sans le relire en entier."""
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 4096))
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    last = lines[-1].split(b",", 1)[0].decode() if lines else "timestamp"
+    if last == "timestamp":
+        # fichier vide ou en-tête seul
+        return None
+    return Timeframe.to_epoch_ms(last)
+
+
+if __name__ == "__main__":
+    # Exemple :
+    # python -m trading_bot.market_data.kline_downloader \
+    #     --symbol ethusdc --symbol btcusdc --interval 1m --interval 5m \
+    #     --start 2023-01-01 --store ../hitorique_binance/store --csv ../hitorique_binance
+    parser = argparse.ArgumentParser(description="Téléchargement incrémental de l'historique Binance")
+    parser.add_argument("--symbol", action="append", required=True)
+    parser.add_argument("--interval", action="append", required=True)
+    parser.add_argument("--store", required=True)
+    parser.add_argument("--start", default="2023-01-01")
+    parser.add_argument("--end", default=None)
+    parser.add_argument("--csv", default=None, help="répertoire d'export CSV incrémental")
+    parser.add_argument("--pair-concurrency", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8, help="requêtes HTTP simultanées")
+    parser.add_argument("--weight-limit", type=int, default=5000)
+    args = parser.parse_args()
+
+    pairs = list(itertools.product(args.symbol, args.interval))
+    downloader = KlineDownloader(
+        CandleStore(args.store),
+        BinanceRestClient(concurrency=args.concurrency, weight_limit=args.weight_limit),
+        pair_concurrency=args.pair_concurrency
+    )
+
+    async def main():
+        try:
+            return await downloader.download_all(pairs, Timeframe.to_epoch_ms(args.start), Timeframe.to_epoch_ms(args.end))
+        finally:
+            await downloader.close()
+
+    results = asyncio.run(main())
+    failed = False
+    for (symbol, interval), result in results.items():
+        if isinstance(result, Exception):
+            failed = True
+            print(f"{symbol} {interval} : échec ({result})")
+            continue
+        print(f"{symbol} {interval} : +{result} bougies")
+        if args.csv and downloader.store.exists(symbol, interval):
+            downloader.export_csv(symbol, interval, args.csv)
+    raise SystemExit(1 if failed else 0)
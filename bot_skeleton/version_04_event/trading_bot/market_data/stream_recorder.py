@@ -0,0 +1,166 @@
+import asyncio
+import glob
+import gzip
+import os
+import time
+import zlib
+from typing import Iterable, Iterator
+
+from trading_bot.core.event_bus import EventBus
+from trading_bot.core.events import StreamMessage
+from trading_bot.core.logger import Logger
+from trading_bot.market_data import binance_decoder
+
+_STREAM_PREFIX = b'{"stream":"'
+
+
+class StreamRecorder:
+    """
+    Enregistre les frames brutes du combined stream Binance (klines, depth, trades...)
+    dans un journal compact, en append-only :
+
+        <directory>/<prefix>-<epoch ms du premier frame>.jsonl.gz
+
+    Chaque ligne est le frame d'origine préfixé de l'heure de réception, sans
+    re-sérialisation : {"ts":<epoch ms>,"stream":...,"data":...}
+    (format des captures de l'ExchangeSimulator).
+    Un nouveau segment est ouvert quand le segment courant dépasse segment_bytes
+    (non compressés) ou segment_seconds.
+
+    S'attache à un BinanceStreamManager : manager.add_recorder(recorder).
+    """
+
+    logger = Logger.get("StreamRecorder")
+
+    def __init__(self, directory: str, prefix: str = "binance", streams: Iterable[str] | None = None,
+                 segment_bytes: int = 64 * 1024 * 1024, segment_seconds: float = 3600, compresslevel: int = 6):
+        self.directory = directory
+        self.prefix = prefix
+        self.streams = set(streams) if streams is not None else None
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.compresslevel = compresslevel
+
+        self._file = None
+        self._segment_path = None
+        self._segment_size = 0
+        self._segment_started = 0.0
+
+        # Compteurs
+        self.frames = 0
+        self.segments = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, frame: bytes | str, ts: int | None = None):
+        """Ajoute un frame combined stream brut ({"stream":...,"data":...})."""
+        if isinstance(frame, str):
+            frame = frame.encode()
+        if not frame.startswith(_STREAM_PREFIX):
+            # Réponses SUBSCRIBE / UNSUBSCRIBE
+            return
+        if self.streams is not None:
+            stream = frame[len(_STREAM_PREFIX):frame.index(b'"', len(_STREAM_PREFIX))].decode()
+            if stream not in self.streams:
+                return
+
+        if ts is None:
+            ts = int(time.time() * 1000)
+        line = b'{"ts":%d,%s\n' % (ts, frame[1:])
+
+        if self._file is None or self._segment_size >= self.segment_bytes \
+                or time.monotonic() - self._segment_started >= self.segment_seconds:
+            self._rotate(ts)
+
+        self._file.write(line)
+        self._segment_size += len(line)
+        self.frames += 1
+
+    def _rotate(self, ts: int):
+        self._close_segment()
+        self._segment_path = os.path.join(self.directory, f"{self.prefix}-{ts}.jsonl.gz")
+        self._file = gzip.open(self._segment_path, "ab", compresslevel=self.compresslevel)
+        self._segment_size = 0
+        self._segment_started = time.monotonic()
+        self.segments += 1
+        self.logger.info(f"Nouveau segment : {self._segment_path}")
+
+    def _close_segment(self):
+        if self._file is not None:
+            self._file.close()
+            self.logger.debug(lambda: f"Segment fermé : {self._segment_path} ({self._segment_size} octets)")
+            self._file = None
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        self._close_segment()
+
+
+class StreamLogReader:
+    """
+    Relecture d'un journal StreamRecorder (répertoire, segment .jsonl.gz ou capture .jsonl).
+    Les segments sont lus dans l'ordre, un segment tronqué (arrêt brutal du recorder)
+    est lu jusqu'à sa dernière ligne lisible.
+    """
+
+    logger = Logger.get("StreamLogReader")
+
+    def __init__(self, path: str, prefix: str = "binance"):
+        if os.path.isdir(path):
+            pattern = os.path.join(path, f"{prefix}-*.jsonl*")
+            self.paths = sorted(glob.glob(pattern), key=self._segment_key)
+        else:
+            self.paths = [path]
+
+    @staticmethod
+    def _segment_key(path: str):
+        stem = os.path.basename(path).split(".")[0]
+        ts = stem.rsplit("-", 1)[-1]
+        return (int(ts) if ts.isdigit() else 0, path)
+
+    def _lines(self, path: str) -> Iterator[bytes]:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            try:
+                for line in f:
+                    if line.strip():
+                        yield line
+            except (EOFError, gzip.BadGzipFile, zlib.error) as e:
+                self.logger.warning(f"Segment tronqué {path} : {e!r}")
+
+    def frames(self, streams: Iterable[str] | None = None) -> Iterator[dict]:
+        """Frames {"ts", "stream", "data"} dans l'ordre d'enregistrement."""
+        streams = set(streams) if streams is not None else None
+        for path in self.paths:
+            for line in self._lines(path):
+                try:
+                    frame = binance_decoder.decode(line)
+                except Exception:
+                    # dernière ligne incomplète d'un segment tronqué
+                    self.logger.warning(f"Ligne illisible ignorée dans {path}")
+                    continue
+                if streams is None or frame["stream"] in streams:
+                    yield frame
+
+    async def replay(self, event_bus: EventBus, speed: float | None = 1.0, streams: Iterable[str] | None = None) -> int:
+        """
+        Publie les frames sur l'EventBus (StreamMessage, topic = stream découpé sur "@"),
+        au rythme d'origine divisé par speed (speed=None : sans attente).
+        Retourne le nombre de frames publiés.
+        """
+        loop = asyncio.get_running_loop()
+        start = first_ts = None
+        count = 0
+        for frame in self.frames(streams):
+            if speed:
+                if first_ts is None:
+                    start, first_ts = loop.time(), frame["ts"]
+                delay = start + (frame["ts"] - first_ts) / 1000 / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await event_bus.publish(StreamMessage(stream=frame["stream"], data=frame["data"], ts=frame["ts"]))
+            count += 1
+        return count
@@ -17,13 +17,10 @@ class MaCrossFastSlowSignalEngine:
 
         self.entry_price = None
 
-        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update)
+        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update, topic=("EmaCrossDetector",))
 
     async def on_indicator_update(self, event: IndicatorUpdated):
         # update des donnée selemnt , la stratégie est déclacnché par le candle close
-        if event.values.get("type") != "EmaCrossDetector":
-            return
-            
         fast_period = event.values.get("fast_period")
         slow_period = event.values.get("slow_period")
         fast_value = event.values.get("fast_value")
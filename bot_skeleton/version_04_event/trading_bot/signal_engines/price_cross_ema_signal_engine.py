@@ -13,13 +13,11 @@ class PriceCrossEmaSignalEngine:
         self.ema_value = None
         self.ema_band_with = 0.008 # 0.001 = 0.1 %
 
-        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update)
+        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update, topic=("MovingAverage", "EMA", ema_period))
 
 
     async def on_indicator_update(self, event: IndicatorUpdated):
 
-        if event.values.get("type") != "MovingAverage":
-            return
         period = event.values.get("ema_period")
         value = event.values.get("ema_value")
 
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
 from trading_bot.core.logger import Logger
-from trading_bot.core.event_bus import EventBus
+from trading_bot.core.event_bus import EventBus, Priority
 from trading_bot.core.events import TradeSignalGenerated, CandleClose
 
 
@@ -13,7 +13,7 @@ class RandomSignalEngine:
         self.event_bus = event_bus
         self.entry_price = None
 
-        self.event_bus.subscribe(CandleClose, self.on_candle_close)
+        self.event_bus.subscribe(CandleClose, self.on_candle_close, priority=Priority.SIGNAL)
         self.logger.info("[RandomSignalEngine] Initisé") 
 
     async def on_candle_close(self, event: CandleClose):
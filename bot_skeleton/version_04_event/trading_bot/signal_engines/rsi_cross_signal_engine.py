@@ -39,8 +39,9 @@ class RSICrossSignalEngine:
         self.prev_rsi_fast = None
         self.prev_rsi_slow = None
 
-        # Abonnements
-        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update)
+        # Abonnements : uniquement les RSI des deux périodes suivies
+        for period in dict.fromkeys((rsi_fast_period, rsi_slow_period)):
+            self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update, topic=("RSI", period))
 
         self._logger.info(
             f"Initialisé fast={rsi_fast_period} slow={rsi_slow_period}"
@@ -49,9 +50,6 @@ class RSICrossSignalEngine:
     # ------------------- RSI updates (intra-bougie) -------------------
     async def on_indicator_update(self, event: IndicatorUpdated):
         values = event.values
-        if values.get("type") != "RSI":
-            return
-
         candle = event.candle
         period = values.get("rsi_period")
         rsi_value = values.get("rsi_value")
@@ -61,10 +59,10 @@ class RSICrossSignalEngine:
 
         if period == self.rsi_fast_period:
             self.prev_rsi_fast = self.rsi_fast
-            self.rsi_fast = (rsi_value, candle.start_time)
+            self.rsi_fast = (rsi_value, candle.start_ts)
         elif period == self.rsi_slow_period:
             self.prev_rsi_slow = self.rsi_slow
-            self.rsi_slow = (rsi_value, candle.start_time)
+            self.rsi_slow = (rsi_value, candle.start_ts)
 
         # self._logger.debug(
         #     f"prev_fast={self.prev_rsi_fast} prev_slow={self.prev_rsi_slow} | "
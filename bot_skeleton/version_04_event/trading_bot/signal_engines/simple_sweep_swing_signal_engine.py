@@ -1,5 +1,5 @@
 from trading_bot.core.logger import Logger
-from trading_bot.core.event_bus import EventBus
+from trading_bot.core.event_bus import EventBus, Priority
 from trading_bot.core.events import TradeSignalGenerated, IndicatorUpdated, CandleClose
 
 
@@ -21,16 +21,12 @@ class SimpleSweepSwingSignalEngine:
         self.window_high = None
 
         # Abonnements
-        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update)
-        self.event_bus.subscribe(CandleClose, self.on_candle_close)
+        self.event_bus.subscribe(IndicatorUpdated, self.on_indicator_update, topic=("SimpleSwingDetector",))
+        self.event_bus.subscribe(CandleClose, self.on_candle_close, priority=Priority.SIGNAL)
         self.logger.info("Initisé") 
 
     async def on_indicator_update(self, event: IndicatorUpdated):
         """Récupère les swings forts émis par l'indicateur. IndicatorSimpleSwingDetector"""
-        event_type = event.values.get("type")
-        if event_type not in ("SimpleSwingDetector"):
-            return
-        
         self.last_swing_high = event.values["last_swing_high"]
         self.last_swing_low = event.values["last_swing_low"]
         self.window_low = event.values["window_low"]
@@ -10,6 +10,7 @@
 from trading_bot.core.logger import Logger
 from trading_bot.core.event_bus import EventBus
 
+from trading_bot.indicators.indicator_registry import IndicatorRegistry
 from trading_bot.indicators.moving_average.moving_average import MovingAverage
 from trading_bot.indicators.ema_cross_detector.ema_cross_detector import EmaCrossDetector
 
@@ -40,20 +41,23 @@ class MaCrossFastSlowSystemTrading():
 
         p = self.params
 
-        self._ema_fast = MovingAverage(
-            event_bus, 
+        # Indicateurs partagés avec les autres bots du process (même symbole / intervalle)
+        indicators = IndicatorRegistry.shared()
+
+        self._ema_fast = indicators.acquire(
+            self.event_bus, p["symbol"], p["interval"], MovingAverage, 
             period=p["trading_system"]["fast_period"], 
             mode="EMA"
         )
 
-        self._ema_slow = MovingAverage(
-            event_bus, 
+        self._ema_slow = indicators.acquire(
+            self.event_bus, p["symbol"], p["interval"], MovingAverage, 
             period=p["trading_system"]["slow_period"], 
             mode="EMA"
         )
      
-        self._indicator_ema_cross_detector = EmaCrossDetector(
-                self.event_bus,               
+        self._indicator_ema_cross_detector = indicators.acquire(
+                self.event_bus, p["symbol"], p["interval"], EmaCrossDetector,               
                 fast_period=p["trading_system"]["fast_period"],  
                 slow_period=p["trading_system"]["slow_period"], 
                 min_gap=p["trading_system"]["min_gap"],  
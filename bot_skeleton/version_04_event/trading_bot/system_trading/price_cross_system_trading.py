@@ -2,6 +2,7 @@ from trading_bot.signal_engines.price_cross_ema_signal_engine import PriceCrossE
 from trading_bot.core.logger import Logger
 from trading_bot.core.event_bus import EventBus
 
+from trading_bot.indicators.indicator_registry import IndicatorRegistry
 from trading_bot.indicators.moving_average.moving_average import MovingAverage
 
 from trading_bot.risk_manager.risk_manager import RiskManager 
@@ -29,8 +30,11 @@ class PriceCrossSystemTrading():
 
         p = self.params
 
-        self._ema = MovingAverage(
-            event_bus, 
+        # Indicateurs partagés avec les autres bots du process (même symbole / intervalle)
+        indicators = IndicatorRegistry.shared()
+
+        self._ema = indicators.acquire(
+            self.event_bus, p["symbol"], p["interval"], MovingAverage, 
             period=p["trading_system"]["ema_period"], 
             mode="EMA"
         )
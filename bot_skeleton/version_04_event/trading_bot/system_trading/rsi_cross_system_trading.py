@@ -12,6 +12,7 @@ from trading_bot.core.event_bus import EventBus
 
 from trading_bot.bots import BOTS_CONFIG
 
+from trading_bot.indicators.indicator_registry import IndicatorRegistry
 from trading_bot.indicators.rsi.rsi import RSI
 from trading_bot.indicators.atr.atr import Atr
 
@@ -43,18 +44,21 @@ class RSICrossSystemTrading():
 
         p = self.params
 
-        self.rsi_fast = RSI(
-            event_bus, 
+        # Indicateurs partagés avec les autres bots du process (même symbole / intervalle)
+        indicators = IndicatorRegistry.shared()
+
+        self.rsi_fast = indicators.acquire(
+            self.event_bus, p["symbol"], p["interval"], RSI, 
             period=p["trading_system"]["rsi_fast_period"]
         )
 
-        self.rsi_slow = RSI(
-            event_bus, 
+        self.rsi_slow = indicators.acquire(
+            self.event_bus, p["symbol"], p["interval"], RSI, 
             period=p["trading_system"]["rsi_slow_period"]
         )
      
-        self.atr = Atr(
-            event_bus, 
+        self.atr = indicators.acquire(
+            self.event_bus, p["symbol"], p["interval"], Atr, 
             period=p["trading_system"]["atr_period"]
         )  
 
@@ -0,0 +1,232 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from trading_bot.core.candle_columns import CandleColumns
+from trading_bot.core.logger import Logger
+from trading_bot.core.time_frame import Timeframe
+from trading_bot.trader.exit_scan import scan_exits, OUTCOME_TP, OUTCOME_SL
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class RSICrossVectorizedSystemTrading():
+    """
+    Equivalent NumPy du pipeline RSICrossSystemTrading pour le backtest :
+    RSI rapide / lent, phase ATR, croisement, filtre ATR, RiskManager,
+    TraderOnlyOnePosition et PortfolioManager, sans EventBus.
+
+    Reproduit la sémantique du chemin événementiel (warmup, initialisation
+    des indicateurs, drapeaux de sur-achat du RSI lent, entrée sur la bougie N+1,
+    cooldown) et produit le même journal de trades que TradeJournal.
+    Les récurrences de Wilder restent des boucles scalaires (dépendance séquentielle).
+    """
+
+    _logger = Logger.get("RSICrossVectorizedSystemTrading")
+
+    # Constantes du chemin événementiel
+    RSI_OVERSOLD = 30.0
+    RSI_OVERBOUGHT = 70.0
+    ATR_ACCUMULATION_THRESHOLD = 0.7
+    ATR_EXPANSION_THRESHOLD = 1.3
+    ATR_HISTORY_MULTIPLIER = 3
+    COOLDOWN = timedelta(minutes=3)  # TraderOnlyOnePosition.cooldown
+
+    def __init__(self, params: dict):
+        self.params = params
+        self._trades = []
+
+        self._logger.info(f"Initialisé")
+
+    # ------------------------------------------------------------------
+    # Exécution
+    # ------------------------------------------------------------------
+    def run(self, columns: CandleColumns):
+        p = self.params
+        ts = p["trading_system"]
+
+        warmup_count = ts["warmup_count"]
+        if len(columns) <= warmup_count:
+            raise ValueError(f"[RSICrossVectorizedSystemTrading] Pas assez de bougies : {len(columns)} <= warmup_count")
+
+        # Même découpage que CandleSourceCsv : historique [0, warmup[ puis flux [warmup, n[
+        warmup = warmup_count if warmup_count else len(columns)
+
+        signals = self._signals(columns, warmup)
+        self._trades = self._simulate(columns, signals)
+
+        self._logger.info(f"Backtest vectorisé terminé : {int(np.count_nonzero(signals))} signaux, {len(self._trades)} trades")
+
+    def get_trades_journal(self) -> list:
+        trades = self._trades.copy()
+        return trades
+
+    # ------------------------------------------------------------------
+    # Signaux (RSICrossSignalEngine + AtrFilter + RiskManager.with_filter)
+    # ------------------------------------------------------------------
+    def _signals(self, columns: CandleColumns, warmup: int) -> np.ndarray:
+        """
+        Retourne un tableau int8 de la taille du flux : +1 BUY, -1 SELL, 0 rien.
+        signals[i] correspond à la bougie warmup + i.
+        """
+        ts = self.params["trading_system"]
+        stream_len = len(columns) - warmup
+        signals = np.zeros(stream_len, dtype=np.int8)
+
+        closes = np.asarray(columns.close, dtype=np.float64)
+        rsi_fast = self._wilder_rsi(closes, ts["rsi_fast_period"], warmup)
+        rsi_slow = self._wilder_rsi(closes, ts["rsi_slow_period"], warmup)
+        if rsi_fast is None or rsi_slow is None:
+            # RSI non initialisé : le signal engine ne reçoit jamais les deux RSI
+            return signals
+
+        prev_fast, fast = rsi_fast[:-1], rsi_fast[1:]
+        prev_slow, slow = rsi_slow[:-1], rsi_slow[1:]
+
+        # Le croisement est évalué sur l'event du RSI lent (publié en second) :
+        # ses drapeaux sont croisés comme dans RSI._publish
+        slow_flag_oversold = slow >= self.RSI_OVERBOUGHT
+        slow_flag_overbought = slow <= self.RSI_OVERSOLD
+
+        bullish = (prev_fast < prev_slow) & (fast > slow) & ((fast - slow) >= 0) & (fast > 50) & ~slow_flag_overbought
+        bearish = (prev_fast > prev_slow) & (fast < slow) & ((slow - fast) >= 0) & (fast < 50) & ~slow_flag_oversold
+
+        signals[bullish] = 1
+        signals[bearish & ~bullish] = -1
+
+        if ts.get("atr_filter", False):
+            expansion = self._atr_expansion(columns, ts["atr_period"], warmup)
+            signals[~expansion] = 0
+
+        return signals
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float:
+        if avg_loss == 0:
+            return 100.0
+        rs = avg_gain / avg_loss
+        return 100.0 - (100.0 / (1.0 + rs))
+
+    def _wilder_rsi(self, closes: np.ndarray, period: int, warmup: int) -> np.ndarray | None:
+        """
+        RSI publiés pour les bougies warmup-1 (initialisation) à n-1,
+        avec la même arithmétique que IndicatorRSICalculator.
+        """
+        if warmup < period + 1:
+            return None
+
+        deltas = np.diff(closes[warmup - 1 - period:])
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
+
+        avg_gain = float(np.mean(gains[:period]))
+        avg_loss = float(np.mean(losses[:period]))
+
+        out = np.empty(len(closes) - warmup + 1)
+        out[0] = self._rsi(avg_gain, avg_loss)
+        for i, (gain, loss) in enumerate(zip(gains[period:].tolist(), losses[period:].tolist()), start=1):
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            out[i] = self._rsi(avg_gain, avg_loss)
+        return out
+
+    def _atr_expansion(self, columns: CandleColumns, period: int, warmup: int) -> np.ndarray:
+        """
+        Phase "expansion" de l'ATR Wilder (ATRCalculator) pour chaque bougie du flux.
+        Tout est False si l'ATR n'a pas pu être initialisé.
+        """
+        stream_len = len(columns) - warmup
+        if warmup < period:
+            return np.zeros(stream_len, dtype=bool)
+
+        high = np.asarray(columns.high, dtype=np.float64)
+        low = np.asarray(columns.low, dtype=np.float64)
+        close = np.asarray(columns.close, dtype=np.float64)
+
+        # True range : la première bougie de l'initialisation n'a pas de close précédent
+        start = warmup - min(warmup, period * self.ATR_HISTORY_MULTIPLIER)
+        prev_close = close[start:-1]
+        tr = np.empty(len(close) - start)
+        tr[0] = high[start] - low[start]
+        tr[1:] = np.maximum.reduce([
+            high[start + 1:] - low[start + 1:],
+            np.abs(high[start + 1:] - prev_close),
+            np.abs(low[start + 1:] - prev_close),
+        ])
+
+        # Wilder : premier ATR = moyenne simple, puis lissage
+        atr = np.empty(len(tr) - period + 1)
+        current = float(np.mean(tr[:period]))
+        atr[0] = current
+        for i, value in enumerate(tr[period:].tolist(), start=1):
+            current = ((current * (period - 1)) + value) / period
+            atr[i] = current
+
+        # Moyenne glissante sur l'historique ATR (deque maxlen = period * multiplier)
+        window = period * self.ATR_HISTORY_MULTIPLIER
+        means = np.empty(len(atr))
+        head = min(window - 1, len(atr))
+        for i in range(head):
+            means[i] = np.mean(atr[:i + 1])
+        if len(atr) >= window:
+            means[window - 1:] = sliding_window_view(atr, window).mean(axis=1)
+
+        counts = np.minimum(np.arange(1, len(atr) + 1), window)
+        ready = counts >= period * 2
+        ratio = np.divide(atr, means, out=np.zeros_like(atr), where=means > 0)
+        expansion = ready & (ratio > self.ATR_EXPANSION_THRESHOLD)
+
+        # atr[j] correspond à la bougie start + period - 1 + j : on garde le flux
+        offset = warmup - (start + period - 1)
+        return expansion[offset:]
+
+    # ------------------------------------------------------------------
+    # Exécution des trades (RiskManager + TraderOnlyOnePosition + PortfolioManager)
+    # ------------------------------------------------------------------
+    def _simulate(self, columns: CandleColumns, signals: np.ndarray) -> list:
+        p = self.params
+        ts = p["trading_system"]
+        warmup = len(columns) - len(signals)
+
+        close = np.asarray(columns.close, dtype=np.float64)
+        interval_ms = Timeframe.to_seconds(p["interval"]) * 1000
+        end_ts = np.asarray(columns.start_ts, dtype=np.int64) + interval_ms
+
+        # RiskManager : niveaux TP / SL au close de la bougie du signal
+        signal_idx = np.flatnonzero(signals) + warmup
+        sides = signals[signal_idx - warmup]
+        entry_prices = close[signal_idx]
+        tp = np.where(sides > 0, entry_prices * (1 + ts["tp_pct"] / 100), entry_prices * (1 - ts["tp_pct"] / 100))
+        sl = np.where(sides > 0, entry_prices * (1 - ts["sl_pct"] / 100), entry_prices * (1 + ts["sl_pct"] / 100))
+
+        # TraderOnlyOnePosition : positions, annulations et cooldown
+        exit_idx, outcome = scan_exits(signal_idx, sides, tp, sl, columns.high, columns.low, close, end_ts, cooldown=self.COOLDOWN)
+
+        # PortfolioManager : la taille dépend du solde après les trades précédents
+        solde = p["initial_capital"]
+        trades = []
+        for i in np.flatnonzero((outcome == OUTCOME_TP) | (outcome == OUTCOME_SL)).tolist():
+            side = "BUY" if sides[i] > 0 else "SELL"
+            target = "TP" if outcome[i] == OUTCOME_TP else "SL"
+            entry_price = float(entry_prices[i])
+            size = solde / entry_price
+
+            exit_price = float(tp[i] if target == "TP" else sl[i])
+            pnl = (exit_price - entry_price) * size if side == "BUY" else (entry_price - exit_price) * size
+            solde += pnl
+
+            trades.append({
+                "side": side,
+                "entry_price": entry_price,
+                "exit_price": exit_price,
+                "tp": float(tp[i]),
+                "sl": float(sl[i]),
+                "size": size,
+                "target": target,
+                "open_timestamp": _EPOCH + timedelta(milliseconds=int(end_ts[signal_idx[i]])),
+                "close_timestamp": _EPOCH + timedelta(milliseconds=int(end_ts[exit_idx[i]])),
+                "pnl": pnl
+            })
+
+        return trades
@@ -13,6 +13,7 @@ from trading_bot.core.logger import Logger
 
 from trading_bot.core.event_bus import EventBus
 
+from trading_bot.indicators.indicator_registry import IndicatorRegistry
 from trading_bot.indicators.simple_swing_detector.simple_swing_detector import SimpleSwingDetector
 from trading_bot.signal_engines.simple_sweep_swing_signal_engine import  SimpleSweepSwingSignalEngine
 
@@ -40,8 +41,11 @@ class SimpleSweepSystemTrading():
         self._logger.info(f"Demmarage demandé")
 
         p = self.params
+
+        # Indicateurs partagés avec les autres bots du process (même symbole / intervalle)
+        indicators = IndicatorRegistry.shared()
     
-        self._indicator_swing_detector = SimpleSwingDetector(self.event_bus, swing_side=p["trading_system"]["swing_side"], swing_window=p["trading_system"]["swing_window"])
+        self._indicator_swing_detector = indicators.acquire(self.event_bus, p["symbol"], p["interval"], SimpleSwingDetector, swing_side=p["trading_system"]["swing_side"], swing_window=p["trading_system"]["swing_window"])
 
         self.signal_engine = SimpleSweepSwingSignalEngine(self.event_bus)      
         
@@ -2,13 +2,10 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-import pandas as pd 
-
 from trading_bot.core.logger import Logger
 from trading_bot.core.event_bus import EventBus
 from trading_bot.core.events import TradeClose
-from trading_bot.trainer.statistiques_engine import StatsEngine
-from trading_bot.trainer.statistiques_engine import *
+from trading_bot.trainer.statistiques_engine import StreamingStats
 
 class TradeJournal:
     """Journalise tous les trades fermés et calcule le P&L total."""
@@ -20,6 +17,7 @@ class TradeJournal:
         self._total_pnl = 0.0
         self._pnl_total_avec_frais = 0.0
         self._frais_par_transaction = 0.01
+        self._stats = StreamingStats()
         
         self._event_bus.subscribe(TradeClose, self._on_trade_close)
         
@@ -77,14 +75,16 @@ class TradeJournal:
             f"P&L = {pnl:.2f} | Total = {self._total_pnl:.2f} | Total - Frais = {self._pnl_total_avec_frais:.2f}"
         )
 
-        # Analyse via StatsEngine
-        stats, trades_list = StatsEngine().analyze(
-            df=pd.DataFrame(self._trades),
-        )
+        # Stats incrémentales (analyse complète via StatsEngine dans Bot.get_stats)
+        self._stats.update(pnl)
+        stats = self._stats.stats()
         self.logger.info(" | ".join(f"{k}: {float(v):.4f}" if isinstance(v, float) or hasattr(v, 'item') else f"{k}: {v}" for k, v in stats.items()))
                         
     def get_trades_journal(self) -> list:
         trades =  self._trades.copy()
         return trades
+
+    def get_stats(self) -> dict:
+        return self._stats.stats()
     
 
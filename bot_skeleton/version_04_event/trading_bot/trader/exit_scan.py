@@ -0,0 +1,164 @@
+from datetime import timedelta
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba est optionnel : repli sur le scan NumPy
+    numba = None
+
+
+# Issue d'un signal (tableau outcome retourné par scan_exits)
+OUTCOME_SKIPPED = 0         # ignoré : position active ou cooldown
+OUTCOME_TP = 1              # clôturé au take profit
+OUTCOME_SL = 2              # clôturé au stop loss
+OUTCOME_NOT_TRIGGERED = 3   # prix d'entrée hors de la bougie N+1 : trade annulé
+OUTCOME_OPEN = 4            # toujours ouvert en fin de données
+
+DEFAULT_COOLDOWN = timedelta(minutes=3)
+
+# Taille initiale de la fenêtre du scan NumPy (doublée tant qu'aucune sortie n'est trouvée)
+_SCAN_WINDOW = 64
+
+
+def scan_exits(signal_idx, sides, tp, sl, high, low, close, end_ts, cooldown: timedelta = DEFAULT_COOLDOWN):
+    """
+    Résolution des sorties TP/SL avec la sémantique de TraderOnlyOnePosition :
+    - un signal est ignoré tant qu'un trade est actif, et pendant le cooldown
+      qui suit une clôture ou une annulation (end_time - last_close < cooldown),
+    - le trade est approuvé au close de la bougie du signal et n'entre en position
+      que si ce prix est dans [low, high] de la bougie N+1, sinon il est annulé,
+    - TP / SL sont testés à partir de la bougie N+1, le TP est prioritaire
+      quand les deux sont touchés sur la même bougie,
+    - un trade non résolu en fin de données reste OUTCOME_OPEN et bloque les signaux suivants.
+
+    signal_idx : index (croissants) des bougies portant un signal
+    sides      : +1 BUY / -1 SELL, aligné sur signal_idx
+    tp, sl     : niveaux TP / SL alignés sur signal_idx
+    high, low, close, end_ts : colonnes des bougies (end_ts en epoch ms)
+
+    Retourne (exit_idx, outcome) alignés sur signal_idx.
+    exit_idx vaut -1 pour OUTCOME_SKIPPED / OUTCOME_OPEN.
+    """
+    signal_idx = np.ascontiguousarray(signal_idx, dtype=np.int64)
+    sides = np.ascontiguousarray(sides, dtype=np.int8)
+    tp = np.ascontiguousarray(tp, dtype=np.float64)
+    sl = np.ascontiguousarray(sl, dtype=np.float64)
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    end_ts = np.ascontiguousarray(end_ts, dtype=np.int64)
+    cooldown_ms = int(cooldown.total_seconds() * 1000)
+
+    exit_idx = np.full(len(signal_idx), -1, dtype=np.int64)
+    outcome = np.full(len(signal_idx), OUTCOME_SKIPPED, dtype=np.int8)
+
+    kernel = _scan_exits_jit if _scan_exits_jit is not None else _scan_exits_numpy
+    kernel(signal_idx, sides, tp, sl, high, low, close, end_ts, cooldown_ms, exit_idx, outcome)
+    return exit_idx, outcome
+
+
+def _scan_exits_loop(signal_idx, sides, tp, sl, high, low, close, end_ts, cooldown_ms, exit_idx, outcome):
+    """Noyau scalaire (compilé par numba quand il est disponible)."""
+    n = len(high)
+    last_close = -1
+
+    for i in range(len(signal_idx)):
+        k = signal_idx[i]
+
+        if last_close >= 0:
+            if k <= last_close or end_ts[k] - end_ts[last_close] < cooldown_ms:
+                continue
+
+        entry = k + 1
+        if entry >= n:
+            outcome[i] = OUTCOME_OPEN
+            return
+
+        entry_price = close[k]
+        if not (low[entry] <= entry_price <= high[entry]):
+            outcome[i] = OUTCOME_NOT_TRIGGERED
+            exit_idx[i] = entry
+            last_close = entry
+            continue
+
+        found = False
+        for j in range(entry, n):
+            if sides[i] > 0:
+                if high[j] >= tp[i]:
+                    outcome[i] = OUTCOME_TP
+                    found = True
+                elif low[j] <= sl[i]:
+                    outcome[i] = OUTCOME_SL
+                    found = True
+            else:
+                if low[j] <= tp[i]:
+                    outcome[i] = OUTCOME_TP
+                    found = True
+                elif high[j] >= sl[i]:
+                    outcome[i] = OUTCOME_SL
+                    found = True
+            if found:
+                exit_idx[i] = j
+                last_close = j
+                break
+
+        if not found:
+            outcome[i] = OUTCOME_OPEN
+            return
+
+
+def _scan_exits_numpy(signal_idx, sides, tp, sl, high, low, close, end_ts, cooldown_ms, exit_idx, outcome):
+    """
+    Même algorithme que _scan_exits_loop, la recherche de la bougie de sortie
+    est faite par blocs NumPy (fenêtre doublée) au lieu d'une boucle bougie par bougie.
+    """
+    n = len(high)
+    last_close = -1
+
+    for i, k in enumerate(signal_idx.tolist()):
+        if last_close >= 0:
+            if k <= last_close or end_ts[k] - end_ts[last_close] < cooldown_ms:
+                continue
+
+        entry = k + 1
+        if entry >= n:
+            outcome[i] = OUTCOME_OPEN
+            return
+
+        entry_price = close[k]
+        if not (low[entry] <= entry_price <= high[entry]):
+            outcome[i] = OUTCOME_NOT_TRIGGERED
+            exit_idx[i] = entry
+            last_close = entry
+            continue
+
+        start = entry
+        window = _SCAN_WINDOW
+        while start < n:
+            stop = min(start + window, n)
+            if sides[i] > 0:
+                hit_tp = high[start:stop] >= tp[i]
+                hit_sl = low[start:stop] <= sl[i]
+            else:
+                hit_tp = low[start:stop] <= tp[i]
+                hit_sl = high[start:stop] >= sl[i]
+
+            hit = hit_tp | hit_sl
+            if hit.any():
+                first = int(np.argmax(hit))
+                # TP prioritaire sur SL sur une même bougie
+                outcome[i] = OUTCOME_TP if hit_tp[first] else OUTCOME_SL
+                exit_idx[i] = start + first
+                last_close = start + first
+                break
+
+            start = stop
+            window *= 2
+
+        if last_close < entry:
+            outcome[i] = OUTCOME_OPEN
+            return
+
+
+_scan_exits_jit = numba.njit(cache=True)(_scan_exits_loop) if numba is not None else None
@@ -2,7 +2,7 @@ from datetime import timedelta
 
 from trading_bot.core.logger import Logger
 
-from trading_bot.core.event_bus import EventBus
+from trading_bot.core.event_bus import EventBus, Priority
 from trading_bot.core.events import TradeApproved, TradeClose, CandleClose
 
 from trading_bot.trader.trade import Trade
@@ -14,13 +14,26 @@ class TraderOnlyOnePosition:
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
         self.event_bus.subscribe(TradeApproved, self.on_trade_approved)
-        self.event_bus.subscribe(CandleClose, self.on_candle_close)
+        self.event_bus.subscribe(CandleClose, self.on_candle_close, priority=Priority.TRADER)
 
         self.active_trade: Trade = None  # ✅ Une seule position à la fois
-        self.last_close_timestamp = None
+        self.last_close_timestamp = None  # epoch ms
         self.cooldown = timedelta(minutes=3)
+        self._cooldown_ms = self.cooldown.total_seconds() * 1000
+
+    def _record_action(self, candle):
+        # Latence réception bougie -> action du trader (EventBus instrumenté uniquement)
+        if self.event_bus.metrics is not None:
+            self.event_bus.metrics.trader_acted(candle)
 
     async def on_trade_approved(self, event: TradeApproved):
+        self._open(event)
+
+    def on_trade_approved_sync(self, event: TradeApproved):
+        """Entrée synchrone de on_trade_approved (EventBus.publish_sync)."""
+        self._open(event)
+
+    def _open(self, event: TradeApproved):
         # Ignorer si une position est déjà ouverte
         if self.active_trade is not None:
             # print("[Trader] ⚠️ Signal ignoré : une position est déjà ouverte.")
@@ -28,8 +41,8 @@ class TraderOnlyOnePosition:
 
         # Ignorer si la période de cooldown n'est pas écoulée
         if self.last_close_timestamp is not None:
-            elapsed = event.candle.end_time - self.last_close_timestamp
-            if elapsed < self.cooldown:
+            elapsed = event.candle.end_ts - self.last_close_timestamp
+            if elapsed < self._cooldown_ms:
                 # print(f"[Trader] ⚠️ Cooldown actif ({elapsed}). Signal ignoré.")
                 return
             
@@ -53,13 +66,25 @@ class TraderOnlyOnePosition:
         #     "close_timestamp": None,
         #     "candle_open": event.candle
         # }
+        self._record_action(event.candle)
         self.logger.debug(f"✅ Nouvelle position ouverte : {self.active_trade} | TradeApproved={event}"
               )
 
     async def on_candle_close(self, event: CandleClose):
-
+        trade_close = self._check_exit(event)
+        if trade_close is not None:
+            await self.event_bus.publish(trade_close)
+
+    def on_candle_close_sync(self, event: CandleClose):
+        """Entrée synchrone de on_candle_close (EventBus.publish_sync)."""
+        trade_close = self._check_exit(event)
+        if trade_close is not None:
+            self.event_bus.publish_sync(trade_close)
+
+    def _check_exit(self, event: CandleClose) -> TradeClose | None:
+        """Suit la position sur la bougie, retourne le TradeClose à publier si TP / SL est touché."""
         if not self.active_trade:
-            return
+            return None
         
         # il faut vérifier que la bougie qui arrive est la bougie N+1 par rapport au trade ouver
         candle_open = self.active_trade.candle_open
@@ -68,6 +93,7 @@ class TraderOnlyOnePosition:
             if current_candle.low <= candle_open.close <= current_candle.high:
                 # si le prix de cloture de la bougie n-1 est compris dans la bougie n alors le trade est déclenché
                 self.active_trade.enter_position()
+                self._record_action(current_candle)
                 self.logger.debug(f"Entrer en position : {self.active_trade} candle={current_candle}")
                 # pas de rturn on peut évaluer si le trade touche tp ou sl a la bougie N+1
                 # raise Exception("toto")
@@ -76,8 +102,9 @@ class TraderOnlyOnePosition:
                 # le trade actif n'est pas déclecnhé sur la bougie N+1 donc il est annuler
                 self.logger.debug(f"Trade non déclanché : {self.active_trade} candle={current_candle}")
                 self.active_trade = None
-                self.last_close_timestamp = event.candle.end_time
-                return
+                self.last_close_timestamp = event.candle.end_ts
+                self._record_action(current_candle)
+                return None
 
         trade = self.active_trade
         side = trade.side
@@ -98,9 +125,14 @@ class TraderOnlyOnePosition:
         if target:
 
             self.active_trade.close(target, current_candle)
+            self._record_action(current_candle)
             self.logger.debug(f"Trade close : {self.active_trade} candle={current_candle}")
 
-            await self.event_bus.publish(TradeClose(
+            # Position libérée avant la publication (aucun abonné de TradeClose ne relit le trader)
+            self.active_trade = None
+            self.last_close_timestamp = event.candle.end_ts
+
+            return TradeClose(
                 side=side,
                 size=trade.size,
                 candle_open=trade.candle_open,
@@ -108,10 +140,6 @@ class TraderOnlyOnePosition:
                 tp=trade.tp,
                 sl=trade.sl,
                 target=target
-            ))
-
-            self.active_trade = None
-            self.last_close_timestamp = event.candle.end_time
-
-
+            )
 
+        return None
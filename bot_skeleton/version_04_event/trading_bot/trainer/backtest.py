@@ -14,18 +14,27 @@ class Backtest:
     def __init__(self, bot_type:str=None):
         self._bot_type = bot_type
 
-    async def execute(self, params: dict = None):
+    async def execute(self, params: dict = None, vectorized: bool = False, replay: bool = False):
  
         self.logger.info(f"Backtest avec params={params}")
 
         bot = Bot(self._bot_type, "bot_01")
 
-        bot.set_backtest_mode()
+        # vectorized=True : fast-path NumPy sans EventBus (si le bot en fournit un)
+        # replay=True     : même SystemTrading, rejoué de façon synchrone (ReplayEngine)
+        if vectorized:
+            bot.set_vectorized_mode()
+        elif replay:
+            bot.set_replay_mode()
+        else:
+            bot.set_backtest_mode()
         bot.sync(params)
 
         trades_list = await bot.start()
 
         stats, trades_list = bot.get_stats()
+        # Rend au registre du process les indicateurs partagés du bot
+        bot.stop()
 
         self.logger.debug(" | ".join(f"{k}: {float(v):.4f}" if isinstance(v, float) or hasattr(v, 'item') else f"{k}: {v}" for k, v in stats.items()))
         self.logger.info("Backtest Terminé !")
@@ -149,3 +149,59 @@ class StatsEngine:
             stats = ind.compute(df, stats, params)
 
         return stats, df
+
+
+# --------------------------
+# 3) StreamingStats
+# --------------------------
+class StreamingStats:
+    """
+    Mêmes indicateurs que StatsEngine, mis à jour trade par trade en O(1)
+    (TradeJournal). StatsEngine reste la référence pour l'analyse complète.
+    """
+
+    def __init__(self, params: dict = None):
+        self.params = params or {}
+        self._score = NormalizedScoreIndicator(weights={
+            "s_total_profit": 0.3,
+            "s_win_rate": 0.4,
+            "s_max_drawdown_pct": 0.2,
+            "s_num_trades": 0.1
+        })
+
+        self.num_trades = 0
+        self.num_wins = 0
+        self.total_profit = 0.0
+
+        # Drawdown sur le P&L cumulé (pic = plus haut P&L cumulé déjà atteint)
+        self._peak = None
+        self.max_drawdown = 0.0
+
+        self._streak = 0
+        self.max_winning_streak = 0
+
+    def update(self, pnl: float):
+        self.num_trades += 1
+        self.total_profit += pnl
+
+        if self._peak is None or self.total_profit > self._peak:
+            self._peak = self.total_profit
+        self.max_drawdown = max(self.max_drawdown, self._peak - self.total_profit)
+
+        if pnl > 0:
+            self.num_wins += 1
+            self._streak += 1
+            self.max_winning_streak = max(self.max_winning_streak, self._streak)
+        else:
+            self._streak = 0
+
+    def stats(self) -> dict:
+        capital_initial = self.params.get("capital_initial", 1000)
+        stats = {
+            "s_total_profit": self.total_profit,
+            "s_win_rate": self.num_wins / self.num_trades if self.num_trades else 0,
+            "s_num_trades": self.num_trades,
+            "s_max_drawdown_pct": (self.max_drawdown / capital_initial) * 100 if self.num_trades else 0,
+            "s_max_winning_streak": self.max_winning_streak,
+        }
+        return self._score.compute(None, stats, self.params)
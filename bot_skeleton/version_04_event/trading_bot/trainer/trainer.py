@@ -1,15 +1,48 @@
 from itertools import product
+import copy
 import logging
+import math
+import os
 import pandas as pd
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from trading_bot.bots import BOTS_CONFIG
+from trading_bot.bots.engine.backtest_engine import BacktestEngine
 from trading_bot.core.logger import Logger
 from trading_bot.trainer.backtest import Backtest
 
 
+###############################################################################
+# Exécution en process séparés (mode="process")
+# Fonctions de module => picklables par le ProcessPoolExecutor
+###############################################################################
+def _init_worker(default_level, custom_levels: dict, preload_params: list):
+    """Initialisation d'un worker : niveaux de logs du parent + préchargement des bougies."""
+    Logger.set_default_level(default_level)
+    for name, level in custom_levels.items():
+        Logger.set_level(name, level)
+
+    for params in preload_params:
+        BacktestEngine.preload(params)
+
+
+def _run_backtest_chunk(bot_type: str, units: list, vectorized: bool = False) -> list:
+    """Exécute séquentiellement un lot de (idx, params) dans un worker."""
+    async def _async_execute():
+        results = []
+        for idx, params in units:
+            stats, trades_list = await Backtest(bot_type).execute(params, vectorized=vectorized)
+            stats["name"] = f"Bot_{idx}"
+            results.append(stats)
+        return results
+
+    return asyncio.run(_async_execute())
+
+
 class BotTrainer:
     logger = Logger.get("BotTrainer")
+    THREAD_WORKERS = 10
 
     def __init__(self, bot_type):
         self._bot_type = bot_type      # garder la classe pour ré-instancier
@@ -58,7 +91,7 @@ class BotTrainer:
     ###########################################################################
     # 1) Exécution d'un backtest sur un set de paramètres
     ###########################################################################
-    def _sync_run_single_bot(self, idx, params):
+    def _sync_run_single_bot(self, idx, params, vectorized=False):
         """Exécution synchrone pour ThreadPoolExecutor"""
         async def _async_execute():
             bot_name = f"Bot_{idx}"
@@ -66,7 +99,7 @@ class BotTrainer:
 
             # Créer une instance du bot et du Backtest
             bt_executor = Backtest(self._bot_type)
-            stats, trades_list = await bt_executor.execute(params)
+            stats, trades_list = await bt_executor.execute(params, vectorized=vectorized)
             
             # Ajouter le nom du bot dans les stats
             stats["name"] = bot_name
@@ -78,39 +111,70 @@ class BotTrainer:
         return asyncio.run(_async_execute())
 
     ###########################################################################
-    # 2) Exécution complète (ThreadPool + async)
+    # 2) Exécution complète (ThreadPool ou ProcessPool + async)
     ###########################################################################
-    async def run(self, param_grid, verbose=True, max_workers=10):
+    async def run(self, param_grid, verbose=True, max_workers=None, mode="thread", chunksize=None, vectorized=False):
+        """
+        mode="thread"  : un thread par combinaison (limité par le GIL, backtests CPU)
+        mode="process" : ProcessPoolExecutor, les combinaisons sont envoyées par lots
+                         de chunksize à des workers qui préchargent les bougies une fois.
+        vectorized=True : backtests via le fast-path NumPy du bot (sans EventBus).
+        max_workers=None : os.cpu_count() workers en mode process, THREAD_WORKERS threads sinon.
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Mode inconnu : {mode}. Valeurs acceptées : thread, process.")
+
         all_param_grids = self._all_param_grids(param_grid)
         total_passages = len(all_param_grids)
         results = []
         loop = asyncio.get_event_loop()
 
-        self.logger.info(f"🔧 Total combinaisons : {total_passages}")
+        self.logger.info(f"🔧 Total combinaisons : {total_passages} (mode={mode})")
 
         # -------------------------
         # 1. Exécution parallèle des bots
         # -------------------------
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if mode == "process":
+            max_workers = max_workers or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(Logger._default_level, dict(Logger._custom_levels), self._preload_params()),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers or self.THREAD_WORKERS)
+
+        with executor:
             tasks = []
-            for idx, params in enumerate(all_param_grids, start=1):
-                if verbose:
-                    self.logger.debug(f"[{idx}/{total_passages}] Scheduling bot…")
-                task = loop.run_in_executor(
-                    executor,
-                    self._sync_run_single_bot,
-                    idx,
-                    params
-                )
-                tasks.append(task)
+            if mode == "process":
+                units = list(enumerate(all_param_grids, start=1))
+                chunksize = chunksize or max(1, math.ceil(total_passages / (max_workers * 4)))
+                for start in range(0, total_passages, chunksize):
+                    chunk = units[start:start + chunksize]
+                    if verbose:
+                        self.logger.debug(f"[{chunk[0][0]}-{chunk[-1][0]}/{total_passages}] Scheduling lot…")
+                    tasks.append(loop.run_in_executor(executor, _run_backtest_chunk, self._bot_type, chunk, vectorized))
+            else:
+                for idx, params in enumerate(all_param_grids, start=1):
+                    if verbose:
+                        self.logger.debug(f"[{idx}/{total_passages}] Scheduling bot…")
+                    task = loop.run_in_executor(
+                        executor,
+                        self._sync_run_single_bot,
+                        idx,
+                        params,
+                        vectorized
+                    )
+                    tasks.append(task)
 
             done_count = 0
             for coro in asyncio.as_completed(tasks):
                 result = await coro
-                done_count += 1
+                chunk_results = result if mode == "process" else [result]
+                done_count += len(chunk_results)
                 if verbose:
                     self.logger.info(f"✔ Progression : {done_count}/{total_passages} terminés")
-                results.append(result)
+                results.extend(chunk_results)
 
         all_stats = pd.DataFrame(results)
 
@@ -119,6 +183,15 @@ class BotTrainer:
         return all_stats, results
 
 
+    def _preload_params(self) -> list:
+        """
+        Paramètres de source utilisés par les backtests de la grille
+        (_all_param_grids ne surcharge que trading_system : path / symbol / interval
+        sont ceux par défaut du bot).
+        """
+        params = copy.deepcopy(BOTS_CONFIG[self._bot_type]["default_parameters"])
+        return [{k: params[k] for k in ("path", "symbol", "interval")}]
+
     def log_summary_df_one_line(self, df, col_width=11, float_precision=2):
         """
         Log toutes les statistiques et paramètres d'un DataFrame en forme de tableau.
@@ -237,7 +310,7 @@ if __name__ == "__main__":
     }
 
     trainer = BotTrainer("rsi_cross_bot")
-    summary_df, results = asyncio.run(trainer.run(param_grid))
+    summary_df, results = asyncio.run(trainer.run(param_grid, mode="process", max_workers=os.cpu_count()))
     pd.set_option('display.max_rows', None)
     # pd.set_option("display.max_columns", None)
     # print(summary_df[["name", "total_profit", "win_rate", "num_trades", "total_score", "swing_window", "tp_pct", "sl_pct"]])